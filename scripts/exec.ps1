@@ -18,4 +18,16 @@ function Invoke-Batch {
 Set-Location -Path (Join-Path $PSScriptRoot "..")
 
 # # x0000プロジェクトの実行
-# Invoke-Batch -project "x0000_develop" -prefix "x0000"
\ No newline at end of file
+# Invoke-Batch -project "x0000_develop" -prefix "x0000"
+
+# # settings.yaml の batch_settings に記載した全プロジェクトを1コンテナ内で並列実行する場合
+# docker run -it --rm `
+#     -v "$((Get-Location)):/data" `
+#     -v "$(Join-Path (Get-Location) "customizes"):/app/src/bts2its/customizes" `
+#     ghcr.io/bteam-toku/bts2its:latest --batch --skip_its_entry
+
+# # x0000プロジェクトの入力ファイル（bts.csv / its.csv）を監視し、更新される毎に変換・起票する場合（Ctrl+Cで終了）
+# docker run -it --rm `
+#     -v "$((Get-Location)):/data" `
+#     -v "$(Join-Path (Get-Location) "customizes"):/app/src/bts2its/customizes" `
+#     ghcr.io/bteam-toku/bts2its:latest x0000_develop --prefix=x0000 --watch
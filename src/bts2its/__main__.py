@@ -1,7 +1,15 @@
 from bts2its.factories import Factory
 from bts2its import Config
+from bts2its.interfaces import AbstractConverter
+from bts2its.watchers import ExportWatcher
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
 import sys
+import time
+import traceback
 import argparse
 
 def main():
@@ -9,40 +17,78 @@ def main():
     """
     # argument取得
     parser = argparse.ArgumentParser()
-    parser.add_argument('project', type=str, default='', help='redmineのプロジェクト名')
+    parser.add_argument('project', type=str, nargs='?', default='', help='redmineのプロジェクト名（--batch指定時は不要）')
     parser.add_argument('--input_path', type=str, default='', help='入力元のフォルダパス。(デフォルトは設定ファイルのあるフォルダ内のinputフォルダ)')
     parser.add_argument('--output_path', type=str, default='', help='出力先のフォルダパス。(デフォルトは設定ファイルのあるフォルダ内のoutputフォルダ)')
     parser.add_argument('--prefix', type=str, default='', help='BTSをバージョンでフィルタするための文字列。（デフォルト:フィルタなし）')
     parser.add_argument('--skip_its_entry', action='store_true', help='ITSに起票するかどうかのフラグ。（デフォルト:起票する）')
+    parser.add_argument('--full', action='store_true', help='差分同期の状態を使用せず全件を変換するフラグ。（デフォルト:設定に従う）')
+    parser.add_argument('--plan', action='store_true', help='ITSに起票せず、起票計画ファイルを出力するフラグ。（デフォルト:起票する）')
+    parser.add_argument('--apply', type=str, default='', help='変換せず、指定した起票計画ファイルをITSに登録する。（デフォルト:変換して起票する）')
+    parser.add_argument('--batch', action='store_true', help='設定ファイルのbatch_settingsのプロジェクトを並列プロセスで変換するフラグ。（デフォルト:projectのみ変換）')
+    parser.add_argument('--watch', action='store_true', help='入力ファイルを監視し、変更される毎に変換・起票するフラグ。（デフォルト:1回のみ変換）')
     args = parser.parse_args()
     # config取得
     config = Config()
+
+    # 複数プロジェクトのバッチ実行
+    if args.batch:
+        if args.watch:
+            print('watch mode is not supported with --batch.')
+            sys.exit()
+        run_batch(args=args, config=config)
+        return
+
     # プロジェクト名チェック
     if args.project == '':
         print('project name missing error.')
         sys.exit()
 
+    # 起票計画ファイルの登録
+    if args.apply != '':
+        apply_plan(project=args.project, plan_file_path=Path(args.apply), config=config)
+        return
+
+    # 入力ファイルの監視による常駐実行
+    if args.watch:
+        run_watch(project=args.project, prefix=args.prefix, options=vars(args), config=config)
+        return
+
+    # BTSからITSへの変換処理実行
+    if run_project(project=args.project, prefix=args.prefix, options=vars(args), config=config) is False:
+        sys.exit()
+
+def run_project(project: str, prefix: str, options: Dict[str, Any], config: Config) -> bool:
+    """1プロジェクトの変換処理
+
+    Args:
+        project (str): redmineのプロジェクト名
+        prefix (str): BTSをバージョンでフィルタするための文字列
+        options (Dict[str, Any]): コマンドライン引数の辞書（input_path, output_path, skip_its_entry, full, plan）と
+            監視モードで変更された入力データの種別の集合（changed_inputs、指定された場合は変更された入力データのみ読み込み直す）
+        config (Config): 設定オブジェクト
+
+    Returns:
+        bool: 変換処理を実行した場合True、入力チェックエラーの場合False
+    """
     # 入力パス情報取得
-    input_path = Path(args.input_path if args.input_path != '' else config.input_path())
-    input_path = input_path.resolve()
-    bts_file_path = input_path / args.project / config.bts_input_file()
-    its_file_path = input_path / args.project / config.its_input_file()
+    bts_file_path, its_file_path = get_input_file_paths(project=project, options=options, config=config)
     # 入力ファイルが存在しなければ終了
-    if bts_file_path.is_file() is False or its_file_path.is_file() is False:
+    if bts_file_path.is_file() is False or (its_file_path is not None and its_file_path.is_file() is False):
         print(f'input file missing error. {bts_file_path} or {its_file_path}')
-        sys.exit()
+        return False
 
     # BTSのパラメータチェック
     if config.bts_url() == '':
         print('BTS URL missing error.')
-        sys.exit()
+        return False
     # ITSのパラメータチェック
     if config.its_url() == '' or config.its_api_key() == '':
         print('ITS URL or API-KEY missing error.')
-        sys.exit()
+        return False
 
     # 出力パス情報取得
-    output_path = Path(args.output_path if args.output_path != '' else config.output_path())
+    output_path = Path(options.get('output_path') or config.output_path())
     output_path = output_path.resolve()
     # 出力パスが存在しなければ作成
     if not output_path.exists():
@@ -50,20 +96,209 @@ def main():
     
     # Factory経由でBTS->ITSアダプター生成
     factory = Factory()
-    converter = factory.create(project_name=args.project, bts_prefix=args.prefix, adaptor_type_name=config.adaptor_type_name())
+    converter = factory.create(project_name=project, bts_prefix=prefix, adaptor_type_name=config.adaptor_type_name())
+    # ITSデータの取得元チェック（変換の途中で取得できないことが判明しないよう、開始前に判定する）
+    if converter.supports_its_source(config.its_source()) is False:
+        print(f"ITS source config error. '{config.its_source()}' is not supported by {converter.__class__.__name__}. set its_settings.source to csv.")
+        return False
 
-    # BTSからITSへの変換処理実行
-    converter.convert(bts_data_path=bts_file_path, its_data_path=its_file_path)
+    # 全件同期の指定（アダプターを再利用する監視モードでも毎回設定する）
+    converter.set_full_sync(bool(options.get('full')))
+
+    # 出力CSVファイル名取得
+    output_file_path = output_path / project / config.conversion_output_file()
+
+    # 分割読み込みの場合は変換・CSV保存・ITS起票を分割毎に実行
+    if config.load_chunk_rows() > 0 and not options.get('plan'):
+        converter.convert_stream(bts_data_path=bts_file_path, its_data_path=its_file_path, output_file_path=output_file_path, entry=not options.get('skip_its_entry'))
+        if options.get('skip_its_entry'):
+            print('ITS entry process is skipped.')
+        save_metrics(converter=converter, project=project, output_path=output_path, config=config)
+        return True
+
+    # BTSからITSへの変換処理実行（監視モードの場合は変更された入力データのみ読み込み直す）
+    if options.get('changed_inputs') is not None:
+        converter.convert_changed(bts_data_path=bts_file_path, its_data_path=its_file_path, changed_inputs=options['changed_inputs'])
+    else:
+        converter.convert(bts_data_path=bts_file_path, its_data_path=its_file_path)
 
     # ITSに起票データ登録
-    if not args.skip_its_entry:
+    if options.get('plan'):
+        # 起票計画ファイル保存（ITSには起票しない）
+        converter.save_plan(file_path=output_path / project / config.conversion_plan_file())
+    elif not options.get('skip_its_entry'):
         converter.entry_its()
     else:
         print('ITS entry process is skipped.')
 
-    # 出力CSVファイル名取得
-    output_file_path = output_path / args.project / config.conversion_output_file()
+    # 起票データのCSVファイル保存
     converter.save_csv(file_path=output_file_path)
+    # 処理段階毎の計測結果保存
+    save_metrics(converter=converter, project=project, output_path=output_path, config=config)
+    return True
+
+def get_input_file_paths(project: str, options: Dict[str, Any], config: Config) -> Tuple[Path, Optional[Path]]:
+    """入力ファイルパスの取得
+
+    Args:
+        project (str): redmineのプロジェクト名
+        options (Dict[str, Any]): コマンドライン引数の辞書（input_path）
+        config (Config): 設定オブジェクト
+
+    Returns:
+        Tuple[Path, Optional[Path]]: BTSデータファイルパスとITSデータファイルパス（ITSから直接取得する場合はNone）
+    """
+    input_path = Path(options.get('input_path') or config.input_path())
+    input_path = input_path.resolve()
+    bts_file_path = input_path / project / config.bts_input_file()
+    # ITSデータをREST APIで直接取得する場合は入力ファイルを使用しない
+    its_file_path = input_path / project / config.its_input_file() if config.its_source() != 'rest' else None
+    return bts_file_path, its_file_path
+
+def run_watch(project: str, prefix: str, options: Dict[str, Any], config: Config) -> None:
+    """入力ファイルの監視による常駐実行処理
+
+    初回に全ての入力ファイルを変換した後、入力ファイルが変更される毎に変換・起票する。
+    変換オブジェクトは読み込み済みのデータとインデックスを保持し、変更された入力ファイルのみ読み込み直す。
+    変換中のエラーは出力して監視を継続する（Ctrl+Cで終了）。
+
+    Args:
+        project (str): redmineのプロジェクト名
+        prefix (str): BTSをバージョンでフィルタするための文字列
+        options (Dict[str, Any]): コマンドライン引数の辞書
+        config (Config): 設定オブジェクト
+    """
+    bts_file_path, its_file_path = get_input_file_paths(project=project, options=options, config=config)
+    file_paths = {'bts': bts_file_path, 'its': its_file_path} if its_file_path is not None else {'bts': bts_file_path}
+    watcher = ExportWatcher(file_paths, poll_interval=config.watch_poll_interval_seconds(), debounce_seconds=config.watch_debounce_seconds())
+    print(f"watching {', '.join(str(file_path) for file_path in file_paths.values())} "
+          f"(poll={config.watch_poll_interval_seconds():g}s, debounce={config.watch_debounce_seconds():g}s). Press Ctrl+C to stop.")
+
+    watch_options = dict(options)
+    changed_inputs = set(file_paths.keys())
+    try:
+        while True:
+            start_time = time.perf_counter()
+            try:
+                if run_project(project=project, prefix=prefix, options={**watch_options, 'changed_inputs': changed_inputs}, config=config):
+                    print(f"watch: {project} converted in {time.perf_counter() - start_time:.2f}s (changed: {', '.join(sorted(changed_inputs))})")
+            except Exception:
+                # 変換中のエラーは次の変更まで監視を継続する
+                traceback.print_exc()
+            # 全件同期の指定は初回のみ
+            watch_options['full'] = False
+            changed_inputs = watcher.wait_for_change()
+            print(f"watch: detected changes in {', '.join(sorted(changed_inputs))}.")
+    except KeyboardInterrupt:
+        print('watch stopped.')
+
+def save_metrics(converter: AbstractConverter, project: str, output_path: Path, config: Config) -> None:
+    """処理段階毎の計測結果の保存処理
+
+    Args:
+        converter (AbstractConverter): BTS->ITSアダプター
+        project (str): redmineのプロジェクト名
+        output_path (Path): 出力先のフォルダパス
+        config (Config): 設定オブジェクト
+    """
+    if config.metrics_enabled() is False:
+        return
+    prometheus_path = config.metrics_prometheus_path()
+    converter.save_metrics(
+        file_path=output_path / project / config.metrics_output_file(),
+        prometheus_file_path=Path(prometheus_path) / f'bts2its_{project}.prom' if prometheus_path != '' else None,
+    )
+
+def run_batch(args: argparse.Namespace, config: Config) -> None:
+    """複数プロジェクトのバッチ実行処理
+
+    設定ファイルのプロジェクトリストをプロセスプールで並列に変換し、プロジェクト毎と全体の処理時間を出力する。
+    各プロセスは親プロセスで読み込んだ設定データを共有する。
+
+    Args:
+        args (argparse.Namespace): コマンドライン引数
+        config (Config): 設定オブジェクト
+    """
+    projects = config.batch_projects()
+    if len(projects) == 0:
+        print('batch project list missing error.')
+        sys.exit()
+    workers = config.batch_workers() if config.batch_workers() > 0 else (os.cpu_count() or 1)
+    workers = min(workers, len(projects))
+    options = {key: getattr(args, key) for key in ('input_path', 'output_path', 'skip_its_entry', 'full', 'plan')}
+
+    # 対応している場合はfork方式で起動し、読み込み済みのモジュールを子プロセスに引き継ぐ
+    mp_context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    start_time = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=Config.share, initargs=(config.to_dict(),)) as executor:
+        futures = {
+            executor.submit(_run_batch_project, project['project'], project['prefix'], options): project['project']
+            for project in projects
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # プロセス異常終了等で結果を受け取れない場合
+                results.append({'project': futures[future], 'success': False, 'seconds': 0.0, 'error': str(e)})
+    elapsed = time.perf_counter() - start_time
+
+    # 集計結果出力
+    total_seconds = sum(result['seconds'] for result in results)
+    failed = [result for result in results if result['success'] is False]
+    print(f'Batch finished: {len(results)} projects ({len(results) - len(failed)} succeeded, {len(failed)} failed) in {elapsed:.2f}s (workers={workers})')
+    name_width = max(len(result['project']) for result in results)
+    for result in sorted(results, key=lambda result: result['seconds'], reverse=True):
+        status = 'ok' if result['success'] else f"error: {result['error']}"
+        print(f"  {result['project']:<{name_width}}  {result['seconds']:8.2f}s  {status}")
+    print(f'  total project time {total_seconds:.2f}s, speedup {total_seconds / elapsed if elapsed > 0 else 0.0:.1f}x')
+
+def _run_batch_project(project: str, prefix: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """バッチ実行の1プロジェクト分の処理（子プロセスで実行）
+
+    Args:
+        project (str): redmineのプロジェクト名
+        prefix (str): BTSをバージョンでフィルタするための文字列
+        options (Dict[str, Any]): コマンドライン引数の辞書
+
+    Returns:
+        Dict[str, Any]: プロジェクト名（project）、成否（success）、処理時間（seconds）、エラー内容（error）の辞書
+    """
+    start_time = time.perf_counter()
+    try:
+        success = run_project(project=project, prefix=prefix, options=options, config=Config())
+        error = '' if success else 'input check error'
+    except Exception as e:
+        traceback.print_exc()
+        success = False
+        error = str(e)
+    return {'project': project, 'success': success, 'seconds': time.perf_counter() - start_time, 'error': error}
+
+def apply_plan(project: str, plan_file_path: Path, config: Config) -> None:
+    """起票計画ファイルの登録処理
+
+    Args:
+        project (str): redmineのプロジェクト名
+        plan_file_path (Path): 起票計画ファイルパス
+        config (Config): 設定オブジェクト
+    """
+    # 計画ファイルが存在しなければ終了
+    if plan_file_path.is_file() is False:
+        print(f'plan file missing error. {plan_file_path}')
+        sys.exit()
+    # ITSのパラメータチェック
+    if config.its_url() == '' or config.its_api_key() == '':
+        print('ITS URL or API-KEY missing error.')
+        sys.exit()
+
+    # Factory経由でBTS->ITSアダプター生成
+    factory = Factory()
+    converter = factory.create(project_name=project, bts_prefix='', adaptor_type_name=config.adaptor_type_name())
+    # 計画ファイルの起票データをITSに登録
+    converter.apply_plan(file_path=plan_file_path.resolve())
+    # 処理段階毎の計測結果保存
+    save_metrics(converter=converter, project=project, output_path=Path(config.output_path()).resolve(), config=config)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,17 +1,39 @@
-from bts2its.interfaces import AbstractConverter
+from bts2its.interfaces import AbstractBts2Its, AbstractConverter
 from bts2its.common import *
 from bts2its.config import Config
+from bts2its.entries import ChangePlan, EntryJournal, EntryWriter
+from bts2its.redmine_accessor import RedmineTransport
+from bts2its.states import ItsSnapshot
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set
+import time
+import pandas as pd
 
 class BaseConverterAdaptor(AbstractConverter):
     """BTSからITSへの変換アダプター
     デフォルトの具象化クラス
     """
     #
+    # protected定数
+    #
+    _JOURNAL_KEY = '__journal_key__'                # 行データ辞書に設定するジャーナルの操作キー
+    #
     # protected変数
     #
     _project_name: str = ""                         # プロジェクト名
     _config: Config = None                          # 設定オブジェクト
+    _prefetched_issues: Dict[str, Any] = {}         # 更新対象の一括取得済みチケット（チケットID→チケットオブジェクト）
+    _input_paths: Dict[str, Path] = {}              # 変換した入力ファイルパス（bts, its）
+    _journal: Optional[EntryJournal] = None         # ITS起票ジャーナル（Noneの場合は記録しない）
+    _entry_interrupted: bool = False                # 起票データの登録を中断した場合True（ジャーナルの完了済みの記録を残す）
+    _stage_recorder: StageRecorder = None           # 処理段階毎の計測オブジェクト
+    _transport: RedmineTransport = None             # ITSアクセスの転送制御オブジェクト（初回の起票時に生成）
+    _update_stats: Dict[str, int] = None            # 更新の差分判定の集計（updates:更新対象, skipped:変更なし, omitted:省略した項目）
+    _update_lock: Lock = None                       # 更新の差分判定の集計の排他制御オブジェクト
+    _full_sync: bool = False                        # 全件同期フラグ（差分同期の状態とスナップショットを使用しない場合True）
 
     #
     # コンストラクタ/デストラクタ
@@ -28,6 +50,10 @@ class BaseConverterAdaptor(AbstractConverter):
         self._project_name = project_name
         # configオブジェクト取得
         self._config = Config()        
+        # 処理段階毎の計測オブジェクト生成
+        self._stage_recorder = StageRecorder(memory_mode=self._config.metrics_memory_mode())
+        self._update_stats = {'updates': 0, 'skipped': 0, 'omitted': 0}
+        self._update_lock = Lock()
 
     def __del__(self) -> None:
         """デストラクタ
@@ -37,68 +63,579 @@ class BaseConverterAdaptor(AbstractConverter):
     #
     # publicメソッド
     #
-    def convert(self, bts_data_path: Path, its_data_path: Path) -> None:
+    def convert(self, bts_data_path: Path, its_data_path: Optional[Path]) -> None:
         """BTSからITSへの変換
 
         Args:
             bts_data_path (Path): BTSデータファイルパス
-            its_data_path (Path): ITSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
         """
         # ファイル存在チェック
-        if not bts_data_path.is_file() or not its_data_path.is_file():
+        if not bts_data_path.is_file() or (its_data_path is not None and not its_data_path.is_file()):
             raise FileNotFoundError(f'BTS data file not found: {bts_data_path} or ITS data file not found: {its_data_path}')
         
         # BTSデータとITSデータの読み込み
-        self._bts2its.load_bts(str(bts_data_path))
-        self._bts2its.load_its(str(its_data_path))
+        self._input_paths = {'bts': bts_data_path, 'its': its_data_path} if its_data_path is not None else {'bts': bts_data_path}
+        self._bts2its.set_full_sync(self._full_sync)
+        with self._stage_recorder.measure('load_bts') as stage:
+            self._bts2its.load_bts(str(bts_data_path))
+            stage['rows'] = self._bts2its.get_row_counts()['bts']
+        with self._stage_recorder.measure('load_its') as stage:
+            self._load_its(its_data_path, self._full_sync)
+            stage['rows'] = self._bts2its.get_row_counts()['its']
 
         # BTSからITSへの変換
-        self._bts2its.bts_to_its()
+        with self._stage_recorder.measure('bts_to_its') as stage:
+            self._bts2its.bts_to_its()
+            stage['rows'] = self._bts2its.get_row_counts()['bts']
+
+    def convert_changed(self, bts_data_path: Path, its_data_path: Optional[Path], changed_inputs: Set[str]) -> None:
+        """変更された入力データのみ読み込み直したBTSからITSへの変換
+
+        変更されていない入力データは前回読み込んだデータとインデックスを再利用する（監視モードで使用）。
+        入力ファイルパスが前回と異なる場合は全ての入力データを読み込む。ITSから直接取得する場合は毎回取得する。
+
+        Args:
+            bts_data_path (Path): BTSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
+            changed_inputs (Set[str]): 変更された入力データの種別（bts, its）の集合
+        """
+        # ファイル存在チェック
+        if not bts_data_path.is_file() or (its_data_path is not None and not its_data_path.is_file()):
+            raise FileNotFoundError(f'BTS data file not found: {bts_data_path} or ITS data file not found: {its_data_path}')
+
+        # 前回と同じ入力ファイルの場合は変更された入力データのみ読み込み
+        input_paths = {'bts': bts_data_path, 'its': its_data_path} if its_data_path is not None else {'bts': bts_data_path}
+        reload_inputs = set(changed_inputs) if input_paths == self._input_paths else {'bts', 'its'}
+        if its_data_path is None:
+            reload_inputs.add('its')
+        self._input_paths = input_paths
+        self._stage_recorder.reset()
+        self._bts2its.set_full_sync(self._full_sync)
+        if 'bts' in reload_inputs:
+            with self._stage_recorder.measure('load_bts') as stage:
+                self._bts2its.load_bts(str(bts_data_path))
+                stage['rows'] = self._bts2its.get_row_counts()['bts']
+        if 'its' in reload_inputs:
+            with self._stage_recorder.measure('load_its') as stage:
+                self._load_its(its_data_path, self._full_sync)
+                stage['rows'] = self._bts2its.get_row_counts()['its']
+        print(f"Reloaded inputs: {', '.join(sorted(reload_inputs))} (reused: {', '.join(sorted({'bts', 'its'} - reload_inputs)) or 'none'})")
+
+        # BTSからITSへの変換
+        with self._stage_recorder.measure('bts_to_its') as stage:
+            self._bts2its.bts_to_its()
+            stage['rows'] = self._bts2its.get_row_counts()['bts']
+
+    def convert_stream(self, bts_data_path: Path, its_data_path: Optional[Path], output_file_path: Path, entry: bool = True) -> None:
+        """BTSからITSへの分割変換
+
+        ITSデータを読み込んだ後、BTSデータを分割して変換し、分割毎の起票データを
+        CSVファイルに追記してITSに登録する。全行の起票データはメモリに保持しない。
+
+        Args:
+            bts_data_path (Path): BTSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
+            output_file_path (Path): 起票データのCSVファイルパス
+            entry (bool, optional): ITSに起票する場合True. デフォルトはTrue.
+        """
+        # ファイル存在チェック
+        if not bts_data_path.is_file() or (its_data_path is not None and not its_data_path.is_file()):
+            raise FileNotFoundError(f'BTS data file not found: {bts_data_path} or ITS data file not found: {its_data_path}')
+
+        # ITSデータの読み込み
+        self._input_paths = {'bts': bts_data_path, 'its': its_data_path} if its_data_path is not None else {'bts': bts_data_path}
+        self._bts2its.set_full_sync(self._full_sync)
+        with self._stage_recorder.measure('load_its') as stage:
+            self._load_its(its_data_path, self._full_sync)
+            stage['rows'] = self._bts2its.get_row_counts()['its']
+
+        # BTSデータを分割して変換し、起票データをファイル追記・ITS登録
+        entry_count = 0
+        self._entry_interrupted = False
+        with self._stage_recorder.measure('stream') as stage:
+            with self._open_entry_writer(output_file_path) as writer:
+                for pd_its_entry in self._bts2its.iter_bts_to_its(str(bts_data_path)):
+                    writer.write(pd_its_entry)
+                    stage['rows'] += len(pd_its_entry)
+                    if entry:
+                        entry_count += self._entry_rows(pd_its_entry.to_dict(orient='records'))
+        print(f"ITS entry data streamed: {', '.join(str(path) for path in writer.get_file_paths())} ({stage['rows']} rows, {entry_count} entered)")
+        if entry:
+            self._complete_entry()
+
+    def set_full_sync(self, full_sync: bool) -> None:
+        """全件同期フラグ設定
+
+        以降の変換で差分同期の状態を使用せず全件を変換し、ITSから直接取得する場合はスナップショットを使用せず全チケットを取得する。
+
+        Args:
+            full_sync (bool): 差分同期の状態を使用せず全件を変換する場合True
+        """
+        self._full_sync = full_sync
 
     def entry_its(self) -> None:
         """ITSへの起票データ登録
         """
+        # ITS起票データ取得
+        pd_its_entry = self._bts2its.get_its_entry_data()
+        self._entry_interrupted = False
+        with self._stage_recorder.measure('entry_its') as stage:
+            stage['rows'] = self._entry_rows(pd_its_entry.to_dict(orient='records'))
+        self._complete_entry()
+
+    def save_plan(self, file_path: Path) -> None:
+        """ITS起票計画ファイル保存
+
+        Args:
+            file_path (Path): 保存ファイルパス
+        """
+        pd_its_entry = self._bts2its.get_its_entry_data()
+        ChangePlan(file_path).write(project_name=self._project_name, pd_its_entry=pd_its_entry, input_paths=self._input_paths)
+        print(f'ITS entry plan saved: {file_path} ({len(pd_its_entry)} rows)')
+
+    def apply_plan(self, file_path: Path) -> None:
+        """ITS起票計画ファイルの登録
+
+        BTS・ITSデータの読み込みと変換を行わず、計画ファイルの起票データをITSに登録する。
+
+        Args:
+            file_path (Path): 計画ファイルパス
+        """
+        plan = ChangePlan(file_path)
+        try:
+            rows = plan.read()
+        except (OSError, ValueError) as e:
+            print(f'ITS entry plan load error. {e}')
+            return
+        # 別プロジェクトの計画ファイルは登録しない
+        if plan.get_header().get('project') != self._project_name:
+            print(f"ITS entry plan project mismatch error. {plan.get_header().get('project')} != {self._project_name}")
+            return
+        self._entry_interrupted = False
+        with self._stage_recorder.measure('apply_plan') as stage:
+            stage['rows'] = self._entry_rows(rows)
+        self._clear_journal()
+
+    def save_csv(self, file_path: Path) -> None:
+        """CSVファイル保存
+
+        Args:
+            file_path (Path): 保存ファイルパス
+        """
+        with self._stage_recorder.measure('save_csv') as stage:
+            # ITS起票データの取得
+            pd_its_entry = self._bts2its.get_its_entry_data()
+            # CSVファイル保存（追加形式が指定された場合は同時に出力）
+            with self._open_entry_writer(file_path) as writer:
+                writer.write(pd_its_entry)
+            stage['rows'] = len(pd_its_entry)
+        if len(self._config.conversion_output_formats()) > 0:
+            print(f"ITS entry data saved: {', '.join(str(path) for path in writer.get_file_paths())}")
+
+    def save_metrics(self, file_path: Path, prometheus_file_path: Optional[Path] = None) -> None:
+        """処理段階毎の計測結果保存
+
+        Args:
+            file_path (Path): JSONファイルパス
+            prometheus_file_path (Optional[Path], optional): Prometheus textfile形式のファイルパス. デフォルトはNone（出力しない）.
+        """
+        print(f'Stage metrics ({self._project_name}):')
+        print(self._stage_recorder.format_metrics())
+        histogram = self._transport.get_histogram() if self._transport is not None else None
+        self._stage_recorder.save_json(file_path, project_name=self._project_name, histogram=histogram)
+        if prometheus_file_path is not None:
+            self._stage_recorder.save_prometheus(prometheus_file_path, project_name=self._project_name, histogram=histogram)
+
+    def supports_its_source(self, its_source: str) -> bool:
+        """ITSデータの取得元の対応判定
+
+        ITSから直接取得（rest）する場合は、ITSアクセスオブジェクトのプロジェクトのチケット一括取得（load_project_issues）と
+        変換オブジェクトのREST APIの取得結果の読み取り（load_its_issues）の両方に対応している必要がある。
+
+        Args:
+            its_source (str): ITSデータの取得元（csv, rest）
+
+        Returns:
+            bool: 取得元に対応している場合True
+        """
+        if its_source != 'rest':
+            return True
+        return getattr(self._its_accessor, 'load_project_issues', None) is not None and type(self._bts2its).load_its_issues is not AbstractBts2Its.load_its_issues
+
+    def get_metrics(self) -> List[StageMetrics]:
+        """処理段階毎の計測結果取得
+
+        Returns:
+            List[StageMetrics]: 計測順の計測結果リスト
+        """
+        return self._stage_recorder.get_metrics()
+
+    #
+    # protectedメソッド
+    #
+    def _load_its(self, its_data_path: Optional[Path], full_sync: bool) -> None:
+        """ITSデータの読み込み
+
+        Args:
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
+            full_sync (bool): 全件同期の場合True（スナップショットを使用せず全チケットを取得する）
+        """
+        if its_data_path is not None:
+            self._bts2its.load_its(str(its_data_path))
+        else:
+            self._bts2its.load_its_issues(self._pull_its_issues(full_pull=full_sync))
+
+    def _pull_its_issues(self, full_pull: bool) -> List[Dict[str, Any]]:
+        """ITSからのチケットの直接取得
+
+        スナップショットが有効な場合は、前回取得以降に更新されたチケットのみ取得してスナップショットに反映する。
+
+        Args:
+            full_pull (bool): スナップショットを使用せず全チケットを取得する場合True
+
+        Returns:
+            List[Dict[str, Any]]: REST APIのチケットデータ（JSON）のリスト
+        """
+        load_project_issues = getattr(self._its_accessor, 'load_project_issues', None)
+        if load_project_issues is None:
+            raise NotImplementedError(f'{self._its_accessor.__class__.__name__} does not support loading project issues.')
+        snapshot = ItsSnapshot(Path(self._config.output_path()) / self._project_name / 'its_snapshot.json') if self._config.its_snapshot() else None
+        updated_since = ''
+        if snapshot is not None and not full_pull and snapshot.is_consistent(self._project_name, self._config.sync_full_interval_days()):
+            updated_since = snapshot.get_updated_since()
+
+        # 取得中に更新されたチケットを次回の差分取得に含めるため、取得開始日時を記録
+        pulled_at = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
+        issues = load_project_issues(updated_since=updated_since, page_size=self._config.its_page_size(), workers=self._config.its_fetch_workers())
+        since = f', updated since {updated_since}' if updated_since != '' else ''
+        print(f'ITS issues pulled: {len(issues)} issues in {time.perf_counter() - start_time:.2f}s (workers={self._config.its_fetch_workers()}{since})')
+        if snapshot is not None:
+            issues = snapshot.save(self._project_name, issues, pulled_at=pulled_at, full_pull=updated_since == '')
+        return issues
+
+    def _entry_rows(self, rows: List[dict]) -> int:
+        """起票データの登録
+
+        起票データをBTS行（説明のURL）単位にまとめ、設定された並列数で起票・更新する。
+        同一BTS行の更新は子チケットから処理するため、まとめた単位の中では起票データの順に処理する。
+
+        Args:
+            rows (List[dict]): 起票データの行データ辞書リスト
+
+        Returns:
+            int: 起票・更新した行数
+        """
         # プロジェクト情報読み込み
         if self._its_accessor.load_project() is False:
             print('ITS project load error.')
-            return
+            self._entry_interrupted = True
+            return 0
 
-        # ITS起票データ取得        
-        pd_its_entry = self._bts2its.get_its_entry_data()
-        issue_data = self._its_accessor.its_payload_template.copy()
+        # ジャーナルが有効な場合は完了済みの操作を除外
+        self._journal = self._open_journal()
+        if self._journal is not None:
+            rows = self._journal_rows(rows)
+        entry_groups = self._group_entry_rows(rows)
+        # 更新対象のチケットを一括取得
+        self._prefetched_issues = self._prefetch_issues(entry_groups)
 
         # BTS->ITSに起票・更新
-        for _, row in pd_its_entry.iterrows():
-            # 行データ辞書化
-            row_data = row.to_dict()
-            # 行の操作種別とITS ID取得
-            operation = row_data.get(self._bts2its.FIXED_KEYWORDS['its_operation'], '')
-            issue_id = row_data.get(self._bts2its.FIXED_KEYWORDS['its_id'], '')
-            # 操作種別が空の場合はスキップ
-            if operation is None or operation == '':
+        recorder = LatencyRecorder()
+        self._update_stats = {'updates': 0, 'skipped': 0, 'omitted': 0}
+        workers = self._config.entry_workers()
+        try:
+            if workers <= 1:
+                for entry_group in entry_groups:
+                    self._entry_group(entry_group, recorder)
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+                try:
+                    futures = [executor.submit(self._entry_group, entry_group, recorder) for entry_group in entry_groups]
+                    for future in as_completed(futures):
+                        future.result()
+                finally:
+                    # エラー発生時は未着手の登録を取り消す
+                    executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+        print(recorder.format_summary(f'ITS entry (workers={max(workers, 1)})'))
+        print(self._get_transport().format_summary())
+        if self._update_stats['updates'] > 0:
+            print(f"ITS update diff: {self._update_stats['skipped']}/{self._update_stats['updates']} updates skipped as unchanged, "
+                  f"{self._update_stats['omitted']} unchanged fields omitted ({self._update_stats['skipped']} writes saved)")
+        return recorder.summary()['count']
+
+    def _open_entry_writer(self, file_path: Path) -> EntryWriter:
+        """起票データの出力オブジェクトの作成
+
+        Args:
+            file_path (Path): CSVファイルパス
+
+        Returns:
+            EntryWriter: 出力オブジェクト（withブロックでオープンする）
+        """
+        return EntryWriter(file_path, formats=self._config.conversion_output_formats())
+
+    def _get_transport(self) -> RedmineTransport:
+        """ITSアクセスの転送制御オブジェクトの取得
+
+        Returns:
+            RedmineTransport: 転送制御オブジェクト（接続プール数の指定がない場合は起票の並列数）
+        """
+        if self._transport is None:
+            self._transport = RedmineTransport(
+                self._its_accessor,
+                rate_limit=self._config.entry_rate_limit(),
+                burst=self._config.entry_rate_burst(),
+                max_retries=self._config.entry_max_retries(),
+                backoff_seconds=self._config.entry_retry_backoff_seconds(),
+                backoff_max_seconds=self._config.entry_retry_backoff_max_seconds(),
+                pool_size=self._config.entry_pool_size() or max(self._config.entry_workers(), 1),
+            )
+        return self._transport
+
+    def _open_journal(self) -> Optional[EntryJournal]:
+        """ITS起票ジャーナルのオープン
+
+        Returns:
+            Optional[EntryJournal]: ジャーナルオブジェクト（ジャーナルを使用しない場合はNone）
+        """
+        if self._config.entry_journal() is False:
+            return None
+        journal_path = Path(self._config.output_path()) / self._project_name / 'entry_journal.sqlite3'
+        return EntryJournal(journal_path, retention_days=self._config.entry_journal_retention_days())
+
+    def _complete_entry(self) -> None:
+        """変換した起票データの登録完了処理
+
+        全ての起票データの登録が完了した場合のみ、ジャーナルの完了済みの記録を削除して差分同期の状態を保存する。
+        登録が完了していない場合は、次回も同じBTS行を変換対象とするため状態を保存しない。
+        """
+        if self._entry_interrupted:
+            return
+        self._clear_journal()
+        self._bts2its.save_sync_state()
+
+    def _clear_journal(self) -> None:
+        """ITS起票ジャーナルの完了済みの記録削除
+
+        全ての起票データの登録が完了した場合のみ削除する。途中で中断した場合は再開のために記録を残す。
+        """
+        if self._entry_interrupted:
+            return
+        journal = self._open_journal()
+        if journal is None:
+            return
+        try:
+            cleared_count = journal.clear_done()
+        finally:
+            journal.close()
+        print(f'ITS entry journal: {cleared_count} completed operations cleared.')
+
+    def _journal_rows(self, rows: List[dict]) -> List[dict]:
+        """ジャーナルによる完了済み操作の除外
+
+        完了していない操作は実行予定として記録し、操作キーを設定した行データ辞書を返す。
+        前回実行時に結果を確認できなかった操作（実行開始のみ記録）のうち、更新は再実行する。
+        新規起票は題名でチケットを検索し、起票済みの場合は完了として記録する。検索できない場合は
+        二重登録を避けるため再実行せず、未確定のまま残す。
+
+        Args:
+            rows (List[dict]): 起票データの行データ辞書リスト
+
+        Returns:
+            List[dict]: 未完了の行データ辞書リスト（操作キー設定済み）
+        """
+        keywords = self._bts2its.FIXED_KEYWORDS
+        keyed_rows = []
+        for row_data in rows:
+            operation = row_data.get(keywords['its_operation'], '')
+            if operation is None or operation == '' or pd.isna(operation):
                 continue
-            # 更新データ作成
-            dict_keys = set(issue_data.keys()) & set(row_data.keys())
-            for key in dict_keys:
-                issue_data[key] = row_data[key]
-            # 新規起票（IDの指定がない場合）
-            if issue_id == '' or issue_id is None:
-                self._its_accessor.create_issue(issue_data)
-            # 既存起票更新（IDの指定がある場合）
+            keyed_rows.append((self._journal.operation_key(row_data), row_data))
+        statuses = self._journal.get_status([op_key for op_key, _ in keyed_rows])
+        in_doubt_creates = self._journal.get_in_doubt_creates([op_key for op_key, status in statuses.items() if status == EntryJournal.STATUS_STARTED])
+        resolved_ids = self._resolve_in_doubt_creates(in_doubt_creates)
+
+        pending_rows = []
+        done_count = 0
+        for op_key, row_data in keyed_rows:
+            status = statuses.get(op_key)
+            if status == EntryJournal.STATUS_DONE:
+                done_count += 1
+                continue
+            if op_key in in_doubt_creates and resolved_ids.get(op_key) != '':
+                # 起票済みが確認できた新規起票は完了として記録し、確認できない新規起票は再実行しない
+                if resolved_ids.get(op_key) is not None:
+                    self._journal.mark_done(op_key, resolved_ids[op_key])
+                    done_count += 1
+                continue
+            issue_id = row_data.get(keywords['its_id'], '')
+            self._journal.plan(op_key, str(row_data.get(keywords['its_operation'])), '' if issue_id is None else str(issue_id), str(row_data.get(keywords['its_title'], '')))
+            pending_rows.append({**row_data, self._JOURNAL_KEY: op_key})
+        self._journal.commit()
+        in_doubt_count = sum(1 for status in statuses.values() if status == EntryJournal.STATUS_STARTED)
+        print(f'ITS entry journal: {done_count} completed operations skipped, {len(pending_rows)} pending ({in_doubt_count} unconfirmed).')
+        return pending_rows
+
+    def _resolve_in_doubt_creates(self, in_doubt_creates: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """結果未確定の新規起票の確認
+
+        ITSアクセスオブジェクトが題名による検索（find_issue_ids）に対応している場合、題名が一致するチケットを検索する。
+
+        Args:
+            in_doubt_creates (Dict[str, str]): 結果未確定の新規起票の操作キーと題名の辞書
+
+        Returns:
+            Dict[str, Optional[str]]: 操作キーと起票済みのチケットID（起票されていない場合は空文字、確認できない場合はNone）の辞書
+        """
+        find_issue_ids = getattr(self._its_accessor, 'find_issue_ids', None)
+        resolved_ids: Dict[str, Optional[str]] = {}
+        for op_key, title in in_doubt_creates.items():
+            issue_ids = None
+            if find_issue_ids is not None:
+                try:
+                    issue_ids = self._get_transport().call('find', find_issue_ids, title)
+                except Exception as e:
+                    print(f'ITS issue search error. {e}')
+            if issue_ids is None:
+                print(f'ITS entry journal: unconfirmed create skipped, check the ITS and delete the journal to retry: {title}')
+                resolved_ids[op_key] = None
+            elif len(issue_ids) > 0:
+                print(f'ITS entry journal: unconfirmed create found as #{issue_ids[0]}: {title}')
+                resolved_ids[op_key] = issue_ids[0]
             else:
-                update_data = self._its_accessor.load_issue(issue_id)
-                self._its_accessor.update_issue(update_data, issue_data)
+                resolved_ids[op_key] = ''
+        return resolved_ids
 
-    def save_csv(self, file_path: Path) -> None:
-        """CSVファイル保存
+    def _group_entry_rows(self, rows: List[dict]) -> List[List[dict]]:
+        """起票データのBTS行単位のまとめ
 
         Args:
-            file_path (Path): 保存ファイルパス
+            rows (List[dict]): 起票データの行データ辞書リスト
+
+        Returns:
+            List[List[dict]]: 操作が設定された行データ辞書を説明（BTSのURL）単位にまとめたリスト（各単位内は起票データの順）
         """
-        # ITS起票データの取得
-        pd_its_entry = self._bts2its.get_its_entry_data()
-        # CSVファイル保存
-        if not file_path.parent.exists():
-            # 親ディレクトリが存在しない場合は作成する
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-        pd_its_entry.to_csv(file_path, index=False, encoding='utf-8-sig')
+        entry_groups: Dict[str, List[dict]] = {}
+        for index, row_data in enumerate(rows):
+            # 操作種別が空の場合はスキップ
+            operation = row_data.get(self._bts2its.FIXED_KEYWORDS['its_operation'], '')
+            if operation is None or operation == '' or pd.isna(operation):
+                continue
+            description = row_data.get(self._bts2its.FIXED_KEYWORDS['its_description'], '')
+            group_key = str(description) if description is not None and description != '' else f'#{index}'
+            entry_groups.setdefault(group_key, []).append(row_data)
+        return list(entry_groups.values())
+
+    def _prefetch_issues(self, entry_groups: List[List[dict]]) -> Dict[str, Any]:
+        """更新対象チケットの一括取得
+
+        ITSアクセスオブジェクトが一括取得（load_issues）に対応していない場合、
+        または一括取得件数が0以下の場合は取得しない（更新時に1件ずつ取得する）。
+
+        Args:
+            entry_groups (List[List[dict]]): BTS行単位にまとめた起票データ
+
+        Returns:
+            Dict[str, Any]: チケットID（文字列）とチケットオブジェクトの辞書
+        """
+        batch_size = self._config.entry_prefetch_batch_size()
+        load_issues = getattr(self._its_accessor, 'load_issues', None)
+        if load_issues is None or batch_size <= 0:
+            return {}
+        # 更新対象（IDの指定がある行）のチケットIDを収集
+        issue_ids = [
+            str(row_data.get(self._bts2its.FIXED_KEYWORDS['its_id']))
+            for entry_group in entry_groups for row_data in entry_group
+            if row_data.get(self._bts2its.FIXED_KEYWORDS['its_id'], '') not in ('', None)
+        ]
+        if len(issue_ids) == 0:
+            return {}
+        start_time = time.perf_counter()
+        try:
+            issues = self._get_transport().call('prefetch', load_issues, issue_ids, batch_size=batch_size)
+        except Exception as e:
+            # 一括取得できない場合は更新時に1件ずつ取得する
+            print(f'ITS issues prefetch error. {e}')
+            return {}
+        print(f'ITS issues prefetched: {len(issues)}/{len(set(issue_ids))} issues in {time.perf_counter() - start_time:.2f}s (batch size={batch_size})')
+        return issues
+
+    def _entry_group(self, entry_group: List[dict], recorder: LatencyRecorder) -> None:
+        """BTS行単位の起票・更新
+
+        Args:
+            entry_group (List[dict]): 同一BTS行の行データ辞書リスト
+            recorder (LatencyRecorder): 処理時間の記録オブジェクト
+        """
+        for row_data in entry_group:
+            op_key = row_data.get(self._JOURNAL_KEY)
+            if self._journal is not None and op_key is not None:
+                self._journal.mark_started(op_key)
+            start_time = time.perf_counter()
+            try:
+                result_id = self._entry_row(row_data)
+            except Exception as e:
+                if self._journal is not None and op_key is not None:
+                    self._journal.mark_failed(op_key, str(e))
+                raise
+            recorder.record(time.perf_counter() - start_time)
+            if self._journal is not None and op_key is not None:
+                self._journal.mark_done(op_key, result_id)
+
+    def _entry_row(self, row_data: dict) -> Any:
+        """1行分の起票・更新
+
+        Args:
+            row_data (dict): 起票データの行データ辞書
+
+        Returns:
+            Any: 起票・更新したチケットID（取得できない場合はNone）
+        """
+        issue_id = row_data.get(self._bts2its.FIXED_KEYWORDS['its_id'], '')
+        # 更新データ作成
+        issue_data = self._its_accessor.its_payload_template.copy()
+        dict_keys = set(issue_data.keys()) & set(row_data.keys())
+        for key in dict_keys:
+            issue_data[key] = row_data[key]
+        # 新規起票（IDの指定がない場合）
+        if issue_id == '' or issue_id is None:
+            # 新規起票は冪等でないため、サーバーが処理していないことが明らかな場合のみ再試行
+            issue = self._get_transport().call('create', self._its_accessor.create_issue, issue_data, idempotent=False)
+            return getattr(issue, 'id', None)
+        # 既存起票更新（IDの指定がある場合）
+        else:
+            # 一括取得済みのチケットがない場合は1件ずつ取得
+            update_data = self._prefetched_issues.get(str(issue_id))
+            if update_data is None:
+                update_data = self._get_transport().call('load', self._its_accessor.load_issue, issue_id)
+            # チケットの現在値と比較し、変更のある項目のみ更新（変更がない場合は更新しない）
+            diff_issue_data = getattr(self._its_accessor, 'diff_issue_data', None)
+            if diff_issue_data is not None and self._config.entry_skip_unchanged():
+                changed_data = diff_issue_data(update_data, issue_data)
+                self._count_update(issue_data, changed_data)
+                if changed_data is None:
+                    return issue_id
+                issue_data = changed_data
+            self._get_transport().call('update', self._its_accessor.update_issue, update_data, issue_data)
+            return issue_id
+
+    def _count_update(self, issue_data: dict, changed_data: Optional[dict]) -> None:
+        """更新の差分判定の集計
+
+        Args:
+            issue_data (dict): 更新データのペイロード
+            changed_data (Optional[dict]): 変更のある項目のペイロード（変更がない場合はNone）
+        """
+        changed_keys = set(changed_data.keys()) if changed_data is not None else set()
+        id_key = self._bts2its.FIXED_KEYWORDS['its_id']
+        omitted = sum(1 for key in issue_data.keys() if key not in changed_keys and key != id_key)
+        with self._update_lock:
+            self._update_stats['updates'] += 1
+            self._update_stats['skipped'] += 1 if changed_data is None else 0
+            self._update_stats['omitted'] += omitted
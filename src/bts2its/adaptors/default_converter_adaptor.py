@@ -2,6 +2,7 @@ from bts2its.adaptors import BaseConverterAdaptor
 from bts2its.common import *
 from bts2its.mantis2redmine import DefaultMantis2Redmine
 from bts2its.redmine_accessor import DefaultRedmineAccessor
+from pathlib import Path
 
 class DefaultConverterAdaptor(BaseConverterAdaptor):
     """BTSからITSへの変換アダプター
@@ -26,6 +27,16 @@ class DefaultConverterAdaptor(BaseConverterAdaptor):
             bts_prefix=bts_prefix,
             bts_base_url=self._config.bts_url(),
             date_range=self._config.conversion_date_range(),
+            engine=self._config.conversion_engine(),
+            csv_engine=self._config.load_csv_engine(),
+            csv_encoding=self._config.load_encoding(),
+            parse_workers=self._config.load_parse_workers(),
+            cache_path=str(Path(self._config.output_path()) / '.cache') if self._config.load_cache_enabled() else '',
+            cache_max_mb=self._config.load_cache_max_mb(),
+            sync_state_path=str(Path(self._config.output_path()) / project_name / 'sync_state.json') if self._config.sync_incremental() else '',
+            full_sync_interval_days=self._config.sync_full_interval_days(),
+            chunk_rows=self._config.load_chunk_rows(),
+            conversion_rules=self._config.conversion_rules(),
         )
         self._bts2its = DefaultMantis2Redmine(parameters=params)
 
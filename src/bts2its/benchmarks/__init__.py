@@ -0,0 +1,2 @@
+from .export_generator import ExportGenerator
+from .benchmark_runner import BenchmarkRunner
\ No newline at end of file
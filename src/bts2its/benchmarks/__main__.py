@@ -0,0 +1,61 @@
+from bts2its.benchmarks import BenchmarkRunner
+from bts2its.common import ExportProfile
+from pathlib import Path
+import argparse
+import json
+import tempfile
+
+def main():
+    """ベンチマークのメイン処理
+    """
+    # argument取得
+    parser = argparse.ArgumentParser(description='疑似エクスポートデータで読み込み・変換・CSV保存の処理時間とピークメモリを計測する。')
+    parser.add_argument('--sizes', type=str, default='1000,10000,100000', help='BTSデータ行数のカンマ区切りリスト。（デフォルト:1000,10000,100000）')
+    parser.add_argument('--engines', type=str, default='row,vectorized', help='変換エンジン種別のカンマ区切りリスト。（デフォルト:row,vectorized）')
+    parser.add_argument('--csv_engine', type=str, default='c', help='CSV読み込みエンジン（c, python, pyarrow）。（デフォルト:c）')
+    parser.add_argument('--match_ratio', type=float, default=0.5, help='ITSに該当チケットが存在するBTS行の割合。（デフォルト:0.5）')
+    parser.add_argument('--child_ratio', type=float, default=0.1, help='該当チケットに子チケットが存在する割合。（デフォルト:0.1）')
+    parser.add_argument('--version_ratio', type=float, default=0.9, help='修正予定バージョンが設定されたBTS行の割合。（デフォルト:0.9）')
+    parser.add_argument('--closed_ratio', type=float, default=0.3, help='終了ステータスのBTS行の割合。（デフォルト:0.3）')
+    parser.add_argument('--its_closed_ratio', type=float, default=0.2, help='終了ステータスの該当チケットの割合。（デフォルト:0.2）')
+    parser.add_argument('--noise_ratio', type=float, default=0.05, help='題名の前方が一部一致する無関係なチケットの割合。（デフォルト:0.05）')
+    parser.add_argument('--parent_titles', type=str, default='ENTRY', help='ITS親チケット題名のカンマ区切りリスト。（デフォルト:ENTRY）')
+    parser.add_argument('--seed', type=int, default=1, help='乱数シード。（デフォルト:1）')
+    parser.add_argument('--memory', type=str, default=BenchmarkRunner.MEMORY_RSS, help='メモリ計測方法（rss, tracemalloc）。（デフォルト:rss）')
+    parser.add_argument('--work_path', type=str, default='', help='疑似エクスポートデータの作業フォルダパス。（デフォルト:一時フォルダ）')
+    parser.add_argument('--output', type=str, default='benchmark.json', help='計測結果のJSONファイルパス。（デフォルト:benchmark.json）')
+    args = parser.parse_args()
+
+    # 生成条件作成
+    profiles = [
+        ExportProfile(
+            bts_rows=int(size),
+            match_ratio=args.match_ratio,
+            child_ratio=args.child_ratio,
+            version_ratio=args.version_ratio,
+            closed_ratio=args.closed_ratio,
+            its_closed_ratio=args.its_closed_ratio,
+            noise_ratio=args.noise_ratio,
+            parent_titles=[title for title in args.parent_titles.split(',') if title != ''],
+            date_range_days=365,
+            bts_base_url='https://bts.example.com/view.php?id=',
+            seed=args.seed,
+        )
+        for size in args.sizes.split(',') if size.strip() != ''
+    ]
+    engines = [engine for engine in args.engines.split(',') if engine != '']
+
+    # ベンチマーク実行
+    with tempfile.TemporaryDirectory(prefix='bts2its_benchmark_') as temp_path:
+        runner = BenchmarkRunner(work_path=Path(args.work_path or temp_path), memory_mode=args.memory, csv_engine=args.csv_engine)
+        report = runner.run_all(profiles=profiles, engines=engines)
+
+    # 計測結果保存
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'benchmark results saved: {output_path}')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+from bts2its.adaptors import BaseConverterAdaptor
+from bts2its.benchmarks.export_generator import ExportGenerator
+from bts2its.common import *
+from bts2its.mantis2redmine import DefaultMantis2Redmine
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import multiprocessing
+import platform
+import sys
+import pandas as pd
+
+class BenchmarkMantis2Redmine(DefaultMantis2Redmine):
+    """ベンチマーク用のMantisBTからRedmineへの変換クラス
+
+    生成条件の親チケット題名を使用する。
+    """
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, parameters: Mantis2RedmineParameters, parent_titles: List[str]) -> None:
+        """コンストラクタ
+
+        Args:
+            parameters (Mantis2RedmineParameters): MantisBTからRedmineへの変換パラメータ
+            parent_titles (List[str]): ITS親チケット題名リスト
+        """
+        self._ITS_PARENT_TICKET_TITLE = list(parent_titles)
+        super().__init__(parameters)
+
+class BenchmarkConverterAdaptor(BaseConverterAdaptor):
+    """ベンチマーク用の変換アダプター
+
+    ITSへの起票は行わず、変換結果のCSVファイル保存のみ計測する。
+    """
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, project_name: str, bts2its: DefaultMantis2Redmine, memory_mode: str) -> None:
+        """コンストラクタ
+
+        Args:
+            project_name (str): プロジェクト名
+            bts2its (DefaultMantis2Redmine): 変換オブジェクト
+            memory_mode (str): メモリ計測方法（rss, tracemalloc）
+        """
+        super().__init__(project_name)
+        self._bts2its = bts2its
+        self._stage_recorder = StageRecorder(memory_mode=memory_mode)
+
+class BenchmarkRunner:
+    """変換処理のベンチマーククラス
+
+    生成条件毎に疑似エクスポートデータを生成し、読み込み・変換・CSV保存の各段階の処理時間とピークメモリを計測する。
+    ピークメモリを正しく計測するため、各ケースは新しい子プロセスで実行する。
+    """
+    #
+    # public定数
+    #
+    MEMORY_RSS = StageRecorder.MEMORY_RSS
+    MEMORY_TRACEMALLOC = StageRecorder.MEMORY_TRACEMALLOC
+    #
+    # protected変数
+    #
+    _work_path: Path = None             # 作業フォルダパス
+    _memory_mode: str = MEMORY_RSS      # メモリ計測方法
+    _csv_engine: str = 'c'              # CSV読み込みエンジン
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, work_path: Path, memory_mode: str = MEMORY_RSS, csv_engine: str = 'c') -> None:
+        """コンストラクタ
+
+        Args:
+            work_path (Path): 作業フォルダパス
+            memory_mode (str, optional): メモリ計測方法（rss, tracemalloc）. デフォルトはrss.
+            csv_engine (str, optional): CSV読み込みエンジン（c, python, pyarrow）. デフォルトはc.
+        """
+        self._work_path = Path(work_path)
+        self._memory_mode = memory_mode if memory_mode in (self.MEMORY_RSS, self.MEMORY_TRACEMALLOC) else self.MEMORY_RSS
+        self._csv_engine = csv_engine
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def run_all(self, profiles: List[ExportProfile], engines: List[str]) -> Dict[str, Any]:
+        """全ケースのベンチマーク実行
+
+        Args:
+            profiles (List[ExportProfile]): 生成条件リスト
+            engines (List[str]): 変換エンジン種別リスト
+
+        Returns:
+            Dict[str, Any]: 実行環境とケース毎の計測結果の辞書
+        """
+        results = []
+        # ケース毎に子プロセスを生成し直す（ピークメモリを前のケースから引き継がない）
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context, max_tasks_per_child=1) as executor:
+            for profile in profiles:
+                for engine in engines:
+                    result = executor.submit(self.run, profile, engine).result()
+                    print(self.format_result(result))
+                    results.append(result)
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'environment': {
+                'python': sys.version.split()[0],
+                'pandas': pd.__version__,
+                'platform': platform.platform(),
+                'memory_mode': self._memory_mode,
+                'csv_engine': self._csv_engine,
+            },
+            'results': results,
+        }
+
+    def run(self, profile: ExportProfile, engine: str) -> Dict[str, Any]:
+        """1ケースのベンチマーク実行
+
+        Args:
+            profile (ExportProfile): 生成条件
+            engine (str): 変換エンジン種別（row, vectorized）
+
+        Returns:
+            Dict[str, Any]: 生成条件・変換エンジン・処理段階毎の計測結果の辞書
+        """
+        case_path = self._work_path / f"rows_{profile['bts_rows']}_seed_{profile.get('seed', 1)}"
+        # 疑似エクスポートデータ生成（同一条件の生成済みデータは再利用）
+        generator = ExportGenerator(profile)
+        paths = {'bts': case_path / ExportGenerator.BTS_FILE_NAME, 'its': case_path / ExportGenerator.ITS_FILE_NAME}
+        if not paths['bts'].is_file() or not paths['its'].is_file():
+            paths = generator.generate(case_path)
+
+        parameters = Mantis2RedmineParameters(
+            project_name='benchmark',
+            bts_prefix='',
+            bts_base_url=profile.get('bts_base_url', ''),
+            date_range=-1,
+            engine=engine,
+            csv_engine=self._csv_engine,
+        )
+        bts2its = BenchmarkMantis2Redmine(parameters=parameters, parent_titles=profile.get('parent_titles') or ['ENTRY'])
+        adaptor = BenchmarkConverterAdaptor(project_name='benchmark', bts2its=bts2its, memory_mode=self._memory_mode)
+
+        # 処理段階毎に計測（読み込み・変換・CSV保存）
+        adaptor.convert(bts_data_path=paths['bts'], its_data_path=paths['its'])
+        adaptor.save_csv(case_path / f'output_{engine}.csv')
+        stages = adaptor.get_metrics()
+        return {
+            'profile': dict(profile),
+            'engine': engine,
+            'entry_rows': len(bts2its.get_its_entry_data()),
+            'total_seconds': sum(stage['seconds'] for stage in stages),
+            'stages': stages,
+        }
+
+    def format_result(self, result: Dict[str, Any]) -> str:
+        """計測結果の文字列取得
+
+        Args:
+            result (Dict[str, Any]): 1ケースの計測結果
+
+        Returns:
+            str: 計測結果の文字列
+        """
+        lines = [f"rows={result['profile']['bts_rows']} engine={result['engine']} entry_rows={result['entry_rows']} total={result['total_seconds']:.3f}s"]
+        for stage in result['stages']:
+            lines.append(f"  {stage['stage']:<12} {stage['seconds']:9.3f}s {stage['rows']:>9} rows {stage['rows_per_second']:>12.0f} rows/s peak={stage['peak_memory_bytes'] / 1024 / 1024:.1f}MB")
+        return '\n'.join(lines)
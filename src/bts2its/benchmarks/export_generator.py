@@ -0,0 +1,252 @@
+from bts2its.common import ExportProfile
+from bts2its.mantis2redmine import BaseMantis2Redmine
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+class ExportGenerator:
+    """ベンチマーク用の疑似エクスポートデータ生成クラス
+
+    FIXED_KEYWORDSのカラム名でMantisBT・RedmineのエクスポートCSVファイルを生成する。
+    BTS行の一部に対応するチケット（題名フォーマットに従う該当チケット・子チケット）と、
+    題名の前方が一部一致する無関係なチケットを生成し、登録・更新・変更なしが混在するデータとする。
+    """
+    #
+    # public定数
+    #
+    BTS_FILE_NAME = 'bts.csv'           # BTSエクスポートファイル名
+    ITS_FILE_NAME = 'its.csv'           # ITSエクスポートファイル名
+    #
+    # protected定数
+    #
+    _KEYWORDS = BaseMantis2Redmine.FIXED_KEYWORDS
+    _BTS_OPEN_STATUS = ['新規', 'フィードバック', '確認済', '割当済']
+    _BTS_CLOSED_STATUS = ['解決済', '修正済', '完了']
+    _ITS_OPEN_STATUS = ['新規', '進行中', 'フィードバック']
+    _ITS_CLOSED_STATUS = ['終了', '却下']
+    _VERSIONS = ['x0000_1.0', 'x0000_1.1', 'x0000_2.0', 'y0001_1.0', 'y0001_1.1']
+    _TITLE_WORDS = ['画面表示が崩れる', '保存時にエラー', 'ログイン不可', '帳票の桁ずれ', '検索結果が不正', '"引用符", カンマを含む題名']
+    _ASSIGNEES = ['', '山田', '佐藤', '鈴木']
+    #
+    # protected変数
+    #
+    _profile: ExportProfile = None      # 生成条件
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, profile: ExportProfile) -> None:
+        """コンストラクタ
+
+        Args:
+            profile (ExportProfile): 生成条件
+        """
+        self._profile = profile
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def generate(self, output_path: Path) -> Dict[str, Path]:
+        """エクスポートファイルの生成
+
+        Args:
+            output_path (Path): 出力フォルダパス
+
+        Returns:
+            Dict[str, Path]: 生成したファイルパス（bts, its）
+        """
+        rng = np.random.default_rng(self._profile.get('seed', 1))
+        pd_bts = self._generate_bts(rng)
+        pd_its = self._generate_its(rng, pd_bts)
+
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+        bts_file_path = output_path / self.BTS_FILE_NAME
+        its_file_path = output_path / self.ITS_FILE_NAME
+        pd_bts.to_csv(bts_file_path, index=False, encoding='utf-8-sig')
+        pd_its.to_csv(its_file_path, index=False, encoding='utf-8-sig')
+        return {'bts': bts_file_path, 'its': its_file_path}
+
+    #
+    # protectedメソッド
+    #
+    def _generate_bts(self, rng: np.random.Generator) -> pd.DataFrame:
+        """BTSデータの生成
+
+        Args:
+            rng (np.random.Generator): 乱数生成オブジェクト
+
+        Returns:
+            pd.DataFrame: BTSデータ
+        """
+        rows = int(self._profile['bts_rows'])
+        ids = np.arange(1, rows + 1, dtype=np.int64)
+        titles = np.array(self._TITLE_WORDS, dtype=object)[rng.integers(0, len(self._TITLE_WORDS), rows)]
+        titles = titles + np.char.mod('%d', rng.integers(0, 1000, rows)).astype(object)
+        # ステータス（終了ステータスの割合に従う）
+        closed = rng.random(rows) < self._profile.get('closed_ratio', 0.3)
+        status = np.where(
+            closed,
+            np.array(self._BTS_CLOSED_STATUS, dtype=object)[rng.integers(0, len(self._BTS_CLOSED_STATUS), rows)],
+            np.array(self._BTS_OPEN_STATUS, dtype=object)[rng.integers(0, len(self._BTS_OPEN_STATUS), rows)],
+        )
+        # 修正予定バージョン（未設定の行を含む）
+        versions = np.array(self._VERSIONS, dtype=object)[rng.integers(0, len(self._VERSIONS), rows)]
+        versions = np.where(rng.random(rows) < self._profile.get('version_ratio', 0.9), versions, '')
+        # 更新日（現在日から範囲内の過去日時）
+        minutes = rng.integers(0, max(self._profile.get('date_range_days', 365), 1) * 24 * 60, rows)
+        update_dates = (pd.Timestamp(datetime.now()) - pd.to_timedelta(minutes, unit='min')).strftime('%Y-%m-%d %H:%M')
+
+        return pd.DataFrame({
+            self._KEYWORDS['bts_id']: ids,
+            self._KEYWORDS['bts_title']: titles,
+            self._KEYWORDS['bts_status']: status,
+            self._KEYWORDS['bts_version']: versions,
+            self._KEYWORDS['bts_date']: update_dates,
+            # 変換に使用しないカラム（読み込み対象外）
+            '報告者': np.array(self._ASSIGNEES, dtype=object)[rng.integers(0, len(self._ASSIGNEES), rows)],
+            'カテゴリ': 'general',
+        })
+
+    def _generate_its(self, rng: np.random.Generator, pd_bts: pd.DataFrame) -> pd.DataFrame:
+        """ITSデータの生成
+
+        Args:
+            rng (np.random.Generator): 乱数生成オブジェクト
+            pd_bts (pd.DataFrame): 生成したBTSデータ
+
+        Returns:
+            pd.DataFrame: ITSデータ
+        """
+        parent_titles = self._profile.get('parent_titles') or ['ENTRY']
+        bts_base_url = self._profile.get('bts_base_url', '')
+        rows = len(pd_bts)
+
+        # 親チケット
+        parent_ids = np.arange(1, len(parent_titles) + 1, dtype=np.int64)
+        frames = [self._its_frame(
+            ids=parent_ids,
+            parent_ids=np.full(len(parent_titles), '', dtype=object),
+            titles=np.array(parent_titles, dtype=object),
+            status=np.full(len(parent_titles), self._ITS_OPEN_STATUS[0], dtype=object),
+            versions=np.full(len(parent_titles), '', dtype=object),
+            descriptions=np.full(len(parent_titles), '', dtype=object),
+            tracker='親',
+            rng=rng,
+        )]
+        next_id = len(parent_titles) + 1
+
+        # 該当チケット（先頭の親チケットの題名フォーマット）
+        matched = np.flatnonzero(rng.random(rows) < self._profile.get('match_ratio', 0.5))
+        bts_ids = pd_bts[self._KEYWORDS['bts_id']].to_numpy()[matched]
+        bts_titles = pd_bts[self._KEYWORDS['bts_title']].to_numpy()[matched]
+        titles = np.array([BaseMantis2Redmine._ITS_TITLE_FORMAT.format(parent_titles[0], bts_id, bts_title) for bts_id, bts_title in zip(bts_ids, bts_titles)], dtype=object)
+        descriptions = np.array([f'{bts_base_url}{bts_id}' for bts_id in bts_ids], dtype=object)
+        matched_ids = np.arange(next_id, next_id + len(matched), dtype=np.int64)
+        frames.append(self._its_frame(
+            ids=matched_ids,
+            parent_ids=np.full(len(matched), str(parent_ids[0]), dtype=object),
+            titles=titles,
+            status=self._its_status(rng, len(matched)),
+            versions=np.array(self._VERSIONS, dtype=object)[rng.integers(0, len(self._VERSIONS), len(matched))],
+            descriptions=descriptions,
+            tracker='エントリー対応',
+            rng=rng,
+        ))
+        next_id += len(matched)
+
+        # 子チケット（該当チケットの題名に接尾辞を付けたもの）
+        children = np.flatnonzero(rng.random(len(matched)) < self._profile.get('child_ratio', 0.1))
+        frames.append(self._its_frame(
+            ids=np.arange(next_id, next_id + len(children), dtype=np.int64),
+            parent_ids=matched_ids[children].astype(str).astype(object),
+            titles=titles[children] + '_対応',
+            status=self._its_status(rng, len(children)),
+            versions=np.array(self._VERSIONS, dtype=object)[rng.integers(0, len(self._VERSIONS), len(children))],
+            descriptions=descriptions[children],
+            tracker='エントリー対応',
+            rng=rng,
+        ))
+        next_id += len(children)
+
+        # 題名の前方が一部一致する無関係なチケット
+        noise_rows = int(rows * self._profile.get('noise_ratio', 0.05))
+        noise_titles = np.array([f'{parent_titles[0]}[{number}' for number in rng.integers(0, max(rows, 1), noise_rows)], dtype=object)
+        frames.append(self._its_frame(
+            ids=np.arange(next_id, next_id + noise_rows, dtype=np.int64),
+            parent_ids=np.full(noise_rows, '', dtype=object),
+            titles=noise_titles,
+            status=self._its_status(rng, noise_rows),
+            versions=np.full(noise_rows, '', dtype=object),
+            descriptions=np.full(noise_rows, '', dtype=object),
+            tracker='タスク',
+            rng=rng,
+        ))
+
+        # Redmineのエクスポートと同様にIDの降順とする
+        return pd.concat(frames, ignore_index=True).sort_values(by=self._KEYWORDS['its_id'], ascending=False, ignore_index=True)
+
+    def _its_status(self, rng: np.random.Generator, rows: int) -> np.ndarray:
+        """ITSステータスの生成
+
+        Args:
+            rng (np.random.Generator): 乱数生成オブジェクト
+            rows (int): 行数
+
+        Returns:
+            np.ndarray: ステータス配列（終了ステータスの割合に従う）
+        """
+        closed = rng.random(rows) < self._profile.get('its_closed_ratio', 0.2)
+        return np.where(
+            closed,
+            np.array(self._ITS_CLOSED_STATUS, dtype=object)[rng.integers(0, len(self._ITS_CLOSED_STATUS), rows)],
+            np.array(self._ITS_OPEN_STATUS, dtype=object)[rng.integers(0, len(self._ITS_OPEN_STATUS), rows)],
+        )
+
+    def _its_frame(self, ids: np.ndarray, parent_ids: np.ndarray, titles: np.ndarray, status: np.ndarray, versions: np.ndarray, descriptions: np.ndarray, tracker: str, rng: np.random.Generator) -> pd.DataFrame:
+        """ITSデータ（Redmineエクスポート形式）の作成
+
+        Args:
+            ids (np.ndarray): チケットID配列
+            parent_ids (np.ndarray): 親チケットID配列
+            titles (np.ndarray): 題名配列
+            status (np.ndarray): ステータス配列
+            versions (np.ndarray): 対象バージョン配列
+            descriptions (np.ndarray): 説明配列
+            tracker (str): トラッカー
+            rng (np.random.Generator): 乱数生成オブジェクト
+
+        Returns:
+            pd.DataFrame: ITSデータ
+        """
+        rows = len(ids)
+        return pd.DataFrame({
+            self._KEYWORDS['its_id']: ids,
+            self._KEYWORDS['its_tracker']: tracker,
+            self._KEYWORDS['its_parent_id']: parent_ids,
+            self._KEYWORDS['its_status']: status,
+            self._KEYWORDS['its_title']: titles,
+            self._KEYWORDS['its_author']: '管理者',
+            self._KEYWORDS['its_assigned_to']: np.array(self._ASSIGNEES, dtype=object)[rng.integers(0, len(self._ASSIGNEES), rows)],
+            self._KEYWORDS['its_update_date']: '',
+            self._KEYWORDS['its_category']: '',
+            self._KEYWORDS['its_target_version']: versions,
+            self._KEYWORDS['its_start_date']: '',
+            self._KEYWORDS['its_due_date']: '',
+            self._KEYWORDS['its_estimated_hours']: np.where(rng.random(rows) < 0.5, '1.5', ''),
+            self._KEYWORDS['its_total_estimated_hours']: '',
+            self._KEYWORDS['its_spent_hours']: np.where(rng.random(rows) < 0.3, '0.5', ''),
+            self._KEYWORDS['its_total_spent_hours']: '',
+            self._KEYWORDS['its_done_ratio']: np.where(rng.random(rows) < 0.5, '0', '100'),
+            self._KEYWORDS['its_created_on']: '',
+            self._KEYWORDS['its_closed_on']: '',
+            self._KEYWORDS['its_priority']: '通常',
+            self._KEYWORDS['its_description']: descriptions,
+        }, columns=[column for column in BaseMantis2Redmine._ITS_ENTRY_COLUMNS if column != self._KEYWORDS['its_operation']])
@@ -1 +1,8 @@
-from .types import Mantis2RedmineParameters
\ No newline at end of file
+from .types import Mantis2RedmineParameters, CsvLoadStats, ExportProfile, StageMetrics, ItsParentTicket, ConversionRule
+from .title_prefix_index import TitlePrefixIndex
+from .entry_table_builder import EntryTableBuilder
+from .conversion_rule_set import ConversionRuleSet
+from .latency_recorder import LatencyRecorder
+from .latency_histogram import LatencyHistogram
+from .token_bucket import TokenBucket
+from .stage_recorder import StageRecorder
\ No newline at end of file
@@ -0,0 +1,358 @@
+from typing import Any, Callable, Dict, List, Set, Tuple
+import numpy as np
+import pandas as pd
+
+class ConversionRuleSet:
+    """起票・更新判定ルール表の実行クラス
+
+    ルール表（ConversionRuleのリスト）を生成時に1回だけ検証・変換し、条件と設定値をカラム単位の判定・代入処理として実行する。
+    条件はカラムの値の種類毎（カテゴリ毎）の判定表を作成し、行毎のコードで参照するため、行数に比例するPython処理を行わない。
+    行単位処理用に、同じルールを1行分の値で判定する処理も作成する。
+
+    ルールは定義順に判定し、条件を全て満たす行に設定値を代入する（後のルールの設定値で上書きする）。
+    stopが指定されたルールを適用した行は、以降のルールを判定しない。
+    条件と設定値が参照する項目の値は、ルール適用前の値（欠損値は空文字）とする。
+
+    値の指定は次のとおり。
+        - 文字列: そのままの値（$で始まる値は$$と記述する）
+        - $項目名: 項目の値（bts_version, its_status等）
+        - $定数名: 定数の値（its_status_close, bts_closed_status等）
+        - リスト（設定値のみ）: 空文字でない最初の値
+    """
+    #
+    # public定数
+    #
+    TARGET_ADD = 'add'                  # 対象：該当チケットが存在しないBTS行（新規登録）
+    TARGET_UPDATE = 'update'            # 対象：BTS行に該当するチケット（更新）
+    OPERATORS = ('eq', 'ne', 'in', 'not_in', 'empty', 'not_empty')     # 条件の演算子
+    #
+    # protected変数
+    #
+    _fields: List[str] = None           # 参照できる項目名リスト
+    _columns: List[str] = None          # 設定できる起票データのカラムキーリスト
+    _constants: Dict[str, Any] = None   # 定数名→値（文字列または文字列リスト）の辞書
+    _rules: Dict[str, List[dict]] = None    # 対象毎の変換済みルールリスト
+    _used_fields: Dict[str, Set[str]] = None    # 対象毎のルールが参照する項目名の集合
+    _used_columns: Dict[str, Set[str]] = None   # 対象毎のルールが設定するカラムキーの集合
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, rules: List[dict], fields: List[str], columns: List[str], constants: Dict[str, Any]) -> None:
+        """コンストラクタ
+
+        Args:
+            rules (List[dict]): ルール表（ConversionRuleのリスト）
+            fields (List[str]): 参照できる項目名リスト
+            columns (List[str]): 設定できる起票データのカラムキーリスト
+            constants (Dict[str, Any]): 定数名→値（文字列または文字列リスト）の辞書
+
+        Raises:
+            ValueError: ルールの形式が正しくない場合
+        """
+        self._fields = list(fields)
+        self._columns = list(columns)
+        self._constants = dict(constants)
+        self._rules = {self.TARGET_ADD: [], self.TARGET_UPDATE: []}
+        self._used_fields = {self.TARGET_ADD: set(), self.TARGET_UPDATE: set()}
+        self._used_columns = {self.TARGET_ADD: set(), self.TARGET_UPDATE: set()}
+        for number, rule in enumerate(rules or [], start=1):
+            self._compile_rule(rule, number)
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def get_fields(self, target: str) -> Set[str]:
+        """対象のルールが参照する項目名の取得
+
+        Args:
+            target (str): 対象（add, update）
+
+        Returns:
+            Set[str]: 項目名の集合
+        """
+        return set(self._used_fields[target])
+
+    def get_columns(self, target: str) -> Set[str]:
+        """対象のルールが設定するカラムキーの取得
+
+        Args:
+            target (str): 対象（add, update）
+
+        Returns:
+            Set[str]: カラムキーの集合
+        """
+        return set(self._used_columns[target])
+
+    def apply(self, target: str, fields: Dict[str, Any], columns: Dict[str, np.ndarray], count: int) -> np.ndarray:
+        """ルールの一括適用
+
+        Args:
+            target (str): 対象（add, update）
+            fields (Dict[str, Any]): 項目名→値（pd.Seriesまたは配列、get_fieldsの項目を指定）の辞書
+            columns (Dict[str, np.ndarray]): カラムキー→設定前の値配列の辞書（get_columnsのカラムを指定、設定後の値に置き換える）
+            count (int): 行数
+
+        Returns:
+            np.ndarray: いずれかのルールを適用した行がTrueのbool配列
+        """
+        encoded = {}
+
+        def get_field(name: str) -> Tuple[np.ndarray, np.ndarray]:
+            if name not in encoded:
+                encoded[name] = self._encode(fields[name])
+            return encoded[name]
+
+        active = np.ones(count, dtype=bool)
+        matched = np.zeros(count, dtype=bool)
+        for rule in self._rules[target]:
+            mask = active.copy()
+            for condition in rule['conditions']:
+                mask &= condition[0](get_field)
+            if not mask.any():
+                continue
+            for column, value in rule['assignments']:
+                columns[column] = np.where(mask, value[0](get_field, count), columns[column])
+            matched |= mask
+            if rule['stop']:
+                active &= ~mask
+        return matched
+
+    def apply_row(self, target: str, fields: Dict[str, str], values: Dict[str, str]) -> bool:
+        """ルールの1行分の適用（行単位処理）
+
+        Args:
+            target (str): 対象（add, update）
+            fields (Dict[str, str]): 項目名→値（欠損値は空文字）の辞書
+            values (Dict[str, str]): カラムキー→設定前の値の辞書（設定後の値に置き換える）
+
+        Returns:
+            bool: いずれかのルールを適用した場合True
+        """
+        matched = False
+        for rule in self._rules[target]:
+            if not all(condition[1](fields) for condition in rule['conditions']):
+                continue
+            for column, value in rule['assignments']:
+                values[column] = value[1](fields)
+            matched = True
+            if rule['stop']:
+                break
+        return matched
+
+    #
+    # protectedメソッド
+    #
+    def _compile_rule(self, rule: dict, number: int) -> None:
+        """ルールの検証と変換
+
+        Args:
+            rule (dict): ルール（ConversionRule）
+            number (int): ルール番号（エラー表示用、1始まり）
+
+        Raises:
+            ValueError: ルールの形式が正しくない場合
+        """
+        name = str(rule.get('name', '') or f'#{number}')
+        target = rule.get('target', '')
+        if target not in self._rules:
+            raise ValueError(f'invalid conversion rule {name}: unknown target "{target}"')
+        conditions = []
+        for condition in rule.get('when', []) or []:
+            conditions.append(self._compile_condition(condition, name, target))
+        assignments = []
+        for column, value in (rule.get('set', {}) or {}).items():
+            if column not in self._columns:
+                raise ValueError(f'invalid conversion rule {name}: unknown column "{column}"')
+            assignments.append((column, self._compile_value(value, name, target)))
+            self._used_columns[target].add(column)
+        self._rules[target].append({'conditions': conditions, 'assignments': assignments, 'stop': bool(rule.get('stop', False))})
+
+    def _compile_condition(self, condition: dict, name: str, target: str) -> Tuple[Callable, Callable]:
+        """条件の変換
+
+        Args:
+            condition (dict): 条件（field, op, value）
+            name (str): ルール名
+            target (str): 対象
+
+        Returns:
+            Tuple[Callable, Callable]: (一括判定処理, 1行分の判定処理)
+        """
+        field = condition.get('field', '')
+        operator = condition.get('op', 'eq')
+        if field not in self._fields:
+            raise ValueError(f'invalid conversion rule {name}: unknown field "{field}"')
+        if operator not in self.OPERATORS:
+            raise ValueError(f'invalid conversion rule {name}: unknown operator "{operator}"')
+        self._used_fields[target].add(field)
+
+        if operator in ('empty', 'not_empty'):
+            expected = operator == 'empty'
+            return (
+                lambda get_field: self._lookup(get_field(field), lambda label: (label == '') == expected),
+                lambda fields: (fields[field] == '') == expected,
+            )
+
+        if operator in ('in', 'not_in'):
+            kind, targets = self._resolve(condition.get('value', []), name)
+            if kind != 'constant' or not isinstance(targets, (list, tuple, set)):
+                raise ValueError(f'invalid conversion rule {name}: "{operator}" requires a list value')
+            members = frozenset(str(member) for member in targets)
+            expected = operator == 'in'
+            return (
+                lambda get_field: self._lookup(get_field(field), lambda label: (label in members) == expected),
+                lambda fields: (fields[field] in members) == expected,
+            )
+
+        # eq, ne
+        expected = operator == 'eq'
+        kind, value = self._resolve(condition.get('value', ''), name)
+        if kind == 'field':
+            self._used_fields[target].add(value)
+            return (
+                lambda get_field: (self._common_codes(get_field(field), get_field(value)) == 0) == expected,
+                lambda fields: (fields[field] == fields[value]) == expected,
+            )
+        if not isinstance(value, str):
+            raise ValueError(f'invalid conversion rule {name}: "{operator}" requires a string value')
+        return (
+            lambda get_field: self._lookup(get_field(field), lambda label: (label == value) == expected),
+            lambda fields: (fields[field] == value) == expected,
+        )
+
+    def _compile_value(self, value: Any, name: str, target: str) -> Tuple[Callable, Callable]:
+        """設定値の変換
+
+        Args:
+            value (Any): 設定値（文字列、$参照、またはそれらのリスト）
+            name (str): ルール名
+            target (str): 対象
+
+        Returns:
+            Tuple[Callable, Callable]: (一括作成処理, 1行分の作成処理)
+        """
+        if isinstance(value, (list, tuple)):
+            # 空文字でない最初の値（後ろから順に上書き）
+            candidates = [self._compile_value(candidate, name, target) for candidate in value]
+            if len(candidates) == 0:
+                raise ValueError(f'invalid conversion rule {name}: empty value list')
+
+            def first_values(get_field: Callable, count: int) -> np.ndarray:
+                result = candidates[-1][0](get_field, count)
+                for candidate in reversed(candidates[:-1]):
+                    values = candidate[0](get_field, count)
+                    result = np.where(values != '', values, result)
+                return result
+
+            def first_value(fields: Dict[str, str]) -> str:
+                for candidate in candidates:
+                    result = candidate[1](fields)
+                    if result != '':
+                        return result
+                return result
+
+            return first_values, first_value
+
+        kind, resolved = self._resolve(value, name)
+        if kind == 'field':
+            self._used_fields[target].add(resolved)
+            return (
+                lambda get_field, count: self._decode(get_field(resolved)),
+                lambda fields: fields[resolved],
+            )
+        if not isinstance(resolved, str):
+            raise ValueError(f'invalid conversion rule {name}: list constant "{value}" cannot be assigned')
+        return (
+            lambda get_field, count: np.full(count, resolved, dtype=object),
+            lambda fields: resolved,
+        )
+
+    def _resolve(self, value: Any, name: str) -> Tuple[str, Any]:
+        """値の参照先の解決
+
+        Args:
+            value (Any): 値（文字列、$参照、リスト）
+            name (str): ルール名
+
+        Returns:
+            Tuple[str, Any]: (種別（field, constant）, 項目名または定数値)
+        """
+        if isinstance(value, (list, tuple)):
+            return 'constant', [str(member) for member in value]
+        value = '' if value is None else str(value)
+        if value.startswith('$$'):
+            return 'constant', value[1:]
+        if not value.startswith('$'):
+            return 'constant', value
+        reference = value[1:]
+        if reference in self._fields:
+            return 'field', reference
+        if reference in self._constants:
+            return 'constant', self._constants[reference]
+        raise ValueError(f'invalid conversion rule {name}: unknown reference "{value}"')
+
+    def _encode(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """項目の値のコード化
+
+        Args:
+            values (Any): 項目の値（pd.Seriesまたは配列）
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (値の種類毎の文字列配列（末尾は欠損値の空文字）, 行毎のコード配列)
+        """
+        if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+            categories = values.cat.categories.tolist()
+            codes = values.cat.codes.to_numpy()
+        else:
+            codes, categories = pd.factorize(np.asarray(values, dtype=object), use_na_sentinel=True)
+            categories = categories.tolist() if hasattr(categories, 'tolist') else list(categories)
+        labels = np.array([str(category) for category in categories] + [''], dtype=object)
+        # 欠損値（コード-1）は末尾の空文字を参照
+        return labels, np.where(codes < 0, len(labels) - 1, codes)
+
+    def _decode(self, field: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """コード化した値の文字列配列取得
+
+        Args:
+            field (Tuple[np.ndarray, np.ndarray]): コード化した項目の値
+
+        Returns:
+            np.ndarray: 文字列配列（object型）
+        """
+        labels, codes = field
+        return labels[codes]
+
+    def _lookup(self, field: Tuple[np.ndarray, np.ndarray], predicate: Callable[[str], bool]) -> np.ndarray:
+        """値の種類毎の判定表による一括判定
+
+        Args:
+            field (Tuple[np.ndarray, np.ndarray]): コード化した項目の値
+            predicate (Callable[[str], bool]): 値の判定処理
+
+        Returns:
+            np.ndarray: 判定結果のbool配列
+        """
+        labels, codes = field
+        table = np.array([predicate(label) for label in labels], dtype=bool)
+        return table[codes]
+
+    def _common_codes(self, left: Tuple[np.ndarray, np.ndarray], right: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        """2つの項目の値の比較（共通コードの差）
+
+        Args:
+            left (Tuple[np.ndarray, np.ndarray]): コード化した項目の値
+            right (Tuple[np.ndarray, np.ndarray]): コード化した項目の値
+
+        Returns:
+            np.ndarray: 行毎の共通コードの差（同じ値の場合0）
+        """
+        common = pd.Index(np.concatenate([left[0], right[0]])).unique()
+        left_codes = common.get_indexer(left[0])[left[1]]
+        right_codes = common.get_indexer(right[0])[right[1]]
+        return left_codes - right_codes
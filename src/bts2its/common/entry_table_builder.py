@@ -0,0 +1,116 @@
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+class EntryTableBuilder:
+    """起票データの列単位作成クラス
+
+    起票データを行の辞書ではなくカラム毎のリストに追加し、最後に1回でDataFrameを作成する。
+    行単位の追加（append）は作成時に指定したカラムの値を順に受け取り、列単位の追加（extend）は
+    カラム毎の配列をまとめて受け取る。どちらにも指定されなかったカラムは空文字とする。
+    """
+    #
+    # protected変数
+    #
+    _columns: List[str] = None                      # 出力カラムリスト（出力順）
+    _row_fields: List[str] = None                   # 行単位の追加で値を受け取るカラムリスト
+    _row_values: List[list] = None                  # 行単位で追加されたカラム毎の値リスト（_row_fieldsの順）
+    _chunks: List[Dict[str, np.ndarray]] = None     # 追加済みのカラム毎の配列リスト
+    _chunk_counts: List[int] = None                 # 追加済みの配列毎の行数リスト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, columns: List[str], row_fields: Optional[List[str]] = None) -> None:
+        """コンストラクタ
+
+        Args:
+            columns (List[str]): 出力カラムリスト（出力順）
+            row_fields (Optional[List[str]], optional): 行単位の追加で値を受け取るカラムリスト. デフォルトはNone（行単位で追加しない）.
+        """
+        self._columns = list(columns)
+        self._row_fields = list(row_fields) if row_fields is not None else []
+        self._row_values = [[] for _ in self._row_fields]
+        self._chunks = []
+        self._chunk_counts = []
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def append(self, *values: Any) -> None:
+        """行単位の追加
+
+        Args:
+            *values (Any): row_fieldsの順のカラム値
+        """
+        for column_values, value in zip(self._row_values, values):
+            column_values.append(value)
+
+    def extend(self, columns: Dict[str, Sequence[Any]], count: int) -> None:
+        """列単位の追加
+
+        Args:
+            columns (Dict[str, Sequence[Any]]): カラム名→値配列の辞書（指定しないカラムは空文字）
+            count (int): 追加する行数
+        """
+        self._flush_rows()
+        self._chunks.append({column: np.asarray(values, dtype=object) for column, values in columns.items()})
+        self._chunk_counts.append(count)
+
+    def build(self, row_order: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """DataFrameの作成
+
+        Args:
+            row_order (Optional[np.ndarray], optional): 追加順の行位置で指定した出力行の順序. デフォルトはNone（追加順）.
+
+        Returns:
+            pd.DataFrame: 出力カラム順の起票データ
+        """
+        self._flush_rows()
+        output_columns = {}
+        for column in self._columns:
+            values = [chunk.get(column, None) for chunk in self._chunks]
+            values = [value if value is not None else np.full(count, '', dtype=object) for value, count in zip(values, self._chunk_counts)]
+            column_values = np.concatenate(values) if len(values) > 0 else np.empty(0, dtype=object)
+            output_columns[column] = column_values[row_order] if row_order is not None else column_values
+        return pd.DataFrame(output_columns, columns=self._columns)
+
+    @staticmethod
+    def to_str(value: Any, na_value: str = '') -> str:
+        """値の文字列変換（欠損値は指定文字列に置換）
+
+        Args:
+            value (Any): 変換対象の値
+            na_value (str, optional): 欠損値の置換文字列. デフォルトは空文字.
+
+        Returns:
+            str: 変換した文字列
+        """
+        if isinstance(value, str):
+            return value
+        # 文字列以外は欠損値（None, NaN, NA, NaT）を判定
+        if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value):
+            return na_value
+        return str(value)
+
+    #
+    # protectedメソッド
+    #
+    def _flush_rows(self) -> None:
+        """行単位で追加された値の配列化
+        """
+        count = len(self._row_values[0]) if len(self._row_values) > 0 else 0
+        if count == 0:
+            return
+        chunk = {}
+        for column, values in zip(self._row_fields, self._row_values):
+            chunk[column] = np.empty(count, dtype=object)
+            chunk[column][:] = values
+        self._chunks.append(chunk)
+        self._chunk_counts.append(count)
+        self._row_values = [[] for _ in self._row_fields]
@@ -0,0 +1,104 @@
+from threading import Lock
+from typing import Any, Dict, List
+
+class LatencyHistogram:
+    """操作種別毎の処理時間ヒストグラムクラス
+
+    Prometheusのhistogramと同じ累積バケットで処理時間の分布を記録する。
+    """
+    #
+    # public定数
+    #
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)     # バケットの上限（秒）
+    #
+    # protected変数
+    #
+    _counts: Dict[str, List[int]] = None    # 操作種別毎のバケット別件数（最後の要素は上限超過）
+    _sums: Dict[str, float] = None          # 操作種別毎の処理時間の合計（秒）
+    _lock: Lock = None                      # 排他制御オブジェクト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self) -> None:
+        """コンストラクタ
+        """
+        self._counts = {}
+        self._sums = {}
+        self._lock = Lock()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def observe(self, operation: str, seconds: float) -> None:
+        """処理時間の記録
+
+        Args:
+            operation (str): 操作種別
+            seconds (float): 処理時間（秒）
+        """
+        index = next((index for index, bound in enumerate(self.BUCKETS) if seconds <= bound), len(self.BUCKETS))
+        with self._lock:
+            counts = self._counts.setdefault(operation, [0] * (len(self.BUCKETS) + 1))
+            counts[index] += 1
+            self._sums[operation] = self._sums.get(operation, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """記録内容の取得
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 操作種別毎の累積バケット件数（buckets: 上限→件数）・件数（count）・合計（sum）の辞書
+        """
+        with self._lock:
+            snapshot = {operation: (list(counts), self._sums[operation]) for operation, counts in self._counts.items()}
+        result = {}
+        for operation, (counts, total) in snapshot.items():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip([*(str(bound) for bound in self.BUCKETS), '+Inf'], counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            result[operation] = {'buckets': buckets, 'count': cumulative, 'sum': total}
+        return result
+
+    def format_histogram(self) -> str:
+        """記録内容の文字列取得
+
+        Returns:
+            str: 操作種別毎のバケット別件数の文字列
+        """
+        bounds = [f'<={bound}s' for bound in self.BUCKETS] + [f'>{self.BUCKETS[-1]}s']
+        lines = []
+        with self._lock:
+            snapshot = {operation: list(counts) for operation, counts in self._counts.items()}
+        for operation, counts in snapshot.items():
+            lines.append(f'  {operation:<10} ' + ' '.join(f'{bound}:{count}' for bound, count in zip(bounds, counts) if count > 0))
+        return '\n'.join(lines)
+
+    def prometheus_lines(self, name: str, help_text: str, labels: Dict[str, str]) -> List[str]:
+        """Prometheus textfile形式の行リスト取得
+
+        Args:
+            name (str): メトリクス名
+            help_text (str): メトリクスの説明
+            labels (Dict[str, str]): 付与するラベル（エスケープ済みの値）
+
+        Returns:
+            List[str]: histogram形式の行リスト（記録がない場合は空のリスト）
+        """
+        histograms = self.to_dict()
+        if len(histograms) == 0:
+            return []
+        lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+        for operation, histogram in histograms.items():
+            label = ','.join([*(f'{key}="{value}"' for key, value in labels.items()), f'operation="{operation}"'])
+            for bound, count in histogram['buckets'].items():
+                lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{{label}}} {histogram["sum"]:.6g}')
+            lines.append(f'{name}_count{{{label}}} {histogram["count"]}')
+        return lines
@@ -0,0 +1,95 @@
+from threading import Lock
+from typing import Dict, List
+import time
+
+class LatencyRecorder:
+    """処理時間の記録クラス
+
+    複数スレッドから記録された処理時間を集計し、スループットとレイテンシの統計を返す。
+    """
+    #
+    # protected変数
+    #
+    _latencies: List[float] = None      # 処理時間リスト（秒）
+    _start_time: float = 0.0            # 計測開始時刻
+    _lock: Lock = None                  # 排他制御オブジェクト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self) -> None:
+        """コンストラクタ
+        """
+        self._latencies = []
+        self._start_time = time.perf_counter()
+        self._lock = Lock()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def record(self, seconds: float) -> None:
+        """処理時間の記録
+
+        Args:
+            seconds (float): 処理時間（秒）
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def summary(self) -> Dict[str, float]:
+        """統計情報の取得
+
+        Returns:
+            Dict[str, float]: 件数・経過時間・スループット（件/秒）・レイテンシ（平均、50/95/99パーセンタイル、最大）の辞書
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        elapsed = time.perf_counter() - self._start_time
+        count = len(latencies)
+
+        return {
+            'count': count,
+            'elapsed': elapsed,
+            'throughput': count / elapsed if elapsed > 0 else 0.0,
+            'mean': sum(latencies) / count if count > 0 else 0.0,
+            'p50': self._percentile(latencies, 0.50),
+            'p95': self._percentile(latencies, 0.95),
+            'p99': self._percentile(latencies, 0.99),
+            'max': latencies[-1] if count > 0 else 0.0,
+        }
+
+    def format_summary(self, label: str) -> str:
+        """統計情報の表示用文字列取得
+
+        Args:
+            label (str): 表示ラベル
+
+        Returns:
+            str: 統計情報の文字列
+        """
+        stats = self.summary()
+        return (f"{label}: {stats['count']} requests in {stats['elapsed']:.2f}s ({stats['throughput']:.1f} req/s), "
+                f"latency mean={stats['mean'] * 1000:.0f}ms p50={stats['p50'] * 1000:.0f}ms p95={stats['p95'] * 1000:.0f}ms "
+                f"p99={stats['p99'] * 1000:.0f}ms max={stats['max'] * 1000:.0f}ms")
+
+    #
+    # protectedメソッド
+    #
+    def _percentile(self, latencies: List[float], ratio: float) -> float:
+        """パーセンタイル値の取得
+
+        Args:
+            latencies (List[float]): ソート済みの処理時間リスト
+            ratio (float): パーセンタイル（0.0～1.0）
+
+        Returns:
+            float: パーセンタイル値（記録がない場合は0.0）
+        """
+        if len(latencies) == 0:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * ratio))]
@@ -0,0 +1,204 @@
+from bts2its.common.latency_histogram import LatencyHistogram
+from bts2its.common.types import StageMetrics
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, List, Optional
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+class StageRecorder:
+    """処理段階毎の計測クラス
+
+    処理段階毎の処理時間・処理行数・ピークメモリを記録し、JSONファイルとPrometheusのtextfile形式で出力する。
+    ピークメモリはプロセスの最大常駐メモリ（rss）またはPythonのメモリ割り当て（tracemalloc）で計測する。
+    """
+    #
+    # public定数
+    #
+    MEMORY_RSS = 'rss'                  # プロセスの最大常駐メモリ（処理段階の累積最大値）
+    MEMORY_TRACEMALLOC = 'tracemalloc'  # Pythonのメモリ割り当て（処理段階毎のピーク値、計測により処理時間が増加する）
+    #
+    # protected変数
+    #
+    _memory_mode: str = MEMORY_RSS      # メモリ計測方法
+    _stages: List[StageMetrics] = None  # 計測結果リスト
+    _started_at: str = ''               # 計測開始日時
+    _lock: Lock = None                  # 排他制御オブジェクト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, memory_mode: str = MEMORY_RSS) -> None:
+        """コンストラクタ
+
+        Args:
+            memory_mode (str, optional): メモリ計測方法（rss, tracemalloc）. デフォルトはrss.
+        """
+        self._memory_mode = memory_mode if memory_mode in (self.MEMORY_RSS, self.MEMORY_TRACEMALLOC) else self.MEMORY_RSS
+        self._stages = []
+        self._started_at = datetime.now().isoformat(timespec='seconds')
+        self._lock = Lock()
+        if self._memory_mode == self.MEMORY_TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[Dict[str, int]]:
+        """処理段階の計測
+
+        withブロックの処理時間とピークメモリを記録する。処理行数はブロック内で返却された辞書のrowsに設定する。
+        ブロック内で例外が発生した場合は記録しない。
+
+        Args:
+            stage (str): 処理段階名
+
+        Yields:
+            Dict[str, int]: 処理行数（rows）を設定する辞書
+        """
+        counter = {'rows': 0}
+        if self._memory_mode == self.MEMORY_TRACEMALLOC:
+            tracemalloc.reset_peak()
+        start_time = time.perf_counter()
+        yield counter
+        seconds = time.perf_counter() - start_time
+        metrics = StageMetrics(
+            stage=stage,
+            seconds=seconds,
+            rows=int(counter['rows']),
+            rows_per_second=counter['rows'] / seconds if seconds > 0 else 0.0,
+            peak_memory_bytes=self._peak_memory(),
+        )
+        with self._lock:
+            self._stages.append(metrics)
+
+    def reset(self) -> None:
+        """計測結果の初期化（監視モードの変換毎に計測し直す場合に使用）
+        """
+        with self._lock:
+            self._stages = []
+            self._started_at = datetime.now().isoformat(timespec='seconds')
+
+    def get_metrics(self) -> List[StageMetrics]:
+        """計測結果の取得
+
+        Returns:
+            List[StageMetrics]: 計測順の計測結果リスト
+        """
+        with self._lock:
+            return list(self._stages)
+
+    def format_metrics(self) -> str:
+        """計測結果の文字列取得
+
+        Returns:
+            str: 処理段階毎の計測結果の文字列
+        """
+        return '\n'.join(
+            f"  {metrics['stage']:<12} {metrics['seconds']:9.3f}s {metrics['rows']:>9} rows {metrics['rows_per_second']:>12.0f} rows/s peak={metrics['peak_memory_bytes'] / 1024 / 1024:.1f}MB"
+            for metrics in self.get_metrics()
+        )
+
+    def save_json(self, file_path: Path, project_name: str, histogram: Optional[LatencyHistogram] = None) -> None:
+        """計測結果のJSONファイル保存
+
+        Args:
+            file_path (Path): 保存ファイルパス
+            project_name (str): プロジェクト名
+            histogram (Optional[LatencyHistogram], optional): ITSアクセスの処理時間ヒストグラム. デフォルトはNone（出力しない）.
+        """
+        document = {
+            'project': project_name,
+            'started_at': self._started_at,
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'memory_mode': self._memory_mode,
+            'stages': self.get_metrics(),
+        }
+        if histogram is not None:
+            document['its_request_seconds'] = histogram.to_dict()
+        self._write(Path(file_path), json.dumps(document, ensure_ascii=False, indent=2))
+
+    def save_prometheus(self, file_path: Path, project_name: str, histogram: Optional[LatencyHistogram] = None) -> None:
+        """計測結果のPrometheus textfile形式保存
+
+        node exporterのtextfile collectorが書き込み途中のファイルを読み込まないよう、一時ファイルから置き換える。
+
+        Args:
+            file_path (Path): 保存ファイルパス（拡張子は.prom）
+            project_name (str): プロジェクト名
+            histogram (Optional[LatencyHistogram], optional): ITSアクセスの処理時間ヒストグラム. デフォルトはNone（出力しない）.
+        """
+        gauges = [
+            ('bts2its_stage_seconds', 'Wall time of each bts2its stage in seconds.', 'seconds'),
+            ('bts2its_stage_rows', 'Rows processed by each bts2its stage.', 'rows'),
+            ('bts2its_stage_rows_per_second', 'Rows per second of each bts2its stage.', 'rows_per_second'),
+            ('bts2its_stage_peak_memory_bytes', f'Peak memory ({self._memory_mode}) after each bts2its stage in bytes.', 'peak_memory_bytes'),
+        ]
+        project_label = self._escape_label(project_name)
+        lines = []
+        for name, help_text, key in gauges:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            for metrics in self.get_metrics():
+                lines.append(f'{name}{{project="{project_label}",stage="{self._escape_label(metrics["stage"])}"}} {float(metrics[key]):.6g}')
+        if histogram is not None:
+            lines.extend(histogram.prometheus_lines('bts2its_its_request_seconds', 'Latency of each ITS request in seconds.', {'project': project_label}))
+        lines.append('# HELP bts2its_last_run_timestamp_seconds Unix time of the last bts2its run.')
+        lines.append('# TYPE bts2its_last_run_timestamp_seconds gauge')
+        lines.append(f'bts2its_last_run_timestamp_seconds{{project="{project_label}"}} {time.time():.0f}')
+        self._write(Path(file_path), '\n'.join(lines) + '\n')
+
+    #
+    # protectedメソッド
+    #
+    def _peak_memory(self) -> int:
+        """ピークメモリ使用量の取得
+
+        Returns:
+            int: ピークメモリ使用量（バイト、取得できない場合は0）
+        """
+        if self._memory_mode == self.MEMORY_TRACEMALLOC:
+            return tracemalloc.get_traced_memory()[1]
+        try:
+            import resource
+        except ImportError:
+            # Windows環境では取得しない
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOSはバイト単位、Linuxはキロバイト単位
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    def _escape_label(self, value: str) -> str:
+        """Prometheusラベル値のエスケープ
+
+        Args:
+            value (str): ラベル値
+
+        Returns:
+            str: エスケープしたラベル値
+        """
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def _write(self, file_path: Path, text: str) -> None:
+        """ファイルの書き込み（一時ファイルから置き換え）
+
+        Args:
+            file_path (Path): 保存ファイルパス
+            text (str): 書き込む文字列
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = file_path.with_name(f'.{file_path.name}.{os.getpid()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+        os.replace(temp_path, file_path)
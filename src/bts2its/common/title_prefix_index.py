@@ -0,0 +1,99 @@
+from bisect import bisect_left
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+
+class TitlePrefixIndex:
+    """題名の前方一致検索インデックス
+
+    題名をソート済み配列で保持し、前方一致する行を二分探索で取得する。
+    Series.str.startswithによる全件走査と同一の結果（元の行順）を返す。
+    """
+    #
+    # protected変数
+    #
+    _sorted_titles: List[str] = None        # ソート済み題名リスト
+    _sorted_positions: List[int] = None     # ソート済み題名に対応する行位置リスト
+    _sorted_titles_array: np.ndarray = None     # ソート済み題名配列（一括検索用）
+    _sorted_positions_array: np.ndarray = None  # ソート済み行位置配列（一括検索用）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, titles: pd.Series) -> None:
+        """コンストラクタ
+
+        Args:
+            titles (pd.Series): 題名のSeries（欠損値は検索対象外）
+        """
+        # 欠損値を除いた（題名, 行位置）をソートして保持
+        pairs = sorted(
+            (title, position) for position, title in enumerate(titles.tolist())
+            if isinstance(title, str)
+        )
+        self._sorted_titles = [title for title, _ in pairs]
+        self._sorted_positions = [position for _, position in pairs]
+        self._sorted_titles_array = np.array(self._sorted_titles, dtype=object)
+        self._sorted_positions_array = np.array(self._sorted_positions, dtype=np.int64)
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def find(self, prefix: str) -> List[int]:
+        """前方一致する行位置の取得
+
+        Args:
+            prefix (str): 検索する題名の前方文字列
+
+        Returns:
+            List[int]: 前方一致した行位置リスト（元の行順）
+        """
+        start = bisect_left(self._sorted_titles, prefix)
+        end = start
+        # 前方一致する題名はソート済み配列上で連続するため、一致しなくなるまで走査
+        while end < len(self._sorted_titles) and self._sorted_titles[end].startswith(prefix):
+            end += 1
+        return sorted(self._sorted_positions[start:end])
+
+    def find_all(self, prefixes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """複数の前方文字列に一致する行位置の一括取得
+
+        Args:
+            prefixes (List[str]): 検索する題名の前方文字列リスト
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (前方文字列の位置, 一致した行位置)の組。前方文字列の位置順、同一前方文字列内は元の行順。
+        """
+        if len(prefixes) == 0 or len(self._sorted_titles) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        # 前方一致範囲の開始位置と終了位置（末尾文字を1つ進めた文字列の挿入位置）を一括で二分探索
+        starts = np.searchsorted(self._sorted_titles_array, np.array(prefixes, dtype=object), side='left')
+        uppers = [prefix[:-1] + chr(ord(prefix[-1]) + 1) if prefix != '' and ord(prefix[-1]) < 0x10FFFF else None for prefix in prefixes]
+        ends = np.array([
+            len(self._sorted_titles) if upper is None else 0 for upper in uppers
+        ], dtype=np.int64)
+        bounded = [i for i, upper in enumerate(uppers) if upper is not None]
+        if len(bounded) > 0:
+            ends[bounded] = np.searchsorted(self._sorted_titles_array, np.array([uppers[i] for i in bounded], dtype=object), side='left')
+        # 末尾文字を進められない前方文字列は逐次検索で終了位置を求める
+        for i, upper in enumerate(uppers):
+            if upper is None and prefixes[i] != '':
+                end = starts[i]
+                while end < len(self._sorted_titles) and self._sorted_titles[end].startswith(prefixes[i]):
+                    end += 1
+                ends[i] = end
+
+        # 一致範囲を展開して(前方文字列の位置, 行位置)の組を作成
+        counts = np.maximum(ends - starts, 0)
+        prefix_positions = np.repeat(np.arange(len(prefixes), dtype=np.int64), counts)
+        offsets = np.arange(counts.sum(), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        row_positions = self._sorted_positions_array[np.repeat(starts, counts) + offsets]
+        # 同一前方文字列内は元の行順に並べ替える
+        order = np.lexsort((row_positions, prefix_positions))
+        return prefix_positions[order], row_positions[order]
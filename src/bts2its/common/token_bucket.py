@@ -0,0 +1,102 @@
+from threading import Lock
+import time
+
+class TokenBucket:
+    """トークンバケットによる流量制限クラス
+
+    1秒あたりの許可数（rate）でトークンを補充し、最大でburst個まで連続した呼び出しを許可する。
+    サーバーから過負荷の応答があった場合は許可数を半減し、成功する毎に設定値まで少しずつ戻す。
+    """
+    #
+    # protected変数
+    #
+    _max_rate: float = 0.0              # 設定された1秒あたりの許可数（0以下の場合は制限しない）
+    _rate: float = 0.0                  # 現在の1秒あたりの許可数
+    _burst: float = 1.0                 # 連続して許可する最大数
+    _tokens: float = 0.0                # 現在のトークン数（待機中の予約がある場合は負数）
+    _updated_at: float = 0.0            # トークン数の更新時刻
+    _lock: Lock = None                  # 排他制御オブジェクト
+    #
+    # protected定数
+    #
+    _MIN_RATE_RATIO = 1 / 16            # 半減時の下限（設定値に対する割合）
+    _RECOVER_RATIO = 0.05               # 成功時に戻す許可数（設定値に対する割合）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """コンストラクタ
+
+        Args:
+            rate (float): 1秒あたりの許可数（0以下の場合は制限しない）
+            burst (int, optional): 連続して許可する最大数. デフォルトは1.
+        """
+        self._max_rate = float(rate)
+        self._rate = float(rate)
+        self._burst = float(max(int(burst), 1))
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def acquire(self) -> float:
+        """トークンの取得
+
+        トークンがない場合は補充されるまで待機する。待機中の呼び出しは順にトークンを予約する。
+
+        Returns:
+            float: 待機した時間（秒）
+        """
+        if self._max_rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttle(self) -> None:
+        """許可数の半減（サーバーの過負荷応答時）
+        """
+        if self._max_rate <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._rate = max(self._rate / 2, self._max_rate * self._MIN_RATE_RATIO)
+
+    def recover(self) -> None:
+        """許可数の回復（呼び出し成功時）
+        """
+        if self._max_rate <= 0 or self._rate >= self._max_rate:
+            return
+        with self._lock:
+            self._refill()
+            self._rate = min(self._rate + self._max_rate * self._RECOVER_RATIO, self._max_rate)
+
+    def get_rate(self) -> float:
+        """現在の1秒あたりの許可数の取得
+
+        Returns:
+            float: 1秒あたりの許可数（制限しない場合は0）
+        """
+        return self._rate if self._max_rate > 0 else 0.0
+
+    #
+    # protectedメソッド
+    #
+    def _refill(self) -> None:
+        """経過時間分のトークン補充（排他制御中に呼び出す）
+        """
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self._rate, self._burst)
+        self._updated_at = now
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Any, Dict, List, TypedDict
 
 class Mantis2RedmineParameters(TypedDict):
     """MantisBTからRedmineへの変換パラメータ
@@ -7,4 +7,65 @@ class Mantis2RedmineParameters(TypedDict):
     bts_prefix: str                 # BTSをフィルタするためのプレフィックス
     bts_base_url: str               # BTSベースURL
     date_range: int = 0             # 有効日付範囲（現在日からの過去日数）
+    engine: str = 'row'             # 変換エンジン種別（row:行単位処理, vectorized:列単位の一括処理）
+    csv_engine: str = 'c'           # CSV読み込みエンジン種別（c, python, pyarrow）
+    csv_encoding: str = 'auto'      # CSVファイルの文字コード（autoの場合はファイル毎に判定）
+    parse_workers: int = 0          # CSVファイルの並列解析のスレッド数（0の場合はCPUコア数、1の場合は並列解析しない）
+    cache_path: str = ''            # 読み込み済みデータのキャッシュフォルダパス（空の場合はキャッシュしない）
+    cache_max_mb: int = 1024        # キャッシュ合計サイズ上限（MB）
+    sync_state_path: str = ''       # 差分同期の状態ファイルパス（空の場合は差分同期しない）
+    full_sync_interval_days: int = 7    # 差分同期時に全件同期を行う間隔（日数、マイナス値の場合は行わない）
+    chunk_rows: int = 0             # BTSデータの分割読み込み行数（0の場合は一括読み込み）
+    conversion_rules: list = []     # 起票・更新判定ルール表（空の場合は変換クラスの既定ルール）
 
+class CsvLoadStats(TypedDict):
+    """CSV読み込み結果の統計情報
+    """
+    file_path: str                  # 読み込みファイルパス
+    engine: str                     # 使用した読み込みエンジン（キャッシュから読み込んだ場合はcache）
+    rows: int                       # 読み込み行数
+    seconds: float                  # 読み込み時間（秒）
+    memory_bytes: int               # 読み込み後のDataFrameメモリ使用量（バイト）
+    encoding: str = 'utf-8-sig'     # 読み込みに使用した文字コード
+    decode_errors: int = 0          # デコードできずに置換したバイト列の件数
+
+
+class ExportProfile(TypedDict):
+    """ベンチマーク用の疑似エクスポートデータ生成条件
+    """
+    bts_rows: int                   # BTSデータ行数
+    match_ratio: float = 0.5        # ITSに該当チケットが存在するBTS行の割合
+    child_ratio: float = 0.1        # 該当チケットに子チケットが存在する割合
+    version_ratio: float = 0.9      # 修正予定バージョンが設定されたBTS行の割合
+    closed_ratio: float = 0.3       # 終了ステータスのBTS行の割合
+    its_closed_ratio: float = 0.2   # 終了ステータスの該当チケットの割合
+    noise_ratio: float = 0.05       # 題名の前方が一部一致する無関係なチケットの割合（BTS行数に対する割合）
+    parent_titles: List[str] = []   # ITS親チケット題名リスト（先頭の親チケットに該当チケットを作成）
+    date_range_days: int = 365      # BTS更新日の範囲（現在日からの過去日数）
+    bts_base_url: str = ''          # BTSベースURL
+    seed: int = 1                   # 乱数シード
+
+class StageMetrics(TypedDict):
+    """処理段階毎の計測結果
+    """
+    stage: str                      # 処理段階名
+    seconds: float                  # 処理時間（秒）
+    rows: int                       # 処理行数
+    rows_per_second: float          # 1秒あたりの処理行数
+    peak_memory_bytes: int          # ピークメモリ使用量（バイト）
+
+class ItsParentTicket(TypedDict):
+    """ITS親チケット情報
+    """
+    title: str                      # 親チケット題名
+    id: Any                         # 親チケットID
+    title_format: str               # 該当チケット題名のフォーマット（親チケット題名を展開済み、{0}:BTS ID, {1}:BTS題名）
+
+class ConversionRule(TypedDict):
+    """起票・更新判定ルール
+    """
+    name: str                       # ルール名（エラー表示用）
+    target: str                     # 対象（add:該当チケットが存在しないBTS行, update:BTS行に該当するチケット）
+    when: List[Dict[str, Any]] = [] # 条件リスト（全て満たす場合に適用、{field:項目名, op:演算子, value:値}）
+    set: Dict[str, Any] = {}        # 起票データのカラムキーと設定値の辞書
+    stop: bool = False              # 適用した行は以降のルールを判定しない場合True
@@ -1,11 +1,14 @@
 import os
 import pathlib
 import yaml
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 class Config:
     """設定情報管理クラス
     """
+    # バッチ実行時に親プロセスで読み込んだ設定データ（設定されている場合は設定ファイルを読み込まない）
+    _shared_config_data: Optional[Dict[str, Any]] = None
+
     #
     # Constructor / Destructor
     #
@@ -25,8 +28,11 @@ class Config:
                 self._settings_file = pathlib.Path("/app/settings.yaml")
         else:
             self._settings_file = self._base_path / "settings.yaml"
-        # 設定データの読み込み
-        self._config_data = self._load_settings()
+        # 設定データの読み込み（共有された設定データがある場合はそれを使用する）
+        if Config._shared_config_data is not None:
+            self._config_data = Config._shared_config_data
+        else:
+            self._config_data = self._load_settings()
 
     def __del__(self) -> None:
         """デストラクタ
@@ -36,6 +42,25 @@ class Config:
     #
     # public methods
     #
+    @classmethod
+    def share(cls, config_data: Optional[Dict[str, Any]]) -> None:
+        """設定データの共有
+
+        以降に生成するConfigオブジェクトは設定ファイルを読み込まず、共有された設定データを使用する。
+
+        Args:
+            config_data (Optional[Dict[str, Any]]): 共有する設定データ（Noneの場合は共有を解除する）
+        """
+        cls._shared_config_data = config_data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """設定データの取得
+
+        Returns:
+            Dict[str, Any]: 読み込んだ設定データ
+        """
+        return self._config_data
+
     def get(self, key: str, default=None):
         """設定値の取得
 
@@ -106,6 +131,46 @@ class Config:
         its_input_file = its_settings.get("input_file", "")
         return its_input_file
 
+    def its_source(self) -> str:
+        """ITSデータの取得元の取得
+
+        Returns:
+            str: ITSデータの取得元（csv:エクスポートしたCSVファイル, rest:REST APIで直接取得）
+        """
+        its_settings = self._config_data.get("its_settings", {})
+        its_source = its_settings.get("source", "csv")
+        return str(its_source)
+
+    def its_fetch_workers(self) -> int:
+        """ITSデータのREST API取得の並列数の取得
+
+        Returns:
+            int: ページ取得の並列数
+        """
+        its_settings = self._config_data.get("its_settings", {})
+        fetch_workers = its_settings.get("fetch_workers", 4)
+        return int(fetch_workers)
+
+    def its_page_size(self) -> int:
+        """ITSデータのREST API取得の1リクエストあたりの件数の取得
+
+        Returns:
+            int: 1リクエストで取得する件数（最大100）
+        """
+        its_settings = self._config_data.get("its_settings", {})
+        page_size = its_settings.get("page_size", 100)
+        return int(page_size)
+
+    def its_snapshot(self) -> bool:
+        """ITSデータの差分取得フラグの取得
+
+        Returns:
+            bool: 取得したチケットをスナップショットに保存し、次回は更新されたチケットのみ取得する場合True
+        """
+        its_settings = self._config_data.get("its_settings", {})
+        snapshot = its_settings.get("snapshot", False)
+        return bool(snapshot)
+
     def conversion_output_file(self) -> str:
         """変換後の出力ファイル名の取得
 
@@ -116,6 +181,26 @@ class Config:
         output_file = conversion_settings.get("output_file", "")
         return output_file
     
+    def conversion_output_formats(self) -> List[str]:
+        """起票データの追加出力形式の取得
+
+        Returns:
+            List[str]: CSVファイルに加えて出力する形式リスト（parquet, arrow）
+        """
+        conversion_settings = self._config_data.get("conversion_settings", {})
+        output_formats = conversion_settings.get("output_formats", []) or []
+        return [str(output_format).lower() for output_format in output_formats]
+
+    def conversion_plan_file(self) -> str:
+        """起票計画ファイル名の取得
+
+        Returns:
+            str: 起票計画ファイル名（.gzで終わる場合はgzip圧縮）
+        """
+        conversion_settings = self._config_data.get("conversion_settings", {})
+        plan_file = conversion_settings.get("plan_file", "plan.jsonl")
+        return plan_file
+
     def conversion_date_range(self) -> int:
         """変換対象の期間（日数）の取得
 
@@ -126,6 +211,299 @@ class Config:
         date_range = conversion_settings.get("date_range", -1)
         return int(date_range)
 
+    def conversion_engine(self) -> str:
+        """変換エンジン種別の取得
+
+        Returns:
+            str: 変換エンジン種別（row:行単位処理, vectorized:列単位の一括処理）
+        """
+        conversion_settings = self._config_data.get("conversion_settings", {})
+        engine = conversion_settings.get("engine", "row")
+        return engine
+
+    def conversion_rules(self) -> List[Dict[str, Any]]:
+        """起票・更新判定ルール表の取得
+
+        Returns:
+            List[Dict[str, Any]]: 起票・更新判定ルールのリスト（空の場合は変換クラスの既定ルール）
+        """
+        conversion_settings = self._config_data.get("conversion_settings", {})
+        rules = conversion_settings.get("rules", []) or []
+        return list(rules)
+
+    def load_csv_engine(self) -> str:
+        """CSV読み込みエンジン種別の取得
+
+        Returns:
+            str: CSV読み込みエンジン種別（c, python, pyarrow）
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        csv_engine = load_settings.get("csv_engine", "c")
+        return csv_engine
+
+    def load_encoding(self) -> str:
+        """CSVファイルの文字コードの取得
+
+        Returns:
+            str: 文字コード（autoの場合はファイル毎にUTF-8とCP932を判定）
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        encoding = load_settings.get("encoding", "auto")
+        return encoding or "auto"
+
+    def load_parse_workers(self) -> int:
+        """CSVファイルの並列解析のスレッド数の取得
+
+        Returns:
+            int: 並列解析のスレッド数（0の場合はCPUコア数（最大8）、1の場合は並列解析しない）
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        parse_workers = load_settings.get("parse_workers", 0)
+        return int(parse_workers)
+
+    def load_cache_enabled(self) -> bool:
+        """読み込み済みデータのキャッシュ有効フラグの取得
+
+        Returns:
+            bool: キャッシュする場合True
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        cache = load_settings.get("cache", False)
+        return bool(cache)
+
+    def load_cache_max_mb(self) -> int:
+        """キャッシュ合計サイズ上限（MB）の取得
+
+        Returns:
+            int: キャッシュ合計サイズ上限（MB）
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        cache_max_mb = load_settings.get("cache_max_mb", 1024)
+        return int(cache_max_mb)
+
+    def load_chunk_rows(self) -> int:
+        """BTSデータの分割読み込み行数の取得
+
+        Returns:
+            int: 分割読み込み行数（0以下の場合は一括読み込み）
+        """
+        load_settings = self._config_data.get("load_settings", {})
+        chunk_rows = load_settings.get("chunk_rows", 0)
+        return int(chunk_rows)
+
+    def sync_incremental(self) -> bool:
+        """差分同期フラグの取得
+
+        Returns:
+            bool: 前回同期から変更のあるBTS行のみ変換する場合True
+        """
+        sync_settings = self._config_data.get("sync_settings", {})
+        incremental = sync_settings.get("incremental", False)
+        return bool(incremental)
+
+    def sync_full_interval_days(self) -> int:
+        """差分同期時に全件同期を行う間隔（日数）の取得
+
+        Returns:
+            int: 全件同期を行う間隔（日数）。マイナス値の場合は定期的な全件同期を行わない。
+        """
+        sync_settings = self._config_data.get("sync_settings", {})
+        full_interval_days = sync_settings.get("full_interval_days", 7)
+        return int(full_interval_days)
+
+    def entry_workers(self) -> int:
+        """ITS起票の並列数の取得
+
+        Returns:
+            int: ITS起票の並列数（1以下の場合は逐次処理）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        workers = entry_settings.get("workers", 1)
+        return int(workers)
+
+    def entry_prefetch_batch_size(self) -> int:
+        """更新対象チケットの一括取得件数の取得
+
+        Returns:
+            int: 1リクエストで取得するチケット件数（0以下の場合は一括取得しない）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        prefetch_batch_size = entry_settings.get("prefetch_batch_size", 100)
+        return int(prefetch_batch_size)
+
+    def entry_journal(self) -> bool:
+        """ITS起票ジャーナル使用有無の取得
+
+        Returns:
+            bool: 起票・更新の結果を記録し、再実行時に完了済みの操作をスキップする場合True
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        journal = entry_settings.get("journal", False)
+        return bool(journal)
+
+    def entry_journal_retention_days(self) -> int:
+        """ITS起票ジャーナルの保持日数の取得
+
+        Returns:
+            int: 操作記録の保持日数
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        retention_days = entry_settings.get("journal_retention_days", 30)
+        return int(retention_days)
+
+    def entry_skip_unchanged(self) -> bool:
+        """ITS更新の差分判定フラグの取得
+
+        Returns:
+            bool: チケットの現在値と比較し、変更のある項目のみ更新する（変更がない場合は更新しない）場合True
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        skip_unchanged = entry_settings.get("skip_unchanged", True)
+        return bool(skip_unchanged)
+
+    def entry_rate_limit(self) -> float:
+        """ITS起票・更新の流量制限の取得
+
+        Returns:
+            float: 1秒あたりの最大リクエスト数（0以下の場合は制限しない）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        rate_limit = entry_settings.get("rate_limit", 0)
+        return float(rate_limit)
+
+    def entry_rate_burst(self) -> int:
+        """ITS起票・更新の連続リクエスト数の取得
+
+        Returns:
+            int: 流量制限で連続して許可する最大リクエスト数
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        rate_burst = entry_settings.get("rate_burst", 1)
+        return int(rate_burst)
+
+    def entry_max_retries(self) -> int:
+        """ITS起票・更新の最大再試行回数の取得
+
+        Returns:
+            int: 一時的なエラー時の最大再試行回数（0の場合は再試行しない）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        max_retries = entry_settings.get("max_retries", 3)
+        return int(max_retries)
+
+    def entry_retry_backoff_seconds(self) -> float:
+        """ITS起票・更新の再試行の初回待機時間の取得
+
+        Returns:
+            float: 初回待機時間（秒、再試行毎に倍増）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        retry_backoff_seconds = entry_settings.get("retry_backoff_seconds", 0.5)
+        return float(retry_backoff_seconds)
+
+    def entry_retry_backoff_max_seconds(self) -> float:
+        """ITS起票・更新の再試行の最大待機時間の取得
+
+        Returns:
+            float: 最大待機時間（秒）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        retry_backoff_max_seconds = entry_settings.get("retry_backoff_max_seconds", 30)
+        return float(retry_backoff_max_seconds)
+
+    def entry_pool_size(self) -> int:
+        """ITS接続プール数の取得
+
+        Returns:
+            int: ホスト毎に保持する接続数（0の場合は起票の並列数）
+        """
+        entry_settings = self._config_data.get("entry_settings", {})
+        pool_size = entry_settings.get("pool_size", 0)
+        return int(pool_size)
+
+    def metrics_enabled(self) -> bool:
+        """処理段階毎の計測結果出力有無の取得
+
+        Returns:
+            bool: 計測結果をJSONファイルに出力する場合True
+        """
+        metrics_settings = self._config_data.get("metrics_settings", {})
+        enabled = metrics_settings.get("enabled", False)
+        return bool(enabled)
+
+    def metrics_output_file(self) -> str:
+        """計測結果のJSONファイル名の取得
+
+        Returns:
+            str: 計測結果のJSONファイル名（出力フォルダの<プロジェクト名>に保存）
+        """
+        metrics_settings = self._config_data.get("metrics_settings", {})
+        output_file = metrics_settings.get("output_file", "metrics.json")
+        return output_file
+
+    def metrics_memory_mode(self) -> str:
+        """メモリ計測方法の取得
+
+        Returns:
+            str: メモリ計測方法（rss, tracemalloc）
+        """
+        metrics_settings = self._config_data.get("metrics_settings", {})
+        memory_mode = metrics_settings.get("memory_mode", "rss")
+        return memory_mode
+
+    def metrics_prometheus_path(self) -> str:
+        """Prometheus textfile出力フォルダパスの取得
+
+        Returns:
+            str: textfile collectorの読み込みフォルダパス（空の場合は出力しない）
+        """
+        metrics_settings = self._config_data.get("metrics_settings", {})
+        prometheus_path = metrics_settings.get("prometheus_textfile_path", "")
+        return prometheus_path or ""
+
+    def batch_workers(self) -> int:
+        """バッチ実行の並列プロセス数の取得
+
+        Returns:
+            int: バッチ実行の並列プロセス数（0以下の場合はCPUコア数）
+        """
+        batch_settings = self._config_data.get("batch_settings", {})
+        workers = batch_settings.get("workers", 0)
+        return int(workers)
+
+    def batch_projects(self) -> List[Dict[str, str]]:
+        """バッチ実行のプロジェクトリストの取得
+
+        Returns:
+            List[Dict[str, str]]: プロジェクト名（project）とBTSのフィルタ文字列（prefix）の辞書リスト
+        """
+        batch_settings = self._config_data.get("batch_settings", {})
+        projects = batch_settings.get("projects", []) or []
+        return [
+            {'project': str(project.get("project", "")), 'prefix': str(project.get("prefix", "") or "")}
+            for project in projects if isinstance(project, dict)
+        ]
+
+    def watch_poll_interval_seconds(self) -> float:
+        """監視モードの入力ファイル確認間隔の取得
+
+        Returns:
+            float: 入力ファイルの確認間隔（秒）
+        """
+        watch_settings = self._config_data.get("watch_settings", {})
+        poll_interval_seconds = watch_settings.get("poll_interval_seconds", 2)
+        return float(poll_interval_seconds)
+
+    def watch_debounce_seconds(self) -> float:
+        """監視モードの変更確定待ち時間の取得
+
+        Returns:
+            float: 入力ファイルの変更後、変化がなくなってから変換を開始するまでの時間（秒）
+        """
+        watch_settings = self._config_data.get("watch_settings", {})
+        debounce_seconds = watch_settings.get("debounce_seconds", 3)
+        return float(debounce_seconds)
+
     def input_path(self) -> str:
         """入力パスの取得
         Returns:
@@ -190,10 +568,57 @@ class Config:
                     "url": "",
                     "api_key": "",
                     "input_file": "its.csv",
+                    "source": "csv",
+                    "fetch_workers": 4,
+                    "page_size": 100,
+                    "snapshot": False,
+                },
+                "load_settings": {
+                    "csv_engine": "c",
+                    "encoding": "auto",
+                    "parse_workers": 0,
+                    "cache": False,
+                    "cache_max_mb": 1024,
+                    "chunk_rows": 0,
                 },
                 "conversion_settings": {
                     "output_file": "output.csv",
+                    "output_formats": [],
+                    "plan_file": "plan.jsonl",
                     "date_range": -1,
+                    "engine": "row",
+                    "rules": [],
+                },
+                "entry_settings": {
+                    "workers": 1,
+                    "prefetch_batch_size": 100,
+                    "journal": False,
+                    "journal_retention_days": 30,
+                    "skip_unchanged": True,
+                    "rate_limit": 0,
+                    "rate_burst": 1,
+                    "max_retries": 3,
+                    "retry_backoff_seconds": 0.5,
+                    "retry_backoff_max_seconds": 30,
+                    "pool_size": 0,
+                },
+                "sync_settings": {
+                    "incremental": False,
+                    "full_interval_days": 7,
+                },
+                "metrics_settings": {
+                    "enabled": False,
+                    "output_file": "metrics.json",
+                    "memory_mode": "rss",
+                    "prometheus_textfile_path": "",
+                },
+                "batch_settings": {
+                    "workers": 0,
+                    "projects": [],
+                },
+                "watch_settings": {
+                    "poll_interval_seconds": 2,
+                    "debounce_seconds": 3,
                 },
             }
         else:
@@ -0,0 +1,3 @@
+from .change_plan import ChangePlan
+from .entry_journal import EntryJournal
+from .entry_writer import EntryWriter
\ No newline at end of file
@@ -0,0 +1,164 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import gzip
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+class ChangePlan:
+    """ITS起票計画ファイル管理クラス
+
+    変換結果の起票データをJSON Lines形式の計画ファイルに保存し、ITSへの登録時に読み込む。
+    1行目はヘッダー（フォーマットバージョン・入力ファイルのハッシュ・行データのチェックサム等）、
+    2行目以降はカラム順の値配列とする。ファイル名が.gzで終わる場合はgzip圧縮する。
+    """
+    #
+    # public定数
+    #
+    FORMAT_NAME = 'bts2its-plan'        # フォーマット名
+    FORMAT_VERSION = 1                  # フォーマットバージョン
+    #
+    # protected変数
+    #
+    _file_path: Path = None             # 計画ファイルパス
+    _header: Dict[str, Any] = None      # ヘッダー情報
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, file_path: Path) -> None:
+        """コンストラクタ
+
+        Args:
+            file_path (Path): 計画ファイルパス
+        """
+        self._file_path = Path(file_path)
+        self._header = {}
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def write(self, project_name: str, pd_its_entry: pd.DataFrame, input_paths: Dict[str, Path]) -> None:
+        """計画ファイルの書き込み
+
+        Args:
+            project_name (str): プロジェクト名
+            pd_its_entry (pd.DataFrame): ITS起票データ
+            input_paths (Dict[str, Path]): 入力データ種別（bts, its）と入力ファイルパスの辞書
+        """
+        # 行データをカラム順の値配列に変換してチェックサムを計算
+        columns = list(pd_its_entry.columns)
+        row_checksum = hashlib.blake2b()
+        lines = []
+        for values in pd_its_entry.itertuples(index=False, name=None):
+            line = json.dumps([self._to_json_value(value) for value in values], ensure_ascii=False, separators=(',', ':'))
+            row_checksum.update(line.encode('utf-8'))
+            lines.append(line)
+
+        self._header = {
+            'format': self.FORMAT_NAME,
+            'version': self.FORMAT_VERSION,
+            'project': project_name,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'inputs': {name: self._file_info(Path(path)) for name, path in input_paths.items()},
+            'columns': columns,
+            'rows': len(lines),
+            'checksum': row_checksum.hexdigest(),
+        }
+        # 書き込み途中で中断しても計画ファイルが壊れないよう一時ファイルから置き換える
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._file_path.with_name(self._file_path.name + '.tmp')
+        with self._open(temp_path, 'wt') as f:
+            f.write(json.dumps(self._header, ensure_ascii=False) + '\n')
+            for line in lines:
+                f.write(line + '\n')
+        os.replace(temp_path, self._file_path)
+
+    def read(self) -> List[dict]:
+        """計画ファイルの読み込み
+
+        フォーマット・行数・チェックサムを検証し、行データ辞書のリストを返す。
+
+        Raises:
+            ValueError: 計画ファイルのフォーマットが不正、または内容が破損している場合
+
+        Returns:
+            List[dict]: 行データ辞書のリスト（カラム名→値）
+        """
+        rows = []
+        row_checksum = hashlib.blake2b()
+        with self._open(self._file_path, 'rt') as f:
+            self._header = json.loads(f.readline() or '{}')
+            if self._header.get('format') != self.FORMAT_NAME or self._header.get('version') != self.FORMAT_VERSION:
+                raise ValueError(f'unsupported plan format: {self._header.get("format")} version {self._header.get("version")}')
+            columns = self._header.get('columns', [])
+            for line in f:
+                line = line.rstrip('\n')
+                row_checksum.update(line.encode('utf-8'))
+                rows.append(dict(zip(columns, json.loads(line))))
+        if len(rows) != self._header.get('rows') or row_checksum.hexdigest() != self._header.get('checksum'):
+            raise ValueError(f'plan file is corrupted: {self._file_path}')
+        return rows
+
+    def get_header(self) -> Dict[str, Any]:
+        """ヘッダー情報の取得
+
+        Returns:
+            Dict[str, Any]: ヘッダー情報（書き込み・読み込み前は空の辞書）
+        """
+        return self._header
+
+    #
+    # protectedメソッド
+    #
+    def _open(self, file_path: Path, mode: str):
+        """計画ファイルのオープン
+
+        Args:
+            file_path (Path): ファイルパス
+            mode (str): オープンモード（テキストモード）
+
+        Returns:
+            ファイルオブジェクト
+        """
+        if self._file_path.suffix == '.gz':
+            return gzip.open(file_path, mode, encoding='utf-8')
+        return open(file_path, mode, encoding='utf-8')
+
+    def _file_info(self, file_path: Path) -> Dict[str, Any]:
+        """入力ファイル情報の取得
+
+        Args:
+            file_path (Path): 入力ファイルパス
+
+        Returns:
+            Dict[str, Any]: ファイルパス・サイズ・内容ハッシュの辞書
+        """
+        file_hash = hashlib.blake2b()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                file_hash.update(block)
+        return {'path': str(file_path), 'size': file_path.stat().st_size, 'hash': file_hash.hexdigest()}
+
+    def _to_json_value(self, value: Any) -> Any:
+        """JSONに保存できる値への変換
+
+        Args:
+            value (Any): 変換する値
+
+        Returns:
+            Any: JSONに保存できる値（numpyの数値はPythonの数値、欠損値はNone）
+        """
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float) and np.isnan(value):
+            return None
+        return value
@@ -0,0 +1,216 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Any, List
+import hashlib
+import json
+import sqlite3
+
+class EntryJournal:
+    """ITS起票ジャーナル管理クラス
+
+    起票・更新の各操作を実行前に記録し、実行結果（起票したチケットID等）で更新する。
+    再実行時は完了済みの操作をスキップすることで、途中で中断した登録を重複なく再開できる。
+    完了済みの記録は全ての登録が完了した時点で削除し、以降の実行の同じ内容の操作を妨げないようにする。
+    """
+    #
+    # public定数
+    #
+    STATUS_PLANNED = 'planned'          # 実行予定
+    STATUS_STARTED = 'started'          # 実行開始（結果未確定）
+    STATUS_DONE = 'done'                # 完了
+    STATUS_FAILED = 'failed'            # 失敗
+    #
+    # protected変数
+    #
+    _journal_path: Path = None          # ジャーナルファイルパス
+    _connection: sqlite3.Connection = None  # SQLite接続オブジェクト
+    _lock: Lock = None                  # 排他制御オブジェクト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, journal_path: Path, retention_days: int = 30) -> None:
+        """コンストラクタ
+
+        Args:
+            journal_path (Path): ジャーナルファイルパス
+            retention_days (int, optional): 操作記録の保持日数. デフォルトは30.
+        """
+        self._journal_path = Path(journal_path)
+        self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(str(self._journal_path), check_same_thread=False)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS operations ('
+                ' op_key TEXT PRIMARY KEY,'
+                ' operation TEXT,'
+                ' issue_id TEXT,'
+                ' title TEXT,'
+                ' status TEXT,'
+                ' result_id TEXT,'
+                ' error TEXT,'
+                ' updated_at TEXT)'
+            )
+            # 保持日数を超えた操作記録を削除
+            expired_at = (datetime.now() - timedelta(days=retention_days)).isoformat(timespec='seconds')
+            self._connection.execute('DELETE FROM operations WHERE updated_at < ?', (expired_at,))
+            self._connection.commit()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        self.close()
+
+    #
+    # publicメソッド
+    #
+    def operation_key(self, row_data: dict) -> str:
+        """操作キーの取得
+
+        Args:
+            row_data (dict): 起票データの行データ辞書
+
+        Returns:
+            str: 行データの内容から求めた操作キー
+        """
+        source = json.dumps(row_data, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def get_status(self, op_keys: List[str]) -> dict:
+        """操作の状態取得
+
+        Args:
+            op_keys (List[str]): 操作キーリスト
+
+        Returns:
+            dict: 操作キーと状態の辞書（記録のない操作は含まない）
+        """
+        statuses = {}
+        with self._lock:
+            for start in range(0, len(op_keys), 500):
+                batch_keys = op_keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch_keys))
+                for op_key, status in self._connection.execute(f'SELECT op_key, status FROM operations WHERE op_key IN ({placeholders})', batch_keys):
+                    statuses[op_key] = status
+        return statuses
+
+    def plan(self, op_key: str, operation: str, issue_id: str, title: str) -> None:
+        """実行予定の操作記録
+
+        Args:
+            op_key (str): 操作キー
+            operation (str): 操作種別
+            issue_id (str): 更新対象のチケットID（新規起票の場合は空文字）
+            title (str): 題名
+        """
+        with self._lock:
+            self._connection.execute(
+                'INSERT INTO operations (op_key, operation, issue_id, title, status, updated_at) VALUES (?, ?, ?, ?, ?, ?)'
+                ' ON CONFLICT(op_key) DO UPDATE SET updated_at = excluded.updated_at',
+                (op_key, operation, issue_id, title, self.STATUS_PLANNED, self._now()),
+            )
+
+    def commit(self) -> None:
+        """操作記録の確定
+        """
+        with self._lock:
+            self._connection.commit()
+
+    def mark_started(self, op_key: str) -> None:
+        """操作の実行開始記録
+
+        Args:
+            op_key (str): 操作キー
+        """
+        self._update(op_key, self.STATUS_STARTED, None, None)
+
+    def mark_done(self, op_key: str, result_id: Any) -> None:
+        """操作の完了記録
+
+        Args:
+            op_key (str): 操作キー
+            result_id (Any): 実行結果のチケットID
+        """
+        self._update(op_key, self.STATUS_DONE, None if result_id is None else str(result_id), None)
+
+    def mark_failed(self, op_key: str, error: str) -> None:
+        """操作の失敗記録
+
+        Args:
+            op_key (str): 操作キー
+            error (str): エラー内容
+        """
+        self._update(op_key, self.STATUS_FAILED, None, error)
+
+    def get_in_doubt_creates(self, op_keys: List[str]) -> dict:
+        """結果未確定の新規起票の取得
+
+        Args:
+            op_keys (List[str]): 操作キーリスト
+
+        Returns:
+            dict: 実行開始のみ記録された新規起票（チケットIDの指定なし）の操作キーと題名の辞書
+        """
+        in_doubt = {}
+        with self._lock:
+            for start in range(0, len(op_keys), 500):
+                batch_keys = op_keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch_keys))
+                query = f"SELECT op_key, title FROM operations WHERE op_key IN ({placeholders}) AND status = ? AND issue_id = ''"
+                for op_key, title in self._connection.execute(query, [*batch_keys, self.STATUS_STARTED]):
+                    in_doubt[op_key] = title
+        return in_doubt
+
+    def clear_done(self) -> int:
+        """完了済みの操作記録の削除
+
+        全ての起票データの登録が完了した後に呼び出し、以降の実行で同じ内容の操作
+        （バージョンを以前の値に戻す、再オープンされたチケットを再度終了する等）がスキップされないようにする。
+
+        Returns:
+            int: 削除した操作記録数
+        """
+        with self._lock:
+            cursor = self._connection.execute('DELETE FROM operations WHERE status = ?', (self.STATUS_DONE,))
+            self._connection.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """ジャーナルのクローズ
+        """
+        if self._connection is not None:
+            with self._lock:
+                self._connection.commit()
+                self._connection.close()
+            self._connection = None
+
+    #
+    # protectedメソッド
+    #
+    def _update(self, op_key: str, status: str, result_id: Any, error: Any) -> None:
+        """操作の状態更新
+
+        Args:
+            op_key (str): 操作キー
+            status (str): 状態
+            result_id (Any): 実行結果のチケットID
+            error (Any): エラー内容
+        """
+        with self._lock:
+            self._connection.execute(
+                'UPDATE operations SET status = ?, result_id = ?, error = ?, updated_at = ? WHERE op_key = ?',
+                (status, result_id, error, self._now(), op_key),
+            )
+            self._connection.commit()
+
+    def _now(self) -> str:
+        """現在日時文字列の取得
+
+        Returns:
+            str: 現在日時（ISO形式）
+        """
+        return datetime.now().isoformat(timespec='seconds')
@@ -0,0 +1,196 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+class EntryWriter:
+    """ITS起票データの出力クラス
+
+    起票データを作成された順に追記し、一定行数毎にまとめてファイルに書き込む。
+    CSVファイル（utf-8-sig）は一括で書き込んだ場合と同一の内容とし、分析用にParquet・Arrow IPC形式でも出力できる。
+    Parquet・Arrow IPC形式は全カラムを文字列型（欠損値はnull）で出力し、CSVファイルと同じフォルダに拡張子を変えて保存する。
+    """
+    #
+    # public定数
+    #
+    FORMAT_PARQUET = 'parquet'          # Parquet形式
+    FORMAT_ARROW = 'arrow'              # Arrow IPC（Feather V2）形式
+    #
+    # protected変数
+    #
+    _file_path: Path = None             # CSVファイルパス
+    _formats: List[str] = None          # CSVに加えて出力する形式リスト
+    _buffer_rows: int = 50000           # まとめて書き込む行数
+    _buffer: List[pd.DataFrame] = None  # 書き込み待ちの起票データリスト
+    _buffered_rows: int = 0             # 書き込み待ちの行数
+    _columns: List[str] = None          # 起票データのカラムリスト（最初の追記時に設定）
+    _csv_file: Any = None               # CSVファイルオブジェクト
+    _csv_header: bool = True            # CSVヘッダー書き込み要否
+    _arrow_writers: Dict[str, Any] = None   # 形式毎のArrow書き込みオブジェクト
+    _rows: int = 0                      # 書き込んだ行数
+    #
+    # protected定数
+    #
+    _FILE_BUFFER_BYTES = 1 << 20        # CSVファイルの書き込みバッファサイズ（バイト）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, file_path: Path, formats: Optional[List[str]] = None, buffer_rows: int = 50000) -> None:
+        """コンストラクタ
+
+        Args:
+            file_path (Path): CSVファイルパス
+            formats (Optional[List[str]], optional): CSVに加えて出力する形式リスト（parquet, arrow）. デフォルトはNone（CSVのみ）.
+            buffer_rows (int, optional): まとめて書き込む行数. デフォルトは50000.
+        """
+        self._file_path = Path(file_path)
+        self._formats = []
+        for output_format in formats or []:
+            if output_format not in (self.FORMAT_PARQUET, self.FORMAT_ARROW):
+                print(f'unknown entry output format: {output_format}')
+            elif output_format not in self._formats:
+                self._formats.append(output_format)
+        self._buffer_rows = max(int(buffer_rows), 1)
+        self._buffer = []
+        self._arrow_writers = {}
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    def __enter__(self) -> 'EntryWriter':
+        """withブロック開始（ファイルのオープン）
+
+        Returns:
+            EntryWriter: 自身のオブジェクト
+        """
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """withブロック終了（書き込み待ちの起票データの書き込みとファイルのクローズ）
+        """
+        self.close()
+
+    #
+    # publicメソッド
+    #
+    def open(self) -> None:
+        """ファイルのオープン
+        """
+        if not self._file_path.parent.exists():
+            # 親ディレクトリが存在しない場合は作成する
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._csv_file = open(self._file_path, 'w', encoding='utf-8-sig', newline='', buffering=self._FILE_BUFFER_BYTES)
+        self._csv_header = True
+        self._rows = 0
+
+    def write(self, pd_its_entry: pd.DataFrame) -> None:
+        """起票データの追記
+
+        Args:
+            pd_its_entry (pd.DataFrame): 追記する起票データ
+        """
+        if self._columns is None:
+            self._columns = list(pd_its_entry.columns)
+        # 一括で渡された大きな起票データは書き込み単位に分割する
+        for start in range(0, len(pd_its_entry), self._buffer_rows):
+            pd_block = pd_its_entry.iloc[start:start + self._buffer_rows]
+            self._buffer.append(pd_block)
+            self._buffered_rows += len(pd_block)
+            if self._buffered_rows >= self._buffer_rows:
+                self._flush()
+
+    def close(self) -> None:
+        """書き込み待ちの起票データの書き込みとファイルのクローズ
+        """
+        if self._csv_file is None:
+            return
+        try:
+            self._flush()
+            # 起票データがない場合もヘッダー（カラム定義）は出力する
+            if self._rows == 0 and self._columns is not None:
+                pd_empty = pd.DataFrame(columns=self._columns)
+                pd_empty.to_csv(self._csv_file, index=False)
+                if len(self._formats) > 0:
+                    self._write_arrow(pd_empty)
+            self._csv_file.close()
+            self._csv_file = None
+        finally:
+            for arrow_writer in self._arrow_writers.values():
+                arrow_writer.close()
+            self._arrow_writers = {}
+
+    def get_rows(self) -> int:
+        """書き込んだ行数の取得
+
+        Returns:
+            int: 書き込んだ行数
+        """
+        return self._rows
+
+    def get_file_paths(self) -> List[Path]:
+        """出力ファイルパスの取得
+
+        Returns:
+            List[Path]: CSVファイルと追加形式のファイルパスリスト
+        """
+        return [self._file_path] + [self._format_path(output_format) for output_format in self._formats]
+
+    #
+    # protectedメソッド
+    #
+    def _flush(self) -> None:
+        """書き込み待ちの起票データの書き込み
+        """
+        if len(self._buffer) == 0:
+            return
+        pd_block = self._buffer[0] if len(self._buffer) == 1 else pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+        if len(pd_block) == 0:
+            return
+        pd_block.to_csv(self._csv_file, index=False, header=self._csv_header)
+        self._csv_header = False
+        if len(self._formats) > 0:
+            self._write_arrow(pd_block)
+        self._rows += len(pd_block)
+
+    def _write_arrow(self, pd_block: pd.DataFrame) -> None:
+        """Parquet・Arrow IPC形式の書き込み
+
+        pyarrowがインストールされていない場合は追加形式の出力を中止する。
+
+        Args:
+            pd_block (pd.DataFrame): 書き込む起票データ
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pa_parquet
+        except ImportError:
+            print(f"pyarrow is not installed. {', '.join(self._formats)} output is skipped.")
+            self._formats = []
+            return
+
+        # 値の型が行毎に異なるカラム（親チケットID等）があるため全カラムを文字列型で出力
+        schema = pa.schema([(column, pa.string()) for column in self._columns])
+        table = pa.Table.from_pandas(pd_block.astype('string'), schema=schema, preserve_index=False)
+        for output_format in self._formats:
+            if output_format not in self._arrow_writers:
+                if output_format == self.FORMAT_PARQUET:
+                    self._arrow_writers[output_format] = pa_parquet.ParquetWriter(self._format_path(output_format), schema)
+                else:
+                    self._arrow_writers[output_format] = pa.ipc.new_file(self._format_path(output_format), schema)
+            self._arrow_writers[output_format].write_table(table)
+
+    def _format_path(self, output_format: str) -> Path:
+        """追加形式のファイルパスの取得
+
+        Args:
+            output_format (str): 出力形式（parquet, arrow）
+
+        Returns:
+            Path: CSVファイルの拡張子を出力形式に変更したファイルパス
+        """
+        return self._file_path.with_suffix(f'.{output_format}')
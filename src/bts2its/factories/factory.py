@@ -5,6 +5,7 @@ import importlib
 class Factory:
     _instance : Optional[object] = None
     _cached_type : Optional[type] = None
+    _cached_project : Optional[tuple] = None
 
     #
     # コンストラクタ / デストラクタ
@@ -33,11 +34,12 @@ class Factory:
         Returns:
             AbstractConverter: AbstractConverterオブジェクト
         """
-        # 同じ型のアダプターがキャッシュされている場合はそれを返す（シングルトン）
-        if cls._instance is not None and cls._cached_type == adaptor_type_name:
+        # 同じ型・同じプロジェクトのアダプターがキャッシュされている場合はそれを返す（シングルトン）
+        # バッチ実行では1プロセスで複数プロジェクトを処理するため、プロジェクトが異なる場合は生成し直す
+        if cls._instance is not None and cls._cached_type == adaptor_type_name and cls._cached_project == (project_name, bts_prefix):
             return cls._instance
 
-        if adaptor_type_name is None:
+        if not adaptor_type_name:
             # デフォルトで必要なモジュールをインポート
             from bts2its.adaptors import DefaultConverterAdaptor
             # adaptor_type_nameが指定されていない場合はデフォルトのアダプターを使用
@@ -50,6 +52,7 @@ class Factory:
             adaptor_class = getattr(module, class_name)
             cls._instance = adaptor_class(project_name, bts_prefix)
             cls._cached_type = adaptor_type_name
+        cls._cached_project = (project_name, bts_prefix)
 
         # 生成したアダプターを返す
         return cls._instance
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 class AbstractBts2Its(ABC):
     """BTSからITSへの変換抽象クラス
@@ -59,6 +60,16 @@ class AbstractBts2Its(ABC):
         """
         pass
 
+    def load_its_issues(self, issues: List[Dict[str, Any]]) -> None:
+        """Issue管理データ（REST APIの取得結果）の読み取り
+
+        ITSからの直接取得に対応する場合にオーバーライドする。
+
+        Args:
+            issues (List[Dict[str, Any]]): REST APIのチケットデータ（JSON）のリスト
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} does not support loading ITS issues from REST API.')
+
     @abstractmethod
     def bts_to_its(self) -> None:
         """BTSからITSへの起票データ作成
@@ -72,4 +83,49 @@ class AbstractBts2Its(ABC):
         Returns:
             pd.DataFrame: Pandas.DataFrame型
         """
-        return self._pd_its_entry       # ITS起票データ
\ No newline at end of file
+        return self._pd_its_entry       # ITS起票データ
+
+    def iter_bts_to_its(self, file_path: Path) -> Iterator[pd.DataFrame]:
+        """BTSデータの分割読み込みと起票データ作成
+
+        ITSデータを読み込んだ後に呼び出す。分割読み込みに対応する場合にオーバーライドする。
+        デフォルトはBTSデータを一括で読み込み、全行の起票データを1回で返す。
+
+        Args:
+            file_path (Path): BTSデータのファイルパス
+
+        Yields:
+            pd.DataFrame: 分割したBTSデータ毎のITS起票データ
+        """
+        self.load_bts(file_path)
+        self.bts_to_its()
+        yield self.get_its_entry_data()
+
+    def get_row_counts(self) -> dict:
+        """データ行数の取得
+
+        Returns:
+            dict: BTSデータ（bts）・ITSデータ（its）・ITS起票データ（its_entry）の行数の辞書
+        """
+        return {
+            'bts': len(self._pd_bts),
+            'its': len(self._pd_its),
+            'its_entry': len(self._pd_its_entry),
+        }
+
+    def set_full_sync(self, full_sync: bool) -> None:
+        """全件同期フラグ設定
+
+        差分同期に対応する場合にオーバーライドする。
+
+        Args:
+            full_sync (bool): 差分同期の状態を使用せず全件を変換する場合True
+        """
+        pass
+
+    def save_sync_state(self) -> None:
+        """差分同期の状態保存
+
+        差分同期に対応する場合にオーバーライドする。
+        """
+        pass
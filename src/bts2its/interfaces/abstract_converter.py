@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from bts2its.interfaces.abstract_bts2its import AbstractBts2Its
 from its_accessor import AbstractItsAccessor
 from pathlib import Path
+from typing import Optional, Set
 
 class AbstractConverter(ABC):
     """BTSからITSへの変換抽象クラス
@@ -29,21 +30,83 @@ class AbstractConverter(ABC):
     # publicメソッド
     #
     @abstractmethod
-    def convert(self, bts_data_path: Path, its_data_path: Path) -> None:
+    def convert(self, bts_data_path: Path, its_data_path: Optional[Path]) -> None:
         """BTSからITSへの変換
 
         Args:
             bts_data_path (Path): BTSデータファイルパス
-            its_data_path (Path): ITSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
         """
         pass
 
+    def convert_stream(self, bts_data_path: Path, its_data_path: Optional[Path], output_file_path: Path, entry: bool = True) -> None:
+        """BTSからITSへの分割変換
+
+        BTSデータを分割して変換し、起票データをCSVファイルへの追記とITSへの登録に順次渡す。
+        分割変換に対応する場合にオーバーライドする。デフォルトは一括で変換し、CSVファイル保存とITSへの登録を行う。
+
+        Args:
+            bts_data_path (Path): BTSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
+            output_file_path (Path): 起票データのCSVファイルパス
+            entry (bool, optional): ITSに起票する場合True. デフォルトはTrue.
+        """
+        self.convert(bts_data_path, its_data_path)
+        self.save_csv(output_file_path)
+        if entry:
+            self.entry_its()
+
+    def convert_changed(self, bts_data_path: Path, its_data_path: Optional[Path], changed_inputs: Set[str]) -> None:
+        """変更された入力データのみ読み込み直したBTSからITSへの変換
+
+        変更されていない入力データは前回読み込んだデータを再利用する（監視モードで使用）。
+        再利用に対応する場合にオーバーライドする。デフォルトは全ての入力データを読み込んで変換する。
+
+        Args:
+            bts_data_path (Path): BTSデータファイルパス
+            its_data_path (Optional[Path]): ITSデータファイルパス（Noneの場合はITSから直接取得）
+            changed_inputs (Set[str]): 変更された入力データの種別（bts, its）の集合
+        """
+        self.convert(bts_data_path, its_data_path)
+
+    def set_full_sync(self, full_sync: bool) -> None:
+        """全件同期フラグ設定
+
+        以降の変換で差分同期の状態を使用しない場合に、変換前に呼び出す。
+        差分同期に対応する場合にオーバーライドする。デフォルトは指定を無視する。
+
+        Args:
+            full_sync (bool): 差分同期の状態を使用せず全件を変換する場合True
+        """
+        if full_sync:
+            print(f'{self.__class__.__name__} does not support incremental sync. full sync option is ignored.')
+
     @abstractmethod
     def entry_its(self) -> None:
         """ITSへの起票データ登録
         """
         pass
 
+    def save_plan(self, file_path: Path) -> None:
+        """ITS起票計画ファイル保存
+
+        起票計画ファイルに対応する場合にオーバーライドする。
+
+        Args:
+            file_path (Path): 保存ファイルパス
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} does not support saving entry plans.')
+
+    def apply_plan(self, file_path: Path) -> None:
+        """ITS起票計画ファイルの登録
+
+        起票計画ファイルに対応する場合にオーバーライドする。
+
+        Args:
+            file_path (Path): 計画ファイルパス
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} does not support applying entry plans.')
+
     @abstractmethod
     def save_csv(self, file_path: Path) -> None:
         """CSVファイル保存
@@ -51,4 +114,29 @@ class AbstractConverter(ABC):
         Args:
             file_path (Path): 保存ファイルパス
         """
-        pass
\ No newline at end of file
+        pass
+
+    def save_metrics(self, file_path: Path, prometheus_file_path: Optional[Path] = None) -> None:
+        """処理段階毎の計測結果保存
+
+        処理段階毎の計測に対応する場合にオーバーライドする。デフォルトは保存せず、非対応の旨を表示する
+        （計測の保存は変換・起票の完了後に行うため、非対応でも実行を失敗させない）。
+
+        Args:
+            file_path (Path): JSONファイルパス
+            prometheus_file_path (Optional[Path], optional): Prometheus textfile形式のファイルパス. デフォルトはNone（出力しない）.
+        """
+        print(f'{self.__class__.__name__} does not support stage metrics.')
+
+    def supports_its_source(self, its_source: str) -> bool:
+        """ITSデータの取得元の対応判定
+
+        ITSから直接取得（rest）に対応する場合にオーバーライドする。
+
+        Args:
+            its_source (str): ITSデータの取得元（csv, rest）
+
+        Returns:
+            bool: 取得元に対応している場合True
+        """
+        return its_source != 'rest'
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .export_cache import ExportCache
+from .encoding_detector import EncodingDetector
+from .csv_loader import CsvLoader
\ No newline at end of file
@@ -0,0 +1,483 @@
+from bts2its.common import CsvLoadStats
+from bts2its.loaders.encoding_detector import EncodingDetector
+from bts2its.loaders.export_cache import ExportCache
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import io
+import json
+import os
+import time
+import pandas as pd
+
+class CsvLoader:
+    """CSVファイル読み込みクラス
+
+    カラム型を明示して型推定を省略し、指定されたエンジンでCSVファイルを読み込む。
+    読み込み時間とメモリ使用量を統計情報として記録する。
+    キャッシュが指定された場合は、入力ファイルが変更されていなければキャッシュから読み込む。
+    文字コードは標本から判定（UTF-8, CP932）し、デコードできないバイト列の置換件数を記録する。
+    大きなファイルはレコード境界で分割したバイト範囲を並列に解析する（cエンジンのみ）。
+    """
+    #
+    # public定数
+    #
+    ENGINE_C = 'c'                      # pandas標準（C実装）エンジン
+    ENGINE_PYTHON = 'python'            # pandas Python実装エンジン
+    ENGINE_PYARROW = 'pyarrow'          # pyarrowエンジン（マルチスレッド読み込み）
+    ENGINE_CACHE = 'cache'              # キャッシュからの読み込み（統計情報用）
+    #
+    # protected変数
+    #
+    _engine: str = ENGINE_C             # 読み込みエンジン
+    _encoding: str = 'auto'             # 文字コード（autoの場合はファイル毎に判定）
+    _parse_workers: int = 1             # 並列解析のスレッド数（1の場合は並列解析しない）
+    _detector: EncodingDetector = None  # 文字コード判定オブジェクト
+    _last_stats: CsvLoadStats = None    # 直近の読み込み統計情報
+    _cache: ExportCache = None          # 読み込み済みデータのキャッシュ（Noneの場合はキャッシュしない）
+    #
+    # protected定数
+    #
+    _FILTER_CHUNK_ROWS = 100000         # 前方一致で抽出する場合の1回の読み込み行数
+    _PARALLEL_MIN_BYTES = 32 * 1024 * 1024  # 並列解析するファイルサイズの下限（バイト）
+    _UTF8_ENCODINGS = ('utf-8', 'utf-8-sig', 'utf8', 'utf_8', 'utf_8_sig')  # 変換せずに解析する文字コード
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, engine: str = ENGINE_C, cache: Optional[ExportCache] = None, encoding: str = EncodingDetector.ENCODING_AUTO, parse_workers: int = 0) -> None:
+        """コンストラクタ
+
+        Args:
+            engine (str, optional): 読み込みエンジン（c, python, pyarrow）. デフォルトはc.
+            cache (Optional[ExportCache], optional): 読み込み済みデータのキャッシュ. デフォルトはNone（キャッシュしない）.
+            encoding (str, optional): 文字コード（autoの場合はファイル毎に判定）. デフォルトはauto.
+            parse_workers (int, optional): 並列解析のスレッド数（0の場合はCPUコア数（最大8）、1の場合は並列解析しない）. デフォルトは0.
+        """
+        self._engine = engine if engine in (self.ENGINE_C, self.ENGINE_PYTHON, self.ENGINE_PYARROW) else self.ENGINE_C
+        self._cache = cache
+        self._encoding = encoding or EncodingDetector.ENCODING_AUTO
+        self._parse_workers = int(parse_workers) if int(parse_workers) > 0 else min(os.cpu_count() or 1, 8)
+        self._detector = EncodingDetector()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def load(self, file_path: Path, columns: Optional[List[str]] = None, dtypes: Optional[Dict[str, str]] = None, prefix_filters: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """CSVファイルの読み込み
+
+        Args:
+            file_path (Path): CSVファイルパス
+            columns (Optional[List[str]], optional): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Optional[Dict[str, str]], optional): カラム名と型（str, category, int64等）の辞書. 指定のないカラムは型推定する.
+            prefix_filters (Optional[Dict[str, str]], optional): カラム名と前方文字列の辞書. 指定した場合は値が前方一致する行のみ読み込む（欠損値の行は除外）.
+
+        Returns:
+            pd.DataFrame: 読み込んだDataFrame
+        """
+        start_time = time.perf_counter()
+        # 文字コードを判定し、ファイルに存在するカラムの型指定のみ使用する
+        encoding = self._detect_encoding(file_path)
+        target_dtypes = self._target_dtypes(file_path, columns, dtypes, encoding)
+        prefix_filters = {column: prefix for column, prefix in (prefix_filters or {}).items() if prefix != ''}
+
+        # キャッシュが有効な場合はキャッシュから読み込む
+        signature = json.dumps({'columns': columns, 'dtypes': target_dtypes, 'prefix_filters': prefix_filters, 'encoding': encoding}, ensure_ascii=False, sort_keys=True)
+        pd_data = self._cache.load(file_path, signature) if self._cache is not None else None
+        engine = self._engine if pd_data is None else self.ENGINE_CACHE
+        read_rows = None
+        workers = 1
+        EncodingDetector.reset_errors()
+        decode_errors = 0
+        if engine == self.ENGINE_PYARROW:
+            try:
+                pd_data, read_rows = self._read_pyarrow(file_path, columns, target_dtypes, encoding, prefix_filters)
+            except ImportError:
+                print('pyarrow is not installed. fallback to c engine.')
+                engine = self.ENGINE_C
+            except Exception as e:
+                print(f'pyarrow load error. fallback to c engine. {e}')
+                engine = self.ENGINE_C
+        if engine == self.ENGINE_C and self._parse_workers > 1 and os.path.getsize(file_path) >= self._PARALLEL_MIN_BYTES:
+            # 大きなファイルはバイト範囲を分割して並列に解析
+            parallel_result = self._read_parallel(file_path, columns, target_dtypes, encoding, prefix_filters)
+            if parallel_result is not None:
+                pd_data, read_rows, decode_errors, workers = parallel_result
+        if workers == 1 and engine in (self.ENGINE_C, self.ENGINE_PYTHON) and len(prefix_filters) > 0:
+            pd_data, read_rows = self._read_filtered(file_path, columns, target_dtypes, engine, encoding, prefix_filters)
+        elif workers == 1 and engine in (self.ENGINE_C, self.ENGINE_PYTHON):
+            pd_data = pd.read_csv(file_path, usecols=columns, dtype=target_dtypes, engine=engine, encoding=encoding, encoding_errors=EncodingDetector.ERROR_HANDLER)
+        decode_errors += EncodingDetector.get_errors()
+        # 読み込んだデータをキャッシュに保存
+        if self._cache is not None and engine != self.ENGINE_CACHE:
+            self._cache.save(file_path, signature, pd_data)
+
+        # 統計情報を記録
+        self._last_stats = CsvLoadStats(
+            file_path=str(file_path),
+            engine=engine,
+            rows=len(pd_data),
+            seconds=time.perf_counter() - start_time,
+            memory_bytes=int(pd_data.memory_usage(deep=True).sum()),
+            encoding=encoding,
+            decode_errors=decode_errors,
+        )
+        filtered = f'/{read_rows}' if read_rows is not None else ''
+        details = (f', encoding={encoding}' if encoding != EncodingDetector.ENCODING_UTF8 else '') + (f', workers={workers}' if workers > 1 else '')
+        print(f"CSV loaded: {self._last_stats['file_path']} (engine={engine}, rows={self._last_stats['rows']}{filtered}, time={self._last_stats['seconds']:.3f}s, memory={self._last_stats['memory_bytes'] / 1024 / 1024:.1f}MB{details})")
+        self._print_decode_errors(file_path, encoding, decode_errors)
+        return pd_data
+
+    def iter_chunks(self, file_path: Path, chunk_rows: int, columns: Optional[List[str]] = None, dtypes: Optional[Dict[str, str]] = None, prefix_filters: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+        """CSVファイルの分割読み込み
+
+        指定行数ずつ読み込んだDataFrameを順に返す。ファイル全体をメモリに展開しないため、キャッシュは使用しない。
+        pyarrowエンジンが指定された場合はc（標準）エンジンで読み込む。
+        統計情報のメモリ使用量は、分割したDataFrameの最大値を記録する。
+
+        Args:
+            file_path (Path): CSVファイルパス
+            chunk_rows (int): 1回に読み込む行数
+            columns (Optional[List[str]], optional): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Optional[Dict[str, str]], optional): カラム名と型の辞書. 指定のないカラムは型推定する.
+            prefix_filters (Optional[Dict[str, str]], optional): カラム名と前方文字列の辞書. 指定した場合は値が前方一致する行のみ返す.
+
+        Yields:
+            pd.DataFrame: 分割して読み込んだDataFrame（行インデックスはファイル先頭からの通し番号）
+        """
+        start_time = time.perf_counter()
+        encoding = self._detect_encoding(file_path)
+        target_dtypes = self._target_dtypes(file_path, columns, dtypes, encoding)
+        engine = self._engine if self._engine != self.ENGINE_PYARROW else self.ENGINE_C
+        prefix_filters = {column: prefix for column, prefix in (prefix_filters or {}).items() if prefix != ''}
+        rows = 0
+        memory_bytes = 0
+        decode_errors = 0
+        EncodingDetector.reset_errors()
+        with pd.read_csv(file_path, usecols=columns, dtype=target_dtypes, engine=engine, encoding=encoding, encoding_errors=EncodingDetector.ERROR_HANDLER, chunksize=max(int(chunk_rows), 1)) as reader:
+            while True:
+                # 分割毎の置換件数を数える（呼び出し側の処理中に他の読み込みが行われても混在しない）
+                pd_chunk = next(reader, None)
+                decode_errors += EncodingDetector.get_errors()
+                EncodingDetector.reset_errors()
+                if pd_chunk is None:
+                    break
+                pd_chunk = self._filter_prefix(pd_chunk, prefix_filters)
+                rows += len(pd_chunk)
+                memory_bytes = max(memory_bytes, int(pd_chunk.memory_usage(deep=True).sum()))
+                yield pd_chunk
+
+        # 統計情報を記録（処理時間は呼び出し側の処理時間を含む）
+        self._last_stats = CsvLoadStats(
+            file_path=str(file_path),
+            engine=engine,
+            rows=rows,
+            seconds=time.perf_counter() - start_time,
+            memory_bytes=memory_bytes,
+            encoding=encoding,
+            decode_errors=decode_errors,
+        )
+        details = f', encoding={encoding}' if encoding != EncodingDetector.ENCODING_UTF8 else ''
+        print(f"CSV streamed: {self._last_stats['file_path']} (engine={engine}, rows={rows}, chunk={chunk_rows}, time={self._last_stats['seconds']:.3f}s, max chunk memory={memory_bytes / 1024 / 1024:.1f}MB{details})")
+        self._print_decode_errors(file_path, encoding, decode_errors)
+
+    def get_last_stats(self) -> CsvLoadStats:
+        """直近の読み込み統計情報取得
+
+        Returns:
+            CsvLoadStats: 読み込み統計情報（未読み込みの場合はNone）
+        """
+        return self._last_stats
+
+    #
+    # protectedメソッド
+    #
+    def _detect_encoding(self, file_path: Path) -> str:
+        """文字コードの取得
+
+        Args:
+            file_path (Path): CSVファイルパス
+
+        Returns:
+            str: 指定された文字コード（autoの場合は判定した文字コード）
+        """
+        if self._encoding != EncodingDetector.ENCODING_AUTO:
+            return self._encoding
+        return self._detector.detect(file_path)
+
+    def _print_decode_errors(self, file_path: Path, encoding: str, decode_errors: int) -> None:
+        """デコードエラーの置換件数の出力
+
+        Args:
+            file_path (Path): CSVファイルパス
+            encoding (str): 文字コード
+            decode_errors (int): 置換件数
+        """
+        if decode_errors > 0:
+            print(f'CSV decode error: {file_path} ({decode_errors} invalid byte sequences replaced, encoding={encoding})')
+
+    def _target_dtypes(self, file_path: Path, columns: Optional[List[str]], dtypes: Optional[Dict[str, str]], encoding: str) -> Dict[str, str]:
+        """ファイルに存在するカラムの型指定の取得
+
+        Args:
+            file_path (Path): CSVファイルパス
+            columns (Optional[List[str]]): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Optional[Dict[str, str]]): カラム名と型の辞書
+            encoding (str): 文字コード
+
+        Returns:
+            Dict[str, str]: 読み込むカラムのうちファイルに存在するカラムの型指定
+        """
+        header = self._read_header(file_path, encoding)
+        target_columns = columns if columns is not None else header
+        return {column: dtype for column, dtype in (dtypes or {}).items() if column in header and column in target_columns}
+
+    def _read_header(self, file_path: Path, encoding: str) -> List[str]:
+        """ヘッダー行の読み込み
+
+        Args:
+            file_path (Path): CSVファイルパス
+            encoding (str): 文字コード
+
+        Returns:
+            List[str]: カラム名リスト
+        """
+        return list(pd.read_csv(file_path, nrows=0, encoding=encoding, encoding_errors='replace').columns)
+
+    def _read_filtered(self, file_path: Path, columns: Optional[List[str]], dtypes: Dict[str, str], engine: str, encoding: str, prefix_filters: Dict[str, str]) -> Tuple[pd.DataFrame, int]:
+        """前方一致する行のみのCSVファイルの読み込み
+
+        一定行数ずつ読み込んで前方一致しない行を除外し、一致した行のみ結合する。
+        カテゴリ型は分割毎にカテゴリが異なるため文字列で読み込み、結合後に変換する。
+
+        Args:
+            file_path (Path): CSVファイルパス
+            columns (Optional[List[str]]): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Dict[str, str]): カラム名と型の辞書
+            engine (str): 読み込みエンジン（c, python）
+            encoding (str): 文字コード
+            prefix_filters (Dict[str, str]): カラム名と前方文字列の辞書
+
+        Returns:
+            Tuple[pd.DataFrame, int]: (読み込んだDataFrame, フィルタ前の行数)
+        """
+        read_dtypes = {column: ('str' if dtype == 'category' else dtype) for column, dtype in dtypes.items()}
+        pd_chunks = []
+        read_rows = 0
+        with pd.read_csv(file_path, usecols=columns, dtype=read_dtypes, engine=engine, encoding=encoding, encoding_errors=EncodingDetector.ERROR_HANDLER, chunksize=self._FILTER_CHUNK_ROWS) as reader:
+            for pd_chunk in reader:
+                read_rows += len(pd_chunk)
+                pd_chunks.append(self._filter_prefix(pd_chunk, prefix_filters))
+        if len(pd_chunks) > 0:
+            pd_data = pd.concat(pd_chunks, ignore_index=True)
+        else:
+            pd_data = pd.read_csv(file_path, usecols=columns, dtype=read_dtypes, engine=engine, encoding=encoding, encoding_errors=EncodingDetector.ERROR_HANDLER, nrows=0)
+        return self._to_category(pd_data, dtypes), read_rows
+
+    def _to_category(self, pd_data: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+        """文字列で読み込んだカラムのカテゴリ型への変換
+
+        全て欠損値のカラムは一括で読み込んだ場合と同様にカテゴリの型をobject型とする。
+
+        Args:
+            pd_data (pd.DataFrame): 変換対象のDataFrame
+            dtypes (Dict[str, str]): カラム名と型の辞書
+
+        Returns:
+            pd.DataFrame: カテゴリ型を指定したカラムを変換したDataFrame
+        """
+        for column, dtype in dtypes.items():
+            if dtype != 'category' or column not in pd_data.columns:
+                continue
+            values = pd_data[column] if pd_data[column].notna().any() else pd_data[column].astype(object)
+            pd_data[column] = values.astype('category')
+        return pd_data
+
+    def _filter_prefix(self, pd_data: pd.DataFrame, prefix_filters: Dict[str, str]) -> pd.DataFrame:
+        """前方一致する行の抽出
+
+        Args:
+            pd_data (pd.DataFrame): 抽出対象のDataFrame
+            prefix_filters (Dict[str, str]): カラム名と前方文字列の辞書
+
+        Returns:
+            pd.DataFrame: 全カラムの値が前方一致する行（欠損値の行は除外）
+        """
+        for column, prefix in prefix_filters.items():
+            if column not in pd_data.columns:
+                continue
+            mask = pd_data[column].astype('string').str.startswith(prefix).fillna(False).to_numpy(dtype=bool)
+            pd_data = pd_data[mask]
+        return pd_data
+
+    def _read_pyarrow(self, file_path: Path, columns: Optional[List[str]], dtypes: Dict[str, str], encoding: str, prefix_filters: Optional[Dict[str, str]] = None) -> Tuple[pd.DataFrame, Optional[int]]:
+        """pyarrowによるCSVファイルの読み込み
+
+        文字列型・整数型の指定はpyarrowの読み込み時に適用し、それ以外の型は読み込み後に変換する。
+        前方一致の条件はDataFrameに変換する前にArrowテーブル上で適用する。
+        UTF-8以外の文字コードは読み込み時にUTF-8に変換する（デコードできない場合はエラー）。
+
+        Args:
+            file_path (Path): CSVファイルパス
+            columns (Optional[List[str]]): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Dict[str, str]): カラム名と型の辞書
+            encoding (str): 文字コード
+            prefix_filters (Optional[Dict[str, str]], optional): カラム名と前方文字列の辞書. デフォルトはNone（抽出しない）.
+
+        Returns:
+            Tuple[pd.DataFrame, Optional[int]]: (読み込んだDataFrame, フィルタ前の行数（抽出しない場合はNone）)
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pa_compute
+        import pyarrow.csv as pa_csv
+
+        # 文字列・カテゴリ型は文字列として読み込み（日付等の自動変換を抑止）
+        arrow_types = {'str': pa.string(), 'string': pa.string(), 'category': pa.string(), 'object': pa.string(), 'int64': pa.int64()}
+        column_types = {column: arrow_types[dtype] for column, dtype in dtypes.items() if dtype in arrow_types}
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, encoding='utf8' if encoding.lower() in self._UTF8_ENCODINGS else encoding),
+            convert_options=pa_csv.ConvertOptions(include_columns=columns, column_types=column_types, strings_can_be_null=True),
+        )
+        # 前方一致しない行をDataFrame変換前に除外
+        read_rows = None
+        if prefix_filters:
+            read_rows = table.num_rows
+            for column, prefix in prefix_filters.items():
+                if column not in table.column_names:
+                    continue
+                if pa.types.is_null(table.schema.field(column).type):
+                    table = table.slice(0, 0)
+                    continue
+                values = pa_compute.cast(table[column], pa.string())
+                table = table.filter(pa_compute.fill_null(pa_compute.starts_with(values, pattern=prefix), False))
+        # 全て空のカラムはpandas標準エンジンと同様に欠損値（float64）とする
+        pd_data = table.to_pandas()
+        for field in table.schema:
+            if pa.types.is_null(field.type):
+                pd_data[field.name] = pd_data[field.name].astype('float64')
+        # 読み込み時に適用できない型を変換
+        post_dtypes = {column: dtype for column, dtype in dtypes.items() if dtype not in ('str', 'string', 'object', 'int64')}
+        return (pd_data.astype(post_dtypes) if len(post_dtypes) > 0 else pd_data), read_rows
+
+    def _read_parallel(self, file_path: Path, columns: Optional[List[str]], dtypes: Dict[str, str], encoding: str, prefix_filters: Dict[str, str]) -> Optional[Tuple[pd.DataFrame, Optional[int], int, int]]:
+        """バイト範囲の並列解析によるCSVファイルの読み込み
+
+        ファイルをレコード境界（引用符の外の改行）で分割し、各範囲にヘッダー行を付けてスレッド毎に解析する。
+        UTF-8のファイルはそのまま解析し、それ以外の文字コードは範囲毎にUTF-8に変換してから解析する。
+        型指定のないカラムの推定型が範囲毎に異なる（数値と文字列等）場合は、一括で読み込んだ場合と
+        結果が異なるため並列解析しない。カテゴリ型は文字列で読み込み、結合後に変換する。
+
+        Args:
+            file_path (Path): CSVファイルパス
+            columns (Optional[List[str]]): 読み込むカラムリスト. Noneの場合は全カラム.
+            dtypes (Dict[str, str]): カラム名と型の辞書
+            encoding (str): 文字コード
+            prefix_filters (Dict[str, str]): カラム名と前方文字列の辞書
+
+        Returns:
+            Optional[Tuple[pd.DataFrame, Optional[int], int, int]]: (読み込んだDataFrame, フィルタ前の行数（抽出しない場合はNone）, デコードエラーの置換件数, 並列数)
+                （並列解析できない場合はNone）
+        """
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        header_end = self._find_record_end(raw, 0, 0)
+        ranges = self._split_records(raw, header_end, self._parse_workers)
+        if len(ranges) <= 1:
+            return None
+        header = raw[:header_end]
+        read_dtypes = {column: ('str' if dtype == 'category' else dtype) for column, dtype in dtypes.items()}
+
+        def parse_range(start: int, end: int) -> Tuple[pd.DataFrame, int, int]:
+            EncodingDetector.reset_errors()
+            data = raw[start:end] if start == 0 else header + raw[start:end]
+            if encoding.lower() in self._UTF8_ENCODINGS:
+                source, source_encoding = io.BytesIO(data), encoding
+            else:
+                source, source_encoding = io.BytesIO(data.decode(encoding, errors=EncodingDetector.ERROR_HANDLER).encode('utf-8')), 'utf-8'
+            pd_chunk = pd.read_csv(source, usecols=columns, dtype=read_dtypes, engine=self.ENGINE_C, encoding=source_encoding, encoding_errors=EncodingDetector.ERROR_HANDLER)
+            read_rows = len(pd_chunk)
+            return self._filter_prefix(pd_chunk, prefix_filters), read_rows, EncodingDetector.get_errors()
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            results = list(executor.map(lambda byte_range: parse_range(*byte_range), ranges))
+        pd_chunks = [pd_chunk for pd_chunk, _, _ in results]
+        if not self._consistent_dtypes(pd_chunks, dtypes):
+            print(f'CSV parallel parse skipped: {file_path} (inferred column types differ between ranges)')
+            return None
+        pd_data = self._to_category(pd.concat(pd_chunks, ignore_index=True), dtypes)
+        read_rows = sum(rows for _, rows, _ in results) if len(prefix_filters) > 0 else None
+        return pd_data, read_rows, sum(errors for _, _, errors in results), len(ranges)
+
+    def _split_records(self, raw: bytes, start: int, parts: int) -> List[Tuple[int, int]]:
+        """レコード境界でのバイト範囲の分割
+
+        Args:
+            raw (bytes): ファイルの内容
+            start (int): 分割開始位置（ヘッダー行の次）
+            parts (int): 分割数
+
+        Returns:
+            List[Tuple[int, int]]: (開始位置, 終了位置)のリスト（空の範囲は含まない）
+        """
+        bounds = [start]
+        size = len(raw) - start
+        for part in range(1, parts):
+            target = start + size * part // parts
+            if target <= bounds[-1]:
+                continue
+            record_end = self._find_record_end(raw, bounds[-1], target)
+            if record_end >= len(raw):
+                break
+            bounds.append(record_end)
+        bounds.append(len(raw))
+        return [(begin, end) for begin, end in zip(bounds[:-1], bounds[1:]) if end > begin]
+
+    def _find_record_end(self, raw: bytes, record_start: int, position: int) -> int:
+        """指定位置以降のレコード終端の検索
+
+        レコード開始位置からの引用符の数が偶数となる（引用符の外の）改行をレコード終端とする。
+        UTF-8・CP932とも改行と引用符のバイトは複数バイト文字の一部に現れない。
+
+        Args:
+            raw (bytes): ファイルの内容
+            record_start (int): 検索範囲より前のレコード開始位置
+            position (int): 検索開始位置
+
+        Returns:
+            int: レコード終端の改行の次の位置（見つからない場合はファイルサイズ）
+        """
+        quotes = raw.count(b'"', record_start, position)
+        while True:
+            newline = raw.find(b'\n', position)
+            if newline < 0:
+                return len(raw)
+            quotes += raw.count(b'"', position, newline)
+            if quotes % 2 == 0:
+                return newline + 1
+            position = newline + 1
+
+    def _consistent_dtypes(self, pd_chunks: List[pd.DataFrame], dtypes: Dict[str, str]) -> bool:
+        """範囲毎の推定型の整合性判定
+
+        全て欠損値のカラムは型を問わず、数値型（整数と小数）の混在は結合時に小数となるため許容する。
+
+        Args:
+            pd_chunks (List[pd.DataFrame]): 範囲毎に読み込んだDataFrameリスト
+            dtypes (Dict[str, str]): カラム名と型の辞書（型指定のあるカラムは判定しない）
+
+        Returns:
+            bool: 一括で読み込んだ場合と同じ型に結合できる場合True
+        """
+        for column in pd_chunks[0].columns:
+            if column in dtypes:
+                continue
+            kinds = {pd_chunk[column].dtype for pd_chunk in pd_chunks if pd_chunk[column].notna().any()}
+            if len(kinds) > 1 and not all(pd.api.types.is_numeric_dtype(kind) and not pd.api.types.is_bool_dtype(kind) for kind in kinds):
+                return False
+        return True
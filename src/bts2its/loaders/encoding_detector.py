@@ -0,0 +1,144 @@
+from pathlib import Path
+from typing import List
+import codecs
+import os
+import threading
+
+class EncodingDetector:
+    """CSVファイルの文字コード判定クラス
+
+    ファイルの先頭・中間・末尾から一定サイズの標本を読み込み、UTF-8（BOM付きを含む）とCP932（Shift_JIS）のどちらで
+    デコードできるかを判定する。全体は読み込まないため、大きなファイルでも判定時間は一定となる。
+    デコードできないバイト列は置換文字（U+FFFD）に置き換え、置換した件数をスレッド毎に数える。
+    """
+    #
+    # public定数
+    #
+    ENCODING_AUTO = 'auto'              # 自動判定
+    ENCODING_UTF8 = 'utf-8-sig'         # UTF-8（BOMの有無を問わない）
+    ENCODING_CP932 = 'cp932'            # CP932（Shift_JIS）
+    ERROR_HANDLER = 'bts2its_count'     # 置換件数を数えるデコードエラーハンドラー名（encoding_errorsに指定する）
+    #
+    # protected変数
+    #
+    _counter = threading.local()        # スレッド毎の置換件数
+    #
+    # protected定数
+    #
+    _SAMPLE_BYTES = 64 * 1024           # 標本1つあたりの読み込みサイズ（バイト）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self) -> None:
+        """コンストラクタ
+        """
+        pass
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def detect(self, file_path: Path) -> str:
+        """文字コードの判定
+
+        Args:
+            file_path (Path): CSVファイルパス
+
+        Returns:
+            str: 文字コード（utf-8-sig, cp932、どちらでもデコードできない場合はutf-8-sig）
+        """
+        samples = self._read_samples(Path(file_path))
+        if len(samples) == 0 or samples[0].startswith(codecs.BOM_UTF8):
+            return self.ENCODING_UTF8
+        # デコードエラーのない文字コード、全てでエラーがある場合はエラーの最も少ない文字コード
+        errors = {encoding: sum(self._count_sample_errors(sample, encoding) for sample in samples) for encoding in (self.ENCODING_UTF8, self.ENCODING_CP932)}
+        return min(errors, key=lambda encoding: errors[encoding])
+
+    @classmethod
+    def reset_errors(cls) -> None:
+        """呼び出し元スレッドの置換件数の初期化
+        """
+        cls._counter.count = 0
+
+    @classmethod
+    def get_errors(cls) -> int:
+        """呼び出し元スレッドの置換件数の取得
+
+        Returns:
+            int: reset_errors以降にデコードエラーで置換した件数
+        """
+        return getattr(cls._counter, 'count', 0)
+
+    #
+    # protectedメソッド
+    #
+    def _read_samples(self, file_path: Path) -> List[bytes]:
+        """標本の読み込み
+
+        中間・末尾の標本は文字の途中から始まらないよう、最初の改行の次から使用する。
+
+        Args:
+            file_path (Path): CSVファイルパス
+
+        Returns:
+            List[bytes]: 先頭・中間・末尾の標本リスト（小さいファイルは先頭のみ）
+        """
+        size = os.path.getsize(file_path)
+        samples = []
+        with open(file_path, 'rb') as f:
+            samples.append(f.read(self._SAMPLE_BYTES))
+            for offset in (size // 2, size - self._SAMPLE_BYTES):
+                if offset <= self._SAMPLE_BYTES:
+                    continue
+                f.seek(offset)
+                sample = f.read(self._SAMPLE_BYTES)
+                line_start = sample.find(b'\n')
+                if line_start >= 0:
+                    samples.append(sample[line_start + 1:])
+        return samples
+
+    def _count_sample_errors(self, sample: bytes, encoding: str) -> int:
+        """標本のデコードエラー件数の取得
+
+        Args:
+            sample (bytes): 標本
+            encoding (str): 文字コード
+
+        Returns:
+            int: デコードエラーの件数（末尾で途切れた文字は対象外）
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        try:
+            decoder.decode(sample, final=False)
+            return 0
+        except UnicodeDecodeError:
+            pass
+        # エラーがある場合のみ件数を数える
+        count = self.get_errors()
+        codecs.getincrementaldecoder(encoding)(errors=self.ERROR_HANDLER).decode(sample, final=False)
+        errors = self.get_errors() - count
+        self._counter.count = count
+        return errors
+
+    @classmethod
+    def _count_error(cls, error: UnicodeError) -> tuple:
+        """デコードエラーの置換と件数の加算（エラーハンドラー）
+
+        Args:
+            error (UnicodeError): デコードエラー
+
+        Returns:
+            tuple: (置換文字, 再開位置)
+        """
+        if not isinstance(error, UnicodeDecodeError):
+            raise error
+        cls._counter.count = getattr(cls._counter, 'count', 0) + 1
+        return ('\ufffd', error.end)
+
+# 置換件数を数えるデコードエラーハンドラーを登録
+codecs.register_error(EncodingDetector.ERROR_HANDLER, EncodingDetector._count_error)
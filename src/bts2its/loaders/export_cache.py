@@ -0,0 +1,198 @@
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
+import os
+import pandas as pd
+
+class ExportCache:
+    """読み込み済みエクスポートデータのキャッシュクラス
+
+    読み込んだDataFrameをArrow IPC（Feather）形式でキャッシュフォルダに保存する。
+    入力ファイルのサイズ・更新日時・内容ハッシュが一致する場合はメモリマップで読み込む。
+    キャッシュフォルダは全プロジェクトで共有し、合計サイズの上限を超えた場合は最終利用日時の古いものから削除する。
+    """
+    #
+    # protected変数
+    #
+    _cache_path: Path = None            # キャッシュフォルダパス
+    _max_bytes: int = 0                 # キャッシュ合計サイズ上限（バイト）
+    _enabled: bool = True               # キャッシュ有効フラグ（pyarrow未インストール時は無効）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, cache_path: Path, max_mb: int = 1024) -> None:
+        """コンストラクタ
+
+        Args:
+            cache_path (Path): キャッシュフォルダパス
+            max_mb (int, optional): キャッシュ合計サイズ上限（MB）. デフォルトは1024.
+        """
+        self._cache_path = Path(cache_path)
+        self._max_bytes = max_mb * 1024 * 1024
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def load(self, file_path: Path, signature: str) -> Optional[pd.DataFrame]:
+        """キャッシュからの読み込み
+
+        Args:
+            file_path (Path): 入力ファイルパス
+            signature (str): 読み込み条件（カラム・型指定等）を表す文字列
+
+        Returns:
+            Optional[pd.DataFrame]: キャッシュが有効な場合はDataFrame、無効な場合はNone
+        """
+        if self._enabled is False:
+            return None
+        key = self._entry_key(file_path, signature)
+        meta_path = self._cache_path / f'{key}.json'
+        data_path = self._cache_path / f'{key}.arrow'
+        if not meta_path.is_file() or not data_path.is_file():
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            # サイズが異なる場合は無効
+            stat = os.stat(file_path)
+            if meta.get('size') != stat.st_size:
+                return None
+            # 更新日時が異なる場合は内容ハッシュで判定
+            if meta.get('mtime_ns') != stat.st_mtime_ns:
+                if meta.get('hash') != self._file_hash(file_path):
+                    return None
+                meta['mtime_ns'] = stat.st_mtime_ns
+                self._write_meta(meta_path, meta)
+
+            import pyarrow as pa
+            # メモリマップで読み込み
+            with pa.memory_map(str(data_path), 'r') as source:
+                pd_data = pa.ipc.open_file(source).read_all().to_pandas()
+            # 最終利用日時を更新
+            os.utime(meta_path)
+            return pd_data
+        except ImportError:
+            self._disable()
+            return None
+        except Exception as e:
+            print(f'export cache load error. {e}')
+            return None
+
+    def save(self, file_path: Path, signature: str, pd_data: pd.DataFrame) -> None:
+        """キャッシュへの保存
+
+        Args:
+            file_path (Path): 入力ファイルパス
+            signature (str): 読み込み条件（カラム・型指定等）を表す文字列
+            pd_data (pd.DataFrame): 保存するDataFrame
+        """
+        if self._enabled is False:
+            return
+        key = self._entry_key(file_path, signature)
+        meta_path = self._cache_path / f'{key}.json'
+        data_path = self._cache_path / f'{key}.arrow'
+
+        try:
+            import pyarrow as pa
+            self._cache_path.mkdir(parents=True, exist_ok=True)
+            stat = os.stat(file_path)
+            meta = {
+                'source': str(Path(file_path).resolve()),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': self._file_hash(file_path),
+            }
+            # メモリマップで読み込めるよう非圧縮で一時ファイルに書き込み、完了後に置き換える
+            table = pa.Table.from_pandas(pd_data, preserve_index=False)
+            temp_path = data_path.with_suffix(f'.{os.getpid()}.tmp')
+            with pa.OSFile(str(temp_path), 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_path, data_path)
+            self._write_meta(meta_path, meta)
+        except ImportError:
+            self._disable()
+            return
+        except Exception as e:
+            print(f'export cache save error. {e}')
+            return
+
+        # 上限を超えた場合は古いキャッシュを削除
+        self._evict()
+
+    #
+    # protectedメソッド
+    #
+    def _entry_key(self, file_path: Path, signature: str) -> str:
+        """キャッシュキーの取得
+
+        Args:
+            file_path (Path): 入力ファイルパス
+            signature (str): 読み込み条件を表す文字列
+
+        Returns:
+            str: キャッシュキー
+        """
+        source = f'{Path(file_path).resolve()}|{signature}'
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def _file_hash(self, file_path: Path) -> str:
+        """入力ファイルの内容ハッシュ取得
+
+        Args:
+            file_path (Path): 入力ファイルパス
+
+        Returns:
+            str: 内容ハッシュ文字列
+        """
+        file_hash = hashlib.blake2b()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
+    def _write_meta(self, meta_path: Path, meta: dict) -> None:
+        """キャッシュ情報ファイルの書き込み
+
+        Args:
+            meta_path (Path): キャッシュ情報ファイルパス
+            meta (dict): キャッシュ情報
+        """
+        temp_path = meta_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+
+    def _evict(self) -> None:
+        """上限を超えたキャッシュの削除
+
+        最終利用日時の古いキャッシュから、合計サイズが上限以下になるまで削除する。
+        """
+        entries = []
+        for meta_path in self._cache_path.glob('*.json'):
+            data_path = meta_path.with_suffix('.arrow')
+            try:
+                entries.append((meta_path.stat().st_mtime, meta_path, data_path, data_path.stat().st_size if data_path.is_file() else 0))
+            except FileNotFoundError:
+                continue
+        total_bytes = sum(size for _, _, _, size in entries)
+        for _, meta_path, data_path, size in sorted(entries, key=lambda entry: entry[0]):
+            if total_bytes <= self._max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            data_path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def _disable(self) -> None:
+        """キャッシュの無効化
+        """
+        print('pyarrow is not installed. export cache is disabled.')
+        self._enabled = False
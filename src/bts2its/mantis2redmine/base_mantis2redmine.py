@@ -1,7 +1,13 @@
 from bts2its.interfaces import AbstractBts2Its
 from bts2its.common import *
+from bts2its.loaders import CsvLoader, ExportCache
+from bts2its.states import SyncState
+import json
+import numpy as np
+import warnings
 import pandas as pd
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime, timedelta
 
 class BaseMantis2Redmine(AbstractBts2Its):
@@ -52,6 +58,17 @@ class BaseMantis2Redmine(AbstractBts2Its):
     #
 
     _parameters: Mantis2RedmineParameters = None    # MantisBTからRedmineへの変換パラメータ
+    _its_title_index: TitlePrefixIndex = None       # ITS題名の前方一致検索インデックス
+    _its_parent_ids: Dict[str, Any] = None          # ITS親チケット題名→チケットID（ITSデータ読み込み時に作成）
+    _target_start_date: datetime = None             # 対象期間開始日（BTSデータ読み込み開始時に決定、全期間対象の場合はNone）
+    _csv_loader: CsvLoader = None                   # CSV読み込みオブジェクト
+    _sync_state: SyncState = None                   # 差分同期の状態（差分同期しない場合はNone）
+    _full_sync: bool = False                        # 全件同期フラグ
+    _bts_fingerprints: dict = None                  # 対象期間内のBTS行のフィンガープリント（BTS ID→フィンガープリント）
+    _unchanged_bts_ids: set = None                  # 前回同期から変更のないBTS IDの集合
+    _converted_bts_ids: set = None                  # 分割読み込みで変換したBTS IDの集合（一括読み込みの場合はNone）
+    _pending_bts_ids: set = None                    # 分割読み込みで起票データが作成されたBTS IDの集合（一括読み込みの場合はNone）
+    _conversion_rule_set: ConversionRuleSet = None  # 変換済みの起票・更新判定ルール表（初回の変換時に作成）
     #
     # protected定数
     #
@@ -62,8 +79,55 @@ class BaseMantis2Redmine(AbstractBts2Its):
         FIXED_KEYWORDS['bts_version'],
         FIXED_KEYWORDS['bts_date'],
     ]
+    _BTS_DATA_DTYPES = {                            # BTSデータカラム型（型推定を省略するカラム、値の種類が少ないカラムはカテゴリ型）
+        FIXED_KEYWORDS['bts_id']:'int64',
+        FIXED_KEYWORDS['bts_title']:'str',
+        FIXED_KEYWORDS['bts_status']:'category',
+        FIXED_KEYWORDS['bts_version']:'category',
+        FIXED_KEYWORDS['bts_date']:'str',
+    }
     _BTS_CLOSED_STATUS = []                         # BTS終了ステータスリスト
     _ITS_DATA_COLUMNS = []                          # ITSデータカラム
+    _ITS_DATA_DTYPES = {                            # ITSデータカラム型（型推定を省略するカラム、値の種類が少ないカラムはカテゴリ型）
+        FIXED_KEYWORDS['its_id']:'int64',
+        FIXED_KEYWORDS['its_tracker']:'category',
+        FIXED_KEYWORDS['its_status']:'category',
+        FIXED_KEYWORDS['its_title']:'str',
+        FIXED_KEYWORDS['its_author']:'category',
+        FIXED_KEYWORDS['its_assigned_to']:'category',
+        FIXED_KEYWORDS['its_update_date']:'str',
+        FIXED_KEYWORDS['its_category']:'category',
+        FIXED_KEYWORDS['its_target_version']:'category',
+        FIXED_KEYWORDS['its_start_date']:'str',
+        FIXED_KEYWORDS['its_due_date']:'str',
+        FIXED_KEYWORDS['its_created_on']:'str',
+        FIXED_KEYWORDS['its_closed_on']:'str',
+        FIXED_KEYWORDS['its_priority']:'category',
+        FIXED_KEYWORDS['its_description']:'str',
+    }
+    _ITS_REST_FIELDS = {                            # ITSデータカラムとREST APIのチケット項目（項目名, 参照する属性）
+        FIXED_KEYWORDS['its_id']:('id', None),
+        FIXED_KEYWORDS['its_tracker']:('tracker', 'name'),
+        FIXED_KEYWORDS['its_parent_id']:('parent', 'id'),
+        FIXED_KEYWORDS['its_status']:('status', 'name'),
+        FIXED_KEYWORDS['its_title']:('subject', None),
+        FIXED_KEYWORDS['its_author']:('author', 'name'),
+        FIXED_KEYWORDS['its_assigned_to']:('assigned_to', 'name'),
+        FIXED_KEYWORDS['its_update_date']:('updated_on', None),
+        FIXED_KEYWORDS['its_category']:('category', 'name'),
+        FIXED_KEYWORDS['its_target_version']:('fixed_version', 'name'),
+        FIXED_KEYWORDS['its_start_date']:('start_date', None),
+        FIXED_KEYWORDS['its_due_date']:('due_date', None),
+        FIXED_KEYWORDS['its_estimated_hours']:('estimated_hours', None),
+        FIXED_KEYWORDS['its_total_estimated_hours']:('total_estimated_hours', None),
+        FIXED_KEYWORDS['its_spent_hours']:('spent_hours', None),
+        FIXED_KEYWORDS['its_total_spent_hours']:('total_spent_hours', None),
+        FIXED_KEYWORDS['its_done_ratio']:('done_ratio', None),
+        FIXED_KEYWORDS['its_created_on']:('created_on', None),
+        FIXED_KEYWORDS['its_closed_on']:('closed_on', None),
+        FIXED_KEYWORDS['its_priority']:('priority', 'name'),
+        FIXED_KEYWORDS['its_description']:('description', None),
+    }
     _ITS_ENTRY_COLUMNS = [                          # ITS起票データカラム
         FIXED_KEYWORDS['its_operation'],
         FIXED_KEYWORDS['its_id'], 
@@ -91,6 +155,9 @@ class BaseMantis2Redmine(AbstractBts2Its):
     _ITS_PARENT_TICKET_TITLE = []                   # ITS親チケットタイトルリスト
     _ITS_CLOSED_STATUS = []                         # ITS終了ステータスリスト
     _ITS_TITLE_FORMAT = '{}[{}:{}]'                 # ITS起票タイトルフォーマット
+    _CONVERSION_RULES: List[ConversionRule] = []    # 起票・更新判定ルール表（変換パラメータで指定されない場合に使用）
+    _ENGINE_ROW = 'row'                             # 変換エンジン種別（行単位処理）
+    _ENGINE_VECTORIZED = 'vectorized'               # 変換エンジン種別（列単位の一括処理）
 
     #
     # コンストラクタ/デストラクタ
@@ -103,6 +170,21 @@ class BaseMantis2Redmine(AbstractBts2Its):
         """
         super().__init__()
         self._parameters = parameters
+        # CSV読み込みオブジェクト生成
+        cache_path = self._parameters.get('cache_path', '')
+        cache = ExportCache(cache_path=Path(cache_path), max_mb=self._parameters.get('cache_max_mb', 1024)) if cache_path != '' else None
+        self._csv_loader = CsvLoader(
+            engine=self._parameters.get('csv_engine', CsvLoader.ENGINE_C),
+            cache=cache,
+            encoding=self._parameters.get('csv_encoding', 'auto'),
+            parse_workers=self._parameters.get('parse_workers', 0),
+        )
+        # 差分同期の状態読み込み
+        sync_state_path = self._parameters.get('sync_state_path', '')
+        if sync_state_path != '':
+            self._sync_state = SyncState(state_path=Path(sync_state_path))
+        self._bts_fingerprints = {}
+        self._unchanged_bts_ids = set()
 
     def __del__(self) -> None:
         """デストラクタ
@@ -118,7 +200,47 @@ class BaseMantis2Redmine(AbstractBts2Its):
         Args:
             file_path (Path): データのファイルパス
         """
-        self._pd_bts = self._load_mantis(file_path)
+        # 対象期間外の行と前回同期から変更のない行は変換処理に渡さない
+        self._update_target_start_date()
+        self._converted_bts_ids = None
+        self._pending_bts_ids = None
+        self._pd_bts = self._filter_unchanged(self._filter_date_range(self._load_mantis(file_path)))
+
+    def iter_bts_to_its(self, file_path: Path) -> Iterator[pd.DataFrame]:
+        """BTSデータの分割読み込みと起票データ作成
+
+        分割読み込み行数が指定された場合、BTSデータを指定行数ずつ読み込み、
+        読み込み済みのITSデータに対して変換した起票データを順に返す。
+        BTSデータ全体と全行の起票データはメモリに保持しない。
+
+        Args:
+            file_path (Path): BTSデータのファイルパス
+
+        Yields:
+            pd.DataFrame: 分割したBTSデータ毎のITS起票データ
+        """
+        chunk_rows = self._parameters.get('chunk_rows', 0)
+        if chunk_rows <= 0:
+            yield from super().iter_bts_to_its(file_path)
+            return
+
+        # 全ての分割データを同じ対象期間で抽出
+        self._update_target_start_date()
+        # 差分同期の状態保存用に変換したBTS IDを記録
+        self._converted_bts_ids = set()
+        self._pending_bts_ids = set()
+        self._unchanged_bts_ids = set()
+        self._bts_fingerprints = {}
+        columns = self._BTS_DATA_COLUMNS.copy() if len(self._BTS_DATA_COLUMNS) > 0 else None
+        for pd_chunk in self._csv_loader.iter_chunks(file_path, chunk_rows=chunk_rows, columns=columns, dtypes=self._BTS_DATA_DTYPES, prefix_filters=self._get_bts_prefix_filters()):
+            self._pd_bts = self._filter_unchanged(self._filter_date_range(pd_chunk), reset=False)
+            self.bts_to_its()
+            self._converted_bts_ids.update(str(bts_id) for bts_id in self._pd_bts[self.FIXED_KEYWORDS['bts_id']].tolist())
+            self._pending_bts_ids.update(self._get_entry_bts_ids())
+            yield self._pd_its_entry
+        # 分割したデータを保持しない
+        self._pd_bts = self._pd_bts.iloc[0:0]
+        self._pd_its_entry = self._pd_its_entry.iloc[0:0]
 
     def load_its(self, file_path: Path) -> None:
         """Issue管理データ読み取り
@@ -127,6 +249,20 @@ class BaseMantis2Redmine(AbstractBts2Its):
             file_path (Path): データのファイルパス
         """
         self._pd_its = self._load_redmine(file_path)
+        # ITS題名の前方一致検索インデックスと親チケットの対応表を構築
+        self._its_title_index = TitlePrefixIndex(self._pd_its[self.FIXED_KEYWORDS['its_title']])
+        self._its_parent_ids = self._build_its_parent_ids()
+
+    def load_its_issues(self, issues: List[Dict[str, Any]]) -> None:
+        """Issue管理データ（REST APIの取得結果）の読み取り
+
+        Args:
+            issues (List[Dict[str, Any]]): REST APIのチケットデータ（JSON）のリスト
+        """
+        self._pd_its = self._load_redmine_issues(issues)
+        # ITS題名の前方一致検索インデックスと親チケットの対応表を構築
+        self._its_title_index = TitlePrefixIndex(self._pd_its[self.FIXED_KEYWORDS['its_title']])
+        self._its_parent_ids = self._build_its_parent_ids()
 
     def bts_to_its(self) -> None:
         """BTSからITSへの起票データ作成
@@ -141,6 +277,36 @@ class BaseMantis2Redmine(AbstractBts2Its):
         """
         return self._pd_its_entry
 
+    def set_full_sync(self, full_sync: bool) -> None:
+        """全件同期フラグ設定
+
+        Args:
+            full_sync (bool): 差分同期の状態を使用せず全件を変換する場合True
+        """
+        self._full_sync = full_sync
+
+    def save_sync_state(self) -> None:
+        """差分同期の状態保存
+
+        起票データが作成されなかった（ITSと同期済みの）BTS行のフィンガープリントを保存する。
+        起票データが作成された行は次回も変換対象とし、ITSへの反映を確認する。
+        起票データの登録が全て完了した後に呼び出す。
+        """
+        if self._sync_state is None:
+            return
+        if self._converted_bts_ids is not None:
+            # 分割読み込みの場合は記録したBTS IDを使用
+            converted_ids = self._converted_bts_ids
+            pending_ids = self._pending_bts_ids
+        else:
+            converted_ids = set(str(bts_id) for bts_id in self._pd_bts[self.FIXED_KEYWORDS['bts_id']].tolist())
+            pending_ids = self._get_entry_bts_ids()
+        fingerprints = {
+            bts_id: fingerprint for bts_id, fingerprint in self._bts_fingerprints.items()
+            if bts_id in self._unchanged_bts_ids or (bts_id in converted_ids and bts_id not in pending_ids)
+        }
+        self._sync_state.save(signature=self._get_sync_signature(), fingerprints=fingerprints, full_sync=self._full_sync)
+
     #
     # protectedメソッド
     #
@@ -154,7 +320,7 @@ class BaseMantis2Redmine(AbstractBts2Its):
             pd.DataFrame: MantisBTデータDataFrame
         """
         columns = self._BTS_DATA_COLUMNS.copy() if len(self._BTS_DATA_COLUMNS) > 0 else None    
-        return pd.read_csv(file_path, usecols=columns, encoding='utf-8-sig', encoding_errors='replace')
+        return self._csv_loader.load(file_path, columns=columns, dtypes=self._BTS_DATA_DTYPES, prefix_filters=self._get_bts_prefix_filters())
     
     def _load_redmine(self, file_path: Path) -> pd.DataFrame:
         """Redmineデータのロード
@@ -166,8 +332,65 @@ class BaseMantis2Redmine(AbstractBts2Its):
             pd.DataFrame: RedmineデータDataFrame
         """
         columns = self._ITS_DATA_COLUMNS.copy() if len(self._ITS_DATA_COLUMNS) > 0 else None
-        return pd.read_csv(file_path, usecols=columns, encoding='utf-8-sig', encoding_errors='replace')
+        return self._csv_loader.load(file_path, columns=columns, dtypes=self._ITS_DATA_DTYPES)
     
+    def _load_redmine_issues(self, issues: List[Dict[str, Any]]) -> pd.DataFrame:
+        """RedmineデータのREST APIの取得結果からのロード
+
+        エクスポートデータと同じカラム名・型のDataFrameを作成する。カスタムフィールドはフィールド名のカラムとする。
+        日付・日時はREST APIの形式（ISO形式）のままとする。
+
+        Args:
+            issues (List[Dict[str, Any]]): REST APIのチケットデータ（JSON）のリスト
+
+        Returns:
+            pd.DataFrame: RedmineデータDataFrame
+        """
+        records = []
+        for issue in issues:
+            record = {}
+            for column, (field, attribute) in self._ITS_REST_FIELDS.items():
+                value = issue.get(field)
+                record[column] = value.get(attribute) if attribute is not None and isinstance(value, dict) else value
+            for custom_field in issue.get('custom_fields', []):
+                value = custom_field.get('value')
+                record[custom_field.get('name', '')] = ', '.join(str(item) for item in value) if isinstance(value, list) else value
+            records.append(record)
+        if len(self._ITS_DATA_COLUMNS) > 0:
+            columns = self._ITS_DATA_COLUMNS.copy()
+        else:
+            columns = list(dict.fromkeys([*self._ITS_REST_FIELDS.keys(), *(column for record in records for column in record)]))
+        pd_its = pd.DataFrame.from_records(records, columns=columns)
+
+        # エクスポートデータの読み込みと同様に空の値は欠損値とし、型を指定する
+        for column in pd_its.columns:
+            if pd_its[column].dtype == object:
+                pd_its[column] = pd_its[column].where(pd_its[column].notna() & (pd_its[column] != ''), np.nan)
+        pd_its = pd_its.infer_objects()
+        for column, dtype in self._ITS_DATA_DTYPES.items():
+            if column not in pd_its.columns:
+                continue
+            if dtype == 'str':
+                # 欠損値は文字列に変換しない
+                pd_its[column] = pd_its[column].astype(dtype).where(pd_its[column].notna(), np.nan)
+            else:
+                pd_its[column] = pd_its[column].astype(dtype)
+        return pd_its
+
+    def _get_bts_prefix_filters(self) -> dict:
+        """BTSデータ読み込み時の前方一致条件の取得
+
+        プレフィックスが指定された場合、修正予定バージョンが前方一致する行のみ読み込む。
+        修正予定バージョンが未設定の行は読み込まない。
+
+        Returns:
+            dict: カラム名と前方文字列の辞書（プレフィックスの指定がない場合は空の辞書）
+        """
+        bts_prefix = self._parameters.get('bts_prefix', '') or ''
+        if bts_prefix == '':
+            return {}
+        return {self.FIXED_KEYWORDS['bts_version']: bts_prefix}
+
     def _get_bts_version(self, bts_row: pd.Series) -> str:
         """BTSのバージョン情報取得
 
@@ -204,53 +427,240 @@ class BaseMantis2Redmine(AbstractBts2Its):
         bts_url = self._parameters['bts_base_url'] + str(bts_row[self.FIXED_KEYWORDS['bts_id']])
         return bts_url
 
-    def _get_its_parent_ticket(self) -> list:
-        """ITS親チケットリスト取得
+    def _get_its_parent_ticket(self) -> Optional[ItsParentTicket]:
+        """ITS親チケット取得
 
-        _ITS_PARENT_TICKET_TITLEに設定されたタイトルからチケットを取得する。
+        _ITS_PARENT_TICKET_TITLEに設定されたタイトルのうち、ITSに存在する最初のチケットを取得する。
 
         Returns:
-            list: ITS親チケットリスト
+            Optional[ItsParentTicket]: ITS親チケット情報（親チケットが存在しない場合はNone）
         """
-        # 親チケットの指定がない場合は空リストを返す
+        # 親チケットの指定がない場合はNoneを返す
         if self._ITS_PARENT_TICKET_TITLE is None or len(self._ITS_PARENT_TICKET_TITLE) == 0:
             print('ITS parent ticket title not specified.')
-            return []
-        # ITSデータが存在しない場合は空リストを返す
+            return None
+        # ITSデータが存在しない場合はNoneを返す
         if self._pd_its is None or self._pd_its.empty is True:
             print('ITS data not loaded.')
-            return []
-
-        # 親チケットリストを取得
-        global title
-        parent_row = [self._pd_its.query('題名 == @title') for title in self._ITS_PARENT_TICKET_TITLE]
-        # 親チケットが存在しない場合は空リストを返す
-        if all(row.empty is True for row in parent_row):
-            return []
-        # 親チケットリストを返す
-        return parent_row
-    
-    def _within_date_range(self, date_str: str) -> bool:
-        """指定日付が対象期間内か判定
+            return None
+
+        # 対応表未構築の場合は構築する
+        if self._its_parent_ids is None:
+            self._its_parent_ids = self._build_its_parent_ids()
+        # 指定順で最初に存在する親チケットを返す
+        parent_title = next((title for title in self._ITS_PARENT_TICKET_TITLE if title in self._its_parent_ids), None)
+        if parent_title is None:
+            return None
+        # 該当チケット題名のフォーマットに親チケット題名を展開（題名中の括弧はエスケープ）
+        escaped_title = str(parent_title).replace('{', '{{').replace('}', '}}')
+        return ItsParentTicket(
+            title=parent_title,
+            id=self._its_parent_ids[parent_title],
+            title_format=self._ITS_TITLE_FORMAT.format(escaped_title, '{0}', '{1}'),
+        )
+
+    def _build_its_parent_ids(self) -> Dict[str, Any]:
+        """ITS親チケット題名→チケットIDの対応表作成
+
+        ITS題名の列を1回走査し、_ITS_PARENT_TICKET_TITLEに一致する最初のチケットIDを取得する。
+
+        Returns:
+            Dict[str, Any]: 親チケット題名→チケットIDの辞書（ITSに存在する親チケットのみ）
+        """
+        if self._pd_its is None or len(self._ITS_PARENT_TICKET_TITLE or []) == 0:
+            return {}
+        its_titles = self._pd_its[self.FIXED_KEYWORDS['its_title']]
+        pd_parent = self._pd_its.loc[its_titles.isin(self._ITS_PARENT_TICKET_TITLE).to_numpy(), [self.FIXED_KEYWORDS['its_title'], self.FIXED_KEYWORDS['its_id']]]
+        pd_parent = pd_parent.drop_duplicates(subset=self.FIXED_KEYWORDS['its_title'], keep='first')
+        return dict(zip(pd_parent[self.FIXED_KEYWORDS['its_title']].tolist(), pd_parent[self.FIXED_KEYWORDS['its_id']].tolist()))
+
+    def _get_conversion_rules(self) -> List[ConversionRule]:
+        """起票・更新判定ルール表の取得
+
+        Returns:
+            List[ConversionRule]: 変換パラメータのルール表（指定されない場合は_CONVERSION_RULES）
+        """
+        return self._parameters.get('conversion_rules', []) or self._CONVERSION_RULES
+
+    def _get_conversion_rule_set(self) -> ConversionRuleSet:
+        """変換済みの起票・更新判定ルール表の取得
+
+        初回呼び出し時にルール表を検証・変換し、以降は同じオブジェクトを返す。
+        参照できる項目はBTSデータカラム・BTSのURL（bts_url）・起票データカラムのキーワード、
+        定数はITS側固定値と終了ステータスリスト（bts_closed_status, its_closed_status）とする。
+
+        Returns:
+            ConversionRuleSet: 変換済みのルール表
+        """
+        if self._conversion_rule_set is None:
+            bts_fields = [key for key, column in self.FIXED_KEYWORDS.items() if key.startswith('bts_') and (len(self._BTS_DATA_COLUMNS) == 0 or column in self._BTS_DATA_COLUMNS)]
+            its_columns = [key for key, column in self.FIXED_KEYWORDS.items() if key.startswith('its_') and column in self._ITS_ENTRY_COLUMNS]
+            constants = {key: column for key, column in self.FIXED_KEYWORDS.items() if key.startswith('its_') and column not in self._ITS_ENTRY_COLUMNS}
+            constants.update(bts_closed_status=list(self._BTS_CLOSED_STATUS), its_closed_status=list(self._ITS_CLOSED_STATUS))
+            self._conversion_rule_set = ConversionRuleSet(self._get_conversion_rules(), bts_fields + ['bts_url'] + its_columns, its_columns, constants)
+        return self._conversion_rule_set
+
+    def _find_its_rows(self, title_prefix: str) -> pd.DataFrame:
+        """題名が前方一致するITSデータ行の取得
+
+        Args:
+            title_prefix (str): ITS題名の前方文字列
+
+        Returns:
+            pd.DataFrame: 前方一致したITSデータ行
+        """
+        # インデックス未構築の場合は構築する
+        if self._its_title_index is None:
+            self._its_title_index = TitlePrefixIndex(self._pd_its[self.FIXED_KEYWORDS['its_title']])
+        return self._pd_its.iloc[self._its_title_index.find(title_prefix)]
+
+    def _update_target_start_date(self) -> None:
+        """対象期間開始日の更新
+
+        BTSデータの読み込み毎に現在日時から求める（監視モードで同じ変換オブジェクトを再利用する場合も期間を進める）。
+        """
+        if self._parameters['date_range'] >= 0:
+            self._target_start_date = datetime.now() - timedelta(days=self._parameters['date_range'])
+        else:
+            self._target_start_date = None
+
+    def _filter_date_range(self, pd_bts: pd.DataFrame) -> pd.DataFrame:
+        """対象期間内のBTSデータ行の抽出
+
+        BTS更新日カラムを一括で日付変換し、対象期間外および日付変換できない行を除外する。
+        タイムゾーン付きの更新日時は実行環境のローカル時刻に変換して判定する（行単位の判定では比較できずに除外していた）。
+
+        Args:
+            pd_bts (pd.DataFrame): BTSデータ
+
+        Returns:
+            pd.DataFrame: 対象期間内のBTSデータ
+        """
+        # 日付範囲指定がマイナスの場合は全期間を対象とする
+        if self._target_start_date is None:
+            return pd_bts
+        update_date = self._to_datetime(pd_bts[self.FIXED_KEYWORDS['bts_date']])
+        return pd_bts[(update_date >= self._target_start_date).to_numpy()]
+
+    def _filter_unchanged(self, pd_bts: pd.DataFrame, reset: bool = True) -> pd.DataFrame:
+        """前回同期から変更のあるBTSデータ行の抽出
+
+        BTS行のフィンガープリントを計算し、差分同期の状態と一致する行を除外する。
+        状態の整合性が取れない場合や全件同期が指定された場合は全行を返す。
+        フィンガープリントはBTS行の列のみから求めるため、対応するITSのチケットが手動で変更されても
+        BTS行が変わらない限り除外される（定期的な全件同期で反映する）。
+
+        Args:
+            pd_bts (pd.DataFrame): BTSデータ
+            reset (bool, optional): 記録済みのフィンガープリントを破棄する場合True（分割読み込みの2回目以降はFalse）. デフォルトはTrue.
+
+        Returns:
+            pd.DataFrame: 変換対象のBTSデータ
+        """
+        if reset:
+            self._unchanged_bts_ids = set()
+            self._bts_fingerprints = {}
+        if self._sync_state is None:
+            return pd_bts
+
+        # BTS行毎のフィンガープリントを一括で計算
+        bts_ids = [str(bts_id) for bts_id in pd_bts[self.FIXED_KEYWORDS['bts_id']].tolist()]
+        fingerprints = pd.util.hash_pandas_object(pd_bts.astype(str), index=False).tolist()
+        self._bts_fingerprints.update(zip(bts_ids, fingerprints))
+
+        # 全件同期の場合、または状態の整合性が取れない場合は全行を変換対象とする
+        if self._full_sync or not self._sync_state.is_consistent(self._get_sync_signature(), self._parameters.get('full_sync_interval_days', -1)):
+            print(f'full sync: {len(pd_bts)} rows.')
+            self._full_sync = True
+            return pd_bts
+
+        # 前回同期時とフィンガープリントが一致する行を除外
+        previous = self._sync_state.get_fingerprints()
+        changed_mask = [previous.get(bts_id) != fingerprint for bts_id, fingerprint in zip(bts_ids, fingerprints)]
+        self._unchanged_bts_ids.update(bts_id for bts_id, changed in zip(bts_ids, changed_mask) if not changed)
+        print(f'incremental sync: {sum(changed_mask)}/{len(pd_bts)} rows changed since {self._sync_state.get_last_sync()}.')
+        return pd_bts[changed_mask]
+
+    def _get_sync_signature(self) -> str:
+        """差分同期の状態と変換ルールの整合性判定用文字列取得
+
+        Returns:
+            str: 変換ルールの設定を表す文字列
+        """
+        return json.dumps({
+            'project_name': self._parameters['project_name'],
+            'bts_prefix': self._parameters['bts_prefix'],
+            'bts_base_url': self._parameters['bts_base_url'],
+            'date_range': self._parameters['date_range'],
+            'bts_columns': self._BTS_DATA_COLUMNS,
+            'bts_closed_status': self._BTS_CLOSED_STATUS,
+            'its_closed_status': self._ITS_CLOSED_STATUS,
+            'its_parent_ticket_title': self._ITS_PARENT_TICKET_TITLE,
+            'its_title_format': self._ITS_TITLE_FORMAT,
+            'conversion_rules': self._get_conversion_rules(),
+        }, ensure_ascii=False, sort_keys=True)
+
+    def _get_entry_bts_ids(self) -> set:
+        """起票データが作成されたBTS IDの取得
+
+        起票データの説明に設定したBTSのURLからBTS IDを取得する。
+
+        Returns:
+            set: 操作が設定された起票データのBTS IDの集合
+        """
+        if self._pd_its_entry is None or self._pd_its_entry.empty:
+            return set()
+        operations = self._pd_its_entry[self.FIXED_KEYWORDS['its_operation']].fillna('').astype(str)
+        descriptions = self._pd_its_entry.loc[operations != '', self.FIXED_KEYWORDS['its_description']].astype(str).tolist()
+        base_url = self._parameters['bts_base_url']
+        return set(description[len(base_url):] for description in descriptions if description.startswith(base_url))
+
+    def _category_strings(self, values: pd.Series, na_value: str = 'nan') -> np.ndarray:
+        """値の文字列配列取得（カテゴリコードによる一括変換）
+
+        Args:
+            values (pd.Series): 変換対象の値
+            na_value (str, optional): 欠損値の置換文字列. デフォルトはnan（str(NaN)と同一）.
+
+        Returns:
+            np.ndarray: 文字列配列（object型）
+        """
+        values = values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype('category')
+        # 末尾は欠損値（カテゴリコード-1）の文字列
+        lookup = np.array([str(category) for category in values.cat.categories.tolist()] + [na_value], dtype=object)
+        return lookup[values.cat.codes.to_numpy()]
+
+    def _to_datetime(self, values: pd.Series) -> pd.Series:
+        """日付カラムの一括変換
+
+        書式を推定して一括変換し、推定書式で変換できなかった値のみ個別の書式で再変換する。
+        タイムゾーン付きの日時は実行環境のローカル時刻に変換し、タイムゾーンなしの日時とする。
 
         Args:
-            date_str (str): BTS更新日付文字列
+            values (pd.Series): 日付文字列のSeries
 
         Returns:
-            bool: 対象期間内の場合True、対象期間外の場合False
+            pd.Series: 日付のSeries（変換できない値はNaT）
         """
-        try :
-            # 日付範囲指定がマイナスの場合は全期間を対象として常にTrueを返す
-            if self._parameters['date_range'] < 0 :
-                return True
-
-            # 対象期間開始日とBTS更新日を計算 
-            target_start_date = datetime.now() - timedelta(days=self._parameters['date_range'])
-            update_date = pd.to_datetime(date_str)
-            # BTS更新日が対象期間外の場合はFalseを返す
-            if pd.isna(update_date) or update_date < target_start_date:
-                return False
-            return True
-        except :
-            # 日付変換エラーの場合はFalseを返す
-            return False
+        # 分割読み込みでは先頭行が変換できない場合があるため、書式推定の警告は出力しない（変換できない値は個別に再変換）
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            try:
+                dates = pd.to_datetime(values, errors='coerce')
+            except ValueError:
+                # タイムゾーンの異なる日時が混在する場合は全て個別に再変換する
+                dates = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+        # タイムゾーン付きの場合はローカル時刻に変換して比較する
+        local_tz = datetime.now().astimezone().tzinfo
+        if getattr(dates.dt, 'tz', None) is not None:
+            dates = dates.dt.tz_convert(local_tz).dt.tz_localize(None)
+        # 推定書式で変換できなかった値は個別の書式で再変換する
+        retry_mask = dates.isna() & values.notna()
+        if retry_mask.any():
+            for index, value in values[retry_mask].items():
+                try:
+                    date = pd.Timestamp(pd.to_datetime(str(value)))
+                    dates[index] = date.tz_convert(local_tz).tz_localize(None) if date.tzinfo is not None else date
+                except (ValueError, TypeError, OverflowError):
+                    pass
+        return dates
@@ -1,13 +1,69 @@
 from bts2its.mantis2redmine import BaseMantis2Redmine
 from bts2its.common import *
-from pathlib import Path
+import numpy as np
 import pandas as pd
-import re
-from datetime import datetime, timedelta
 
 class DefaultMantis2Redmine(BaseMantis2Redmine):
     """MantisBTからRedmineへの変換デフォルトクラス
     """
+    #
+    # protected定数
+    #
+    _ROW_ENTRY_KEYS = [                             # 行単位処理で起票データに設定するカラムのキーワード（その他のカラムは空文字）
+        'its_operation',
+        'its_id',
+        'its_tracker',
+        'its_parent_id',
+        'its_status',
+        'its_title',
+        'its_assigned_to',
+        'its_target_version',
+        'its_start_date',
+        'its_due_date',
+        'its_estimated_hours',
+        'its_spent_hours',
+        'its_done_ratio',
+        'its_priority',
+        'its_description',
+    ]
+    _CONVERSION_RULES = [                           # 起票・更新判定ルール表
+        # 新規登録（修正予定バージョンが未設定は登録しない）
+        ConversionRule(
+            name='add',
+            target=ConversionRuleSet.TARGET_ADD,
+            when=[{'field': 'bts_version', 'op': 'not_empty'}],
+            set={'its_operation': '$its_operation_add'},
+        ),
+        # 修正予定バージョンが終了ステータスの場合は「終了」で登録
+        ConversionRule(
+            name='add_closed',
+            target=ConversionRuleSet.TARGET_ADD,
+            when=[{'field': 'bts_version', 'op': 'in', 'value': '$bts_closed_status'}],
+            set={'its_status': '$its_status_close'},
+        ),
+        # 完了mantisは「終了」で更新
+        ConversionRule(
+            name='close',
+            target=ConversionRuleSet.TARGET_UPDATE,
+            when=[
+                {'field': 'its_status', 'op': 'not_in', 'value': '$its_closed_status'},
+                {'field': 'bts_status', 'op': 'in', 'value': '$bts_closed_status'},
+            ],
+            set={'its_operation': '$its_operation_update', 'its_status': '$its_status_close', 'its_target_version': ['$bts_version', '$its_target_version']},
+            stop=True,
+        ),
+        # 該当チケットとMantisのバージョンが相違する場合はMantisバージョンに更新
+        ConversionRule(
+            name='version',
+            target=ConversionRuleSet.TARGET_UPDATE,
+            when=[
+                {'field': 'bts_version', 'op': 'not_empty'},
+                {'field': 'bts_version', 'op': 'ne', 'value': '$its_target_version'},
+            ],
+            set={'its_operation': '$its_operation_update', 'its_target_version': '$bts_version'},
+        ),
+    ]
+
     #
     # コンストラクタ/デストラクタ
     #
@@ -38,73 +94,72 @@ class DefaultMantis2Redmine(BaseMantis2Redmine):
     #
     def bts_to_its(self) -> None:
         """BTSからITSへの起票データ作成
+
+        変換パラメータのengineに応じて行単位処理または列単位の一括処理で起票データを作成する。
+        """
+        if self._parameters.get('engine', self._ENGINE_ROW) == self._ENGINE_VECTORIZED:
+            self._bts_to_its_vectorized()
+        else:
+            self._bts_to_its_rows()
+
+    #
+    # protectedメソッド
+    #
+    def _bts_to_its_rows(self) -> None:
+        """BTSからITSへの起票データ作成（行単位処理）
+
+        新規登録・更新の内容は起票・更新判定ルール表（_CONVERSION_RULES）を1行ずつ適用して決定する。
         """
         # 親チケットを取得
-        parent_row = self._get_its_parent_ticket()
-        if all(row.empty is True for row in parent_row):
+        parent_ticket = self._get_its_parent_ticket()
+        if parent_ticket is None:
             return
-        
-        # mantisからredmineに登録
-        output_new_rows = []
-        new_row = {col: '' for col in self._ITS_ENTRY_COLUMNS}
-        for _, bts_row in self._pd_bts.iterrows():
-            # BTS更新日が対象期間外の場合はスキップ
-            if self._within_date_range(str(bts_row[self.FIXED_KEYWORDS['bts_date']])) is False:
-                continue
+        parent_id = parent_ticket['id']
+        rule_set = self._get_conversion_rule_set()
+        add_fields = rule_set.get_fields(ConversionRuleSet.TARGET_ADD)
+        update_fields = rule_set.get_fields(ConversionRuleSet.TARGET_UPDATE)
+        # ルール表が設定するカラムも起票データに設定する
+        rule_columns = rule_set.get_columns(ConversionRuleSet.TARGET_ADD) | rule_set.get_columns(ConversionRuleSet.TARGET_UPDATE)
+        row_keys = self._ROW_ENTRY_KEYS + [key for key in self.FIXED_KEYWORDS if key in rule_columns and key not in self._ROW_ENTRY_KEYS]
 
+        # mantisからredmineに登録（起票データはカラム毎に追加し、最後に一括でDataFrameを作成）
+        builder = EntryTableBuilder(self._ITS_ENTRY_COLUMNS, [self.FIXED_KEYWORDS[key] for key in row_keys])
+        to_str = EntryTableBuilder.to_str
+        for _, bts_row in self._pd_bts.iterrows():
             # BTSのバージョン情報を取得
             mantis_version = self._get_bts_version(bts_row)
-            # BTSのステータス情報を取得
-            mantis_status = self._get_bts_status(bts_row)
             # BTSのURL情報を取得
             mantis_url = self._get_bts_url(bts_row)
 
-            # ITSの該当チケットリストを取得
-            target_redmine_row = None
-            parent_id = ''
-            for i, row in enumerate(parent_row):
-                if not row.empty:
-                    # 親チケットIDを取得
-                    parent_id = row.at[row.index[0], self.FIXED_KEYWORDS['its_id']]
-                    # ITS題名のフォーマットに基づき該当チケットを検索
-                    target_redmine_title = self._ITS_TITLE_FORMAT.format(self._ITS_PARENT_TICKET_TITLE[i], bts_row[self.FIXED_KEYWORDS['bts_id']], bts_row[self.FIXED_KEYWORDS['bts_title']])
-                    target_redmine_row = self._pd_its[self._pd_its[self.FIXED_KEYWORDS['its_title']].str.startswith(target_redmine_title)]
-                    break
+            # ITS題名のフォーマットに基づき該当チケットリストを取得
+            target_redmine_title = parent_ticket['title_format'].format(bts_row[self.FIXED_KEYWORDS['bts_id']], bts_row[self.FIXED_KEYWORDS['bts_title']])
+            target_redmine_row = self._find_its_rows(target_redmine_title)
 
             # 新規登録（該当チケットが存在しない場合）
-            if target_redmine_row is None or target_redmine_row.empty:
-                # 操作を設定（修正予定バージョンが未設定は登録しない）
-                param_operation = self.FIXED_KEYWORDS['its_operation_add'] if mantis_version != '' else ''
-                # ステータスを設定
-                param_status = self.FIXED_KEYWORDS['its_status_close'] if mantis_version in self._BTS_CLOSED_STATUS else self.FIXED_KEYWORDS['its_status_open']
-                # ROW追加
-                new_row.clear()
-                new_row.update({
-                    self.FIXED_KEYWORDS['its_operation']:param_operation,
-                    self.FIXED_KEYWORDS['its_id']:'',
-                    self.FIXED_KEYWORDS['its_tracker']:'エントリー対応',
-                    self.FIXED_KEYWORDS['its_parent_id']:parent_id,
-                    self.FIXED_KEYWORDS['its_status']:param_status,
-                    self.FIXED_KEYWORDS['its_title']:target_redmine_title,
-                    self.FIXED_KEYWORDS['its_author']:'',
-                    self.FIXED_KEYWORDS['its_assigned_to']:'',
-                    self.FIXED_KEYWORDS['its_update_date']:'',
-                    self.FIXED_KEYWORDS['its_category']:'',
-                    self.FIXED_KEYWORDS['its_target_version']:mantis_version,
-                    self.FIXED_KEYWORDS['its_start_date']:'',
-                    self.FIXED_KEYWORDS['its_due_date']:'',
-                    self.FIXED_KEYWORDS['its_estimated_hours']:'0',
-                    self.FIXED_KEYWORDS['its_total_estimated_hours']:'',
-                    self.FIXED_KEYWORDS['its_spent_hours']:'',
-                    self.FIXED_KEYWORDS['its_total_spent_hours']:'',
-                    self.FIXED_KEYWORDS['its_done_ratio']:'',
-                    self.FIXED_KEYWORDS['its_created_on']:'',
-                    self.FIXED_KEYWORDS['its_closed_on']:'',
-                    self.FIXED_KEYWORDS['its_priority']:'通常',
-                    self.FIXED_KEYWORDS['its_description']:mantis_url
-                })
-                output_new_rows.append(new_row.copy())
-                
+            if target_redmine_row.empty:
+                entry_values = {
+                    'its_operation': '',
+                    'its_id': '',
+                    'its_tracker': 'エントリー対応',
+                    'its_parent_id': parent_id,
+                    'its_status': self.FIXED_KEYWORDS['its_status_open'],
+                    'its_title': target_redmine_title,
+                    'its_assigned_to': '',
+                    'its_target_version': mantis_version,
+                    'its_start_date': '',
+                    'its_due_date': '',
+                    'its_estimated_hours': '0',
+                    'its_spent_hours': '',
+                    'its_done_ratio': '',
+                    'its_priority': '通常',
+                    'its_description': mantis_url,
+                }
+                # 操作・ステータスをルール表で決定
+                fields = self._get_rule_row_fields(add_fields, bts_row, mantis_url, entry_values=entry_values)
+                rule_set.apply_row(ConversionRuleSet.TARGET_ADD, fields, entry_values)
+                # ROW追加（row_keysの順）
+                builder.append(*[entry_values.get(key, '') for key in row_keys])
+
             # 更新処理（該当チケットが存在する場合）
             else:
                 # ステータス更新は子から処理する必要があるため、IDの降順にソート
@@ -112,56 +167,214 @@ class DefaultMantis2Redmine(BaseMantis2Redmine):
 
                 #　該当チケット毎に更新処理
                 for _, redmine_row in sorted_target_redmine_row.iterrows():
-                    # 更新可否判定用にredmineのバージョン・ステータスを取得
-                    redmine_version = str(redmine_row[self.FIXED_KEYWORDS['its_target_version']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_target_version']]) is False else '')
-                    redmine_status = str(redmine_row[self.FIXED_KEYWORDS['its_status']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_status']]) is False else '')
-
-                    # 更新パラメータ初期化
-                    param_operation = ''
-                    param_status = redmine_status
-                    param_version = redmine_version
-
-                    # 完了mantisは「終了」で更新
-                    if redmine_status not in self._ITS_CLOSED_STATUS and mantis_status in self._BTS_CLOSED_STATUS:
-                        param_operation = self.FIXED_KEYWORDS['its_operation_update']
-                        param_status = self.FIXED_KEYWORDS['its_status_close']
-                        param_version = mantis_version if mantis_version != '' else redmine_version
-                    # 該当チケットとMantisのバージョンが相違する場合はMantisバージョンに更新
-                    elif mantis_version != '' and redmine_version !=  mantis_version:
-                        param_operation = self.FIXED_KEYWORDS['its_operation_update']
-                        param_status = redmine_status
-                        param_version = mantis_version
+                    # 更新パラメータ初期化（該当チケットの値）
+                    entry_values = {
+                        'its_operation': '',
+                        'its_id': str(redmine_row[self.FIXED_KEYWORDS['its_id']]),
+                        'its_tracker': str(redmine_row[self.FIXED_KEYWORDS['its_tracker']]),
+                        'its_parent_id': str(redmine_row[self.FIXED_KEYWORDS['its_parent_id']]),
+                        'its_status': to_str(redmine_row[self.FIXED_KEYWORDS['its_status']]),
+                        'its_title': str(redmine_row[self.FIXED_KEYWORDS['its_title']]),
+                        'its_assigned_to': to_str(redmine_row[self.FIXED_KEYWORDS['its_assigned_to']]),
+                        'its_target_version': to_str(redmine_row[self.FIXED_KEYWORDS['its_target_version']]),
+                        'its_start_date': to_str(redmine_row[self.FIXED_KEYWORDS['its_start_date']]),
+                        'its_due_date': to_str(redmine_row[self.FIXED_KEYWORDS['its_due_date']]),
+                        'its_estimated_hours': to_str(redmine_row[self.FIXED_KEYWORDS['its_estimated_hours']], '0'),
+                        'its_spent_hours': to_str(redmine_row[self.FIXED_KEYWORDS['its_spent_hours']], '0'),
+                        'its_done_ratio': to_str(redmine_row[self.FIXED_KEYWORDS['its_done_ratio']], '0'),
+                        'its_priority': to_str(redmine_row[self.FIXED_KEYWORDS['its_priority']], '通常'),
+                        'its_description': mantis_url,
+                    }
+                    # 操作・ステータス・バージョンをルール表で決定
+                    fields = self._get_rule_row_fields(update_fields, bts_row, mantis_url, redmine_row=redmine_row)
+                    rule_set.apply_row(ConversionRuleSet.TARGET_UPDATE, fields, entry_values)
 
                     # 登録実行
-                    if param_operation != '': 
-                        # ROW追加
-                        new_row.clear()
-                        new_row.update({
-                            self.FIXED_KEYWORDS['its_operation']:param_operation,
-                            self.FIXED_KEYWORDS['its_id']:str(redmine_row[self.FIXED_KEYWORDS['its_id']]),
-                            self.FIXED_KEYWORDS['its_tracker']:str(redmine_row[self.FIXED_KEYWORDS['its_tracker']]),
-                            self.FIXED_KEYWORDS['its_parent_id']:str(redmine_row[self.FIXED_KEYWORDS['its_parent_id']]),
-                            self.FIXED_KEYWORDS['its_status']:param_status,
-                            self.FIXED_KEYWORDS['its_title']:str(redmine_row[self.FIXED_KEYWORDS['its_title']]),
-                            self.FIXED_KEYWORDS['its_author']:'',
-                            self.FIXED_KEYWORDS['its_assigned_to']:str(redmine_row[self.FIXED_KEYWORDS['its_assigned_to']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_assigned_to']]) is False else ''),
-                            self.FIXED_KEYWORDS['its_update_date']:'',
-                            self.FIXED_KEYWORDS['its_category']:'',
-                            self.FIXED_KEYWORDS['its_target_version']:param_version,
-                            self.FIXED_KEYWORDS['its_start_date']:str(redmine_row[self.FIXED_KEYWORDS['its_start_date']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_start_date']]) is False else ''),
-                            self.FIXED_KEYWORDS['its_due_date']:str(redmine_row[self.FIXED_KEYWORDS['its_due_date']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_due_date']]) is False else ''),
-                            self.FIXED_KEYWORDS['its_estimated_hours']:str(redmine_row[self.FIXED_KEYWORDS['its_estimated_hours']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_estimated_hours']]) is False else '0'),
-                            self.FIXED_KEYWORDS['its_total_estimated_hours']:'',
-                            self.FIXED_KEYWORDS['its_spent_hours']:str(redmine_row[self.FIXED_KEYWORDS['its_spent_hours']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_spent_hours']]) is False else '0'),
-                            self.FIXED_KEYWORDS['its_total_spent_hours']:'',
-                            self.FIXED_KEYWORDS['its_done_ratio']:str(redmine_row[self.FIXED_KEYWORDS['its_done_ratio']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_done_ratio']]) is False else '0'),
-                            self.FIXED_KEYWORDS['its_created_on']:'',
-                            self.FIXED_KEYWORDS['its_closed_on']:'',
-                            self.FIXED_KEYWORDS['its_priority']:str(redmine_row[self.FIXED_KEYWORDS['its_priority']] if pd.isna(redmine_row[self.FIXED_KEYWORDS['its_priority']]) is False else '通常'),
-                            self.FIXED_KEYWORDS['its_description']:mantis_url
-                        })
-                        output_new_rows.append(new_row.copy())
+                    if entry_values['its_operation'] != '':
+                        # ROW追加（row_keysの順）
+                        builder.append(*[entry_values.get(key, '') for key in row_keys])
 
         # 出力DataFrame設定
-        self._pd_its_entry = pd.DataFrame(output_new_rows, columns=self._ITS_ENTRY_COLUMNS)
-    
\ No newline at end of file
+        self._pd_its_entry = builder.build()
+
+    def _bts_to_its_vectorized(self) -> None:
+        """BTSからITSへの起票データ作成（列単位の一括処理）
+
+        BTS行とITS行を題名の前方一致で一括結合し、起票・更新の判定と出力カラムの作成を列単位で行う。
+        判定は起票・更新判定ルール表（_CONVERSION_RULES）を結合した全行に一括で適用する。出力は行単位処理と同一となる。
+        """
+        # 親チケットを取得
+        parent_ticket = self._get_its_parent_ticket()
+        if parent_ticket is None:
+            return
+        parent_id = parent_ticket['id']
+        title_format = parent_ticket['title_format']
+        rule_set = self._get_conversion_rule_set()
+
+        # BTSのバージョン・URL・ITS題名を列単位で取得
+        pd_bts = self._pd_bts
+        bts_ids = pd_bts[self.FIXED_KEYWORDS['bts_id']].tolist()
+        bts_titles = pd_bts[self.FIXED_KEYWORDS['bts_title']].tolist()
+        mantis_version = self._category_strings(pd_bts[self.FIXED_KEYWORDS['bts_version']], '')
+        mantis_url = np.array([self._parameters['bts_base_url'] + str(value) for value in bts_ids], dtype=object)
+        target_redmine_title = np.array([title_format.format(bts_id, bts_title) for bts_id, bts_title in zip(bts_ids, bts_titles)], dtype=object)
+
+        # ITS題名の前方一致でBTS行とITS行を結合
+        if self._its_title_index is None:
+            self._its_title_index = TitlePrefixIndex(self._pd_its[self.FIXED_KEYWORDS['its_title']])
+        bts_positions, its_positions = self._its_title_index.find_all(target_redmine_title.tolist())
+        matched = np.zeros(len(pd_bts), dtype=bool)
+        matched[bts_positions] = True
+
+        # 新規登録（該当チケットが存在しない場合）
+        add_positions = np.flatnonzero(~matched)
+        add_count = len(add_positions)
+        add_columns = {
+            'its_operation':np.full(add_count, '', dtype=object),
+            'its_id':np.full(add_count, '', dtype=object),
+            'its_tracker':np.full(add_count, 'エントリー対応', dtype=object),
+            'its_parent_id':np.full(add_count, parent_id, dtype=object),
+            'its_status':np.full(add_count, self.FIXED_KEYWORDS['its_status_open'], dtype=object),
+            'its_title':target_redmine_title[add_positions],
+            'its_target_version':mantis_version[add_positions],
+            'its_estimated_hours':np.full(add_count, '0', dtype=object),
+            'its_priority':np.full(add_count, '通常', dtype=object),
+            'its_description':mantis_url[add_positions],
+        }
+        # 操作・ステータスをルール表で一括決定
+        add_fields = self._get_rule_fields(rule_set.get_fields(ConversionRuleSet.TARGET_ADD), add_positions, mantis_url, entry_values=add_columns)
+        for key in rule_set.get_columns(ConversionRuleSet.TARGET_ADD):
+            add_columns.setdefault(key, np.full(add_count, '', dtype=object))
+        rule_set.apply(ConversionRuleSet.TARGET_ADD, add_fields, add_columns, add_count)
+
+        # 更新処理（該当チケットが存在する場合）
+        # ステータス更新は子から処理する必要があるため、BTS行毎にIDの降順に並べ替え
+        pd_target = self._pd_its.iloc[its_positions]
+        order = np.lexsort((-pd_target[self.FIXED_KEYWORDS['its_id']].to_numpy(), bts_positions))
+        bts_positions = bts_positions[order]
+        pd_target = pd_target.iloc[order]
+        # ルール表が設定するカラムは該当チケットの値を初期値とし、結合した全行に一括で適用
+        rule_keys = rule_set.get_columns(ConversionRuleSet.TARGET_UPDATE) | {'its_operation'}
+        target_columns = self._get_update_columns(rule_keys, pd_target, mantis_url[bts_positions])
+        update_fields = self._get_rule_fields(rule_set.get_fields(ConversionRuleSet.TARGET_UPDATE), bts_positions, mantis_url, pd_its_rows=pd_target)
+        rule_set.apply(ConversionRuleSet.TARGET_UPDATE, update_fields, target_columns, len(pd_target))
+        # 操作が設定された行のみ出力
+        update_positions = np.flatnonzero(target_columns['its_operation'] != '')
+        pd_update = pd_target.iloc[update_positions]
+        update_count = len(update_positions)
+        update_columns = self._get_update_columns([key for key in self._ROW_ENTRY_KEYS if key not in rule_keys], pd_update, mantis_url[bts_positions[update_positions]])
+        update_columns.update({key: values[update_positions] for key, values in target_columns.items()})
+
+        # 新規登録行と更新行をBTS行順に結合（BTS行毎に新規登録行または更新行のどちらか一方のみ存在する）
+        row_order = np.argsort(np.concatenate([add_positions, bts_positions[update_positions]]), kind='stable')
+        builder = EntryTableBuilder(self._ITS_ENTRY_COLUMNS)
+        builder.extend({self.FIXED_KEYWORDS[key]: values for key, values in add_columns.items()}, add_count)
+        builder.extend({self.FIXED_KEYWORDS[key]: values for key, values in update_columns.items()}, update_count)
+
+        # 出力DataFrame設定
+        self._pd_its_entry = builder.build(row_order=row_order)
+
+    def _get_update_columns(self, keys: list, pd_its_rows: pd.DataFrame, mantis_url: np.ndarray) -> dict:
+        """更新行の起票データカラムの一括作成（該当チケットの値）
+
+        Args:
+            keys (list): 作成するカラムのキーワードリスト
+            pd_its_rows (pd.DataFrame): 該当チケットの行
+            mantis_url (np.ndarray): 行毎のBTSのURL
+
+        Returns:
+            dict: キーワード→値配列の辞書（操作等の該当チケットの値がないカラムは空文字）
+        """
+        converters = {
+            'its_id':lambda values: self._to_str_list(values),
+            'its_tracker':lambda values: self._category_strings(values),
+            'its_parent_id':lambda values: self._to_str_list(values),
+            'its_status':lambda values: self._category_strings(values, ''),
+            'its_title':lambda values: self._to_str_list(values),
+            'its_assigned_to':lambda values: self._category_strings(values, ''),
+            'its_target_version':lambda values: self._category_strings(values, ''),
+            'its_start_date':lambda values: self._to_str_list(values, ''),
+            'its_due_date':lambda values: self._to_str_list(values, ''),
+            'its_estimated_hours':lambda values: self._to_str_list(values, '0'),
+            'its_spent_hours':lambda values: self._to_str_list(values, '0'),
+            'its_done_ratio':lambda values: self._to_str_list(values, '0'),
+            'its_priority':lambda values: self._category_strings(values, '通常'),
+        }
+        columns = {}
+        for key in keys:
+            if key == 'its_description':
+                columns[key] = mantis_url
+            elif key in converters and self.FIXED_KEYWORDS[key] in pd_its_rows.columns:
+                columns[key] = np.asarray(converters[key](pd_its_rows[self.FIXED_KEYWORDS[key]]), dtype=object)
+            else:
+                columns[key] = np.full(len(pd_its_rows), '', dtype=object)
+        return columns
+
+    def _get_rule_fields(self, names: set, bts_positions: np.ndarray, mantis_url: np.ndarray, pd_its_rows: pd.DataFrame = None, entry_values: dict = None) -> dict:
+        """ルール表が参照する項目の値の取得（列単位の一括処理）
+
+        Args:
+            names (set): 項目名の集合
+            bts_positions (np.ndarray): 行毎のBTSデータの行位置
+            mantis_url (np.ndarray): BTSデータ行毎のURL
+            pd_its_rows (pd.DataFrame, optional): 行毎の該当チケット（更新の場合）. デフォルトはNone.
+            entry_values (dict, optional): 起票データの初期値（新規登録の場合、its_*項目の値とする）. デフォルトはNone.
+
+        Returns:
+            dict: 項目名→値の辞書
+        """
+        fields = {}
+        for name in names:
+            if name == 'bts_url':
+                fields[name] = mantis_url[bts_positions]
+            elif name.startswith('bts_'):
+                fields[name] = self._pd_bts[self.FIXED_KEYWORDS[name]].iloc[bts_positions]
+            elif pd_its_rows is not None and self.FIXED_KEYWORDS[name] in pd_its_rows.columns:
+                fields[name] = pd_its_rows[self.FIXED_KEYWORDS[name]]
+            elif entry_values is not None and name in entry_values:
+                fields[name] = entry_values[name]
+            else:
+                fields[name] = np.full(len(bts_positions), '', dtype=object)
+        return fields
+
+    def _get_rule_row_fields(self, names: set, bts_row: pd.Series, mantis_url: str, redmine_row: pd.Series = None, entry_values: dict = None) -> dict:
+        """ルール表が参照する項目の値の取得（行単位処理）
+
+        Args:
+            names (set): 項目名の集合
+            bts_row (pd.Series): BTSデータ行
+            mantis_url (str): BTSのURL
+            redmine_row (pd.Series, optional): 該当チケットの行（更新の場合）. デフォルトはNone.
+            entry_values (dict, optional): 起票データの初期値（新規登録の場合、its_*項目の値とする）. デフォルトはNone.
+
+        Returns:
+            dict: 項目名→値（欠損値は空文字）の辞書
+        """
+        to_str = EntryTableBuilder.to_str
+        fields = {}
+        for name in names:
+            if name == 'bts_url':
+                fields[name] = mantis_url
+            elif name.startswith('bts_'):
+                fields[name] = to_str(bts_row[self.FIXED_KEYWORDS[name]])
+            elif redmine_row is not None and self.FIXED_KEYWORDS[name] in redmine_row.index:
+                fields[name] = to_str(redmine_row[self.FIXED_KEYWORDS[name]])
+            elif entry_values is not None:
+                fields[name] = to_str(entry_values.get(name, ''))
+            else:
+                fields[name] = ''
+        return fields
+
+    def _to_str_list(self, values: pd.Series, na_value: str = None) -> list:
+        """値リストの文字列変換
+
+        Args:
+            values (pd.Series): 変換対象の値
+            na_value (str, optional): 欠損値の置換文字列. Noneの場合は欠損値もそのまま文字列変換する.
+
+        Returns:
+            list: 文字列リスト
+        """
+        if na_value is None:
+            return [str(value) for value in values.tolist()]
+        return [str(value) if pd.isna(value) is False else na_value for value in values.tolist()]
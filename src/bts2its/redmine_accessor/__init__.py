@@ -1 +1,2 @@
-from .default_redmine_accessor import DefaultRedmineAccessor
\ No newline at end of file
+from .default_redmine_accessor import DefaultRedmineAccessor
+from .redmine_transport import RedmineTransport
\ No newline at end of file
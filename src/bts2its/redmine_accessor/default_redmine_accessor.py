@@ -1,4 +1,10 @@
 from its_accessor import BaseRedmineAccessor
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from redminelib import Redmine
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple
+import math
 
 class DefaultRedmineAccessor(BaseRedmineAccessor):
     """Redmineアクセスクラス
@@ -26,3 +32,227 @@ class DefaultRedmineAccessor(BaseRedmineAccessor):
         '優先度': '',
         '説明': '',
     }
+    #
+    # protected members
+    #
+    _redmine_url: str = ''              # RedmineのURL
+    _redmine_key: str = ''              # RedmineのAPIキー
+    _redmine: Redmine = None            # 一括取得用のRedmine接続オブジェクト
+    _project_name: str = ''             # プロジェクト名（識別子）
+    _MAX_PAGE_SIZE = 100                # 1リクエストで取得できる最大件数（Redmineの既定値）
+    _ID_KEY = '#'                       # ペイロードのチケットIDキー
+    # ペイロードのキーとチケットの項目（項目名, 参照する属性）
+    _PAYLOAD_FIELDS: Dict[str, Tuple[str, Optional[str]]] = {
+        'トラッカー': ('tracker', 'name'),
+        '親チケット': ('parent', 'id'),
+        'ステータス': ('status', 'name'),
+        '題名': ('subject', None),
+        '担当者': ('assigned_to', 'name'),
+        '対象バージョン': ('fixed_version', 'name'),
+        '開始日': ('start_date', None),
+        '期日': ('due_date', None),
+        '予定工数': ('estimated_hours', None),
+        '合計予定工数': ('total_estimated_hours', None),
+        '作業時間': ('spent_hours', None),
+        '合計作業時間': ('total_spent_hours', None),
+        '進捗率': ('done_ratio', None),
+        '優先度': ('priority', 'name'),
+        '説明': ('description', None),
+    }
+    _NUMERIC_FIELDS = ('parent', 'estimated_hours', 'total_estimated_hours', 'spent_hours', 'total_spent_hours', 'done_ratio')   # 数値として比較する項目
+    _DATE_FIELDS = ('start_date', 'due_date')   # 日付として比較する項目
+    _DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d')    # 日付項目の表記
+
+    #
+    # constructor
+    #
+    def __init__(self, project_name: str, url: str, key_string: str) -> None:
+        """コンストラクタ
+
+        Args:
+            project_name (str): プロジェクト名
+            url (str): RedmineのURL
+            key_string (str): RedmineのAPIキー
+        """
+        super().__init__(project_name=project_name, url=url, key_string=key_string)
+        self._redmine_url = url
+        self._redmine_key = key_string
+        self._project_name = project_name
+
+    #
+    # public methods
+    #
+    def load_issues(self, issue_ids: List[str], batch_size: int = 100) -> Dict[str, Any]:
+        """チケットの一括取得
+
+        issue_idフィルタでbatch_size件ずつまとめて取得する。
+
+        Args:
+            issue_ids (List[str]): 取得するチケットIDリスト
+            batch_size (int, optional): 1リクエストで取得する件数. デフォルトは100.
+
+        Returns:
+            Dict[str, Any]: チケットID（文字列）とチケットオブジェクトの辞書（存在しないIDは含まない）
+        """
+        issues = {}
+        unique_ids = list(dict.fromkeys(str(issue_id) for issue_id in issue_ids))
+        for start in range(0, len(unique_ids), batch_size):
+            batch_ids = unique_ids[start:start + batch_size]
+            # 終了チケットも含めて取得
+            for issue in self._get_redmine().issue.filter(issue_id=','.join(batch_ids), status_id='*', limit=len(batch_ids)):
+                issues[str(issue.id)] = issue
+        return issues
+
+    def configure_pool(self, pool_size: int) -> None:
+        """HTTPセッションの接続プール設定
+
+        一括取得用の接続と、スーパークラスが保持するRedmine接続オブジェクトのセッションに
+        並列数分の接続を保持するアダプターを設定し、起票・更新の接続を再利用する。
+
+        Args:
+            pool_size (int): ホスト毎に保持する接続数
+        """
+        redmines = [self._get_redmine()] + [value for value in vars(self).values() if isinstance(value, Redmine) and value is not self._redmine]
+        for redmine in redmines:
+            session = getattr(redmine.engine, 'session', None)
+            if session is None:
+                continue
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(int(pool_size), 1))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+    def diff_issue_data(self, issue: Any, issue_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """更新データとチケットの差分取得
+
+        更新データのうちチケットの現在値と異なる項目のみのペイロードを返す。
+        表記のみ異なる値（数値・日付の書式）は同じ値とし、空の値も現在値と比較する。
+        比較できない項目（対応する項目がないキー）は常に含める。
+
+        Args:
+            issue (Any): 取得済みのチケットオブジェクト
+            issue_data (Dict[str, Any]): 更新データのペイロード
+
+        Returns:
+            Optional[Dict[str, Any]]: 変更のある項目とチケットIDのペイロード（変更がない場合はNone）
+        """
+        raw = issue.raw() if hasattr(issue, 'raw') else issue
+        if not isinstance(raw, dict):
+            # 現在値を参照できない場合は全項目を更新する
+            return dict(issue_data)
+        changes = {}
+        for key, value in issue_data.items():
+            if key == self._ID_KEY:
+                continue
+            if key not in self._PAYLOAD_FIELDS:
+                changes[key] = value
+                continue
+            field, attribute = self._PAYLOAD_FIELDS[key]
+            current = raw.get(field)
+            if attribute is not None:
+                current = current.get(attribute) if isinstance(current, dict) else None
+            if self._normalize_value(current, field) != self._normalize_value(value, field):
+                changes[key] = value
+        if len(changes) == 0:
+            return None
+        if self._ID_KEY in issue_data:
+            changes[self._ID_KEY] = issue_data[self._ID_KEY]
+        return changes
+
+    def load_project_issues(self, updated_since: str = '', page_size: int = 100, workers: int = 4) -> List[Dict[str, Any]]:
+        """プロジェクトのチケットの一括取得
+
+        先頭ページで総件数を取得し、残りのページは並列に取得する。終了チケットも含めて取得する。
+
+        Args:
+            updated_since (str, optional): 更新日時の下限（ISO形式）. 空の場合は全チケットを取得する.
+            page_size (int, optional): 1リクエストで取得する件数（最大100）. デフォルトは100.
+            workers (int, optional): ページ取得の並列数. デフォルトは4.
+
+        Returns:
+            List[Dict[str, Any]]: REST APIのチケットデータ（JSON）のリスト（ID順、重複なし）
+        """
+        page_size = min(max(int(page_size), 1), self._MAX_PAGE_SIZE)
+        filters = {'project_id': self._project_name, 'status_id': '*', 'sort': 'id'}
+        if updated_since != '':
+            filters['updated_on'] = f'>={updated_since}'
+
+        # 先頭ページで総件数を取得
+        issues, total_count = self._load_issue_page(filters, 0, page_size)
+        offsets = list(range(page_size, total_count, page_size))
+        if len(offsets) > 0:
+            with ThreadPoolExecutor(max_workers=max(int(workers), 1)) as executor:
+                for page_issues, _ in executor.map(lambda offset: self._load_issue_page(filters, offset, page_size), offsets):
+                    issues.extend(page_issues)
+        # 取得中の更新でページ境界がずれた場合の重複を除外
+        return list({issue['id']: issue for issue in issues}.values())
+
+    def find_issue_ids(self, title: str) -> List[str]:
+        """題名によるチケットIDの検索
+
+        題名を含むチケットを取得し、題名が完全に一致するチケットのIDを返す。終了チケットも含めて検索する。
+
+        Args:
+            title (str): 題名
+
+        Returns:
+            List[str]: 題名が一致するチケットID（文字列）のリスト
+        """
+        filters = {'project_id': self._project_name, 'status_id': '*', 'subject': f'~{title}'}
+        return [str(issue.id) for issue in self._get_redmine().issue.filter(**filters) if str(getattr(issue, 'subject', '')) == title]
+
+    #
+    # protected methods
+    #
+    def _normalize_value(self, value: Any, field: str = '') -> str:
+        """比較用の値の正規化
+
+        同じ値として登録される表記の違いのみを吸収する（未設定と0、前後の空白などは区別する）。
+
+        Args:
+            value (Any): 値
+            field (str, optional): チケットの項目名. デフォルトは空文字.
+
+        Returns:
+            str: 正規化した文字列（欠損値は空文字、数値項目は数値表記、日付項目はISO形式）
+        """
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return ''
+        text = str(value)
+        if field in self._NUMERIC_FIELDS:
+            try:
+                number = float(text)
+            except ValueError:
+                return text
+            return '' if math.isnan(number) else repr(number)
+        if field in self._DATE_FIELDS:
+            for date_format in self._DATE_FORMATS:
+                try:
+                    return datetime.strptime(text.strip(), date_format).date().isoformat()
+                except ValueError:
+                    continue
+        return text
+
+    def _load_issue_page(self, filters: Dict[str, Any], offset: int, page_size: int) -> Tuple[List[Dict[str, Any]], int]:
+        """チケット1ページ分の取得
+
+        Args:
+            filters (Dict[str, Any]): チケットの絞り込み条件
+            offset (int): 取得開始位置
+            page_size (int): 取得件数
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: (チケットデータ（JSON）のリスト, 条件に一致する総件数)
+        """
+        resource_set = self._get_redmine().issue.filter(offset=offset, limit=page_size, **filters)
+        issues = [issue.raw() for issue in resource_set]
+        return issues, resource_set.total_count
+
+    def _get_redmine(self) -> Redmine:
+        """Redmine接続オブジェクトの取得
+
+        Returns:
+            Redmine: Redmine接続オブジェクト
+        """
+        if self._redmine is None:
+            self._redmine = Redmine(self._redmine_url, key=self._redmine_key)
+        return self._redmine
@@ -0,0 +1,190 @@
+from bts2its.common import LatencyHistogram, TokenBucket
+from its_accessor import AbstractItsAccessor
+from redminelib import exceptions as redmine_exceptions
+from threading import Lock
+from typing import Any, Callable, Optional
+import random
+import requests
+import time
+
+class RedmineTransport:
+    """Redmineアクセスの転送制御クラス
+
+    ITSアクセスオブジェクトの呼び出しに流量制限・再試行・処理時間の記録を行う。
+    接続プール数を指定した場合、ITSアクセスオブジェクトのHTTPセッションに並列数分の接続プールを設定する。
+    冪等な操作（取得・更新）は一時的なエラーと接続エラーで再試行し、冪等でない操作（起票）は
+    サーバーが処理せずに拒否したことが明らかな場合（429、接続タイムアウト）のみ再試行する。
+    """
+    #
+    # public定数
+    #
+    RETRY_STATUS = (429, 500, 502, 503, 504)    # 冪等な操作を再試行するHTTPステータス
+    THROTTLE_STATUS = (429, 503)                # 流量を半減するHTTPステータス
+    #
+    # protected変数
+    #
+    _its_accessor: AbstractItsAccessor = None   # ITSアクセスオブジェクト
+    _bucket: TokenBucket = None                 # 流量制限オブジェクト
+    _histogram: LatencyHistogram = None         # 処理時間ヒストグラム
+    _max_retries: int = 3                       # 最大再試行回数
+    _backoff_seconds: float = 0.5               # 再試行の初回待機時間（秒）
+    _backoff_max_seconds: float = 30.0          # 再試行の最大待機時間（秒）
+    _counters: dict = None                      # 呼び出し・再試行・流量半減・待機時間の集計
+    _lock: Lock = None                          # 排他制御オブジェクト
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, its_accessor: AbstractItsAccessor, rate_limit: float = 0.0, burst: int = 1, max_retries: int = 3, backoff_seconds: float = 0.5, backoff_max_seconds: float = 30.0, pool_size: int = 0) -> None:
+        """コンストラクタ
+
+        Args:
+            its_accessor (AbstractItsAccessor): ITSアクセスオブジェクト
+            rate_limit (float, optional): 1秒あたりの最大呼び出し数（0以下の場合は制限しない）. デフォルトは0.
+            burst (int, optional): 連続して許可する最大呼び出し数. デフォルトは1.
+            max_retries (int, optional): 最大再試行回数. デフォルトは3.
+            backoff_seconds (float, optional): 再試行の初回待機時間（秒、再試行毎に倍増）. デフォルトは0.5.
+            backoff_max_seconds (float, optional): 再試行の最大待機時間（秒）. デフォルトは30.
+            pool_size (int, optional): HTTPセッションの接続プール数（0以下の場合は変更しない）. デフォルトは0.
+        """
+        self._its_accessor = its_accessor
+        self._bucket = TokenBucket(rate=rate_limit, burst=burst)
+        self._histogram = LatencyHistogram()
+        self._max_retries = max(int(max_retries), 0)
+        self._backoff_seconds = float(backoff_seconds)
+        self._backoff_max_seconds = float(backoff_max_seconds)
+        self._counters = {'calls': 0, 'retries': 0, 'throttled': 0, 'wait_seconds': 0.0}
+        self._lock = Lock()
+        # 接続プールの設定（ITSアクセスオブジェクトが対応している場合）
+        configure_pool = getattr(its_accessor, 'configure_pool', None)
+        if configure_pool is not None and pool_size > 0:
+            configure_pool(pool_size)
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def call(self, operation: str, func: Callable[..., Any], *args, idempotent: bool = True, **kwargs) -> Any:
+        """ITSアクセスオブジェクトの呼び出し
+
+        Args:
+            operation (str): 操作種別（処理時間の記録に使用）
+            func (Callable[..., Any]): 呼び出すメソッド
+            *args: メソッドの引数
+            idempotent (bool, optional): 冪等な操作の場合True. デフォルトはTrue.
+            **kwargs: メソッドのキーワード引数
+
+        Returns:
+            Any: メソッドの戻り値
+        """
+        attempt = 0
+        while True:
+            wait = self._bucket.acquire()
+            start_time = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._histogram.observe(operation, time.perf_counter() - start_time)
+                status_code = self._status_code(e)
+                if status_code in self.THROTTLE_STATUS:
+                    self._bucket.throttle()
+                    self._count('throttled')
+                if attempt >= self._max_retries or not self._is_retryable(e, status_code, idempotent):
+                    self._count('calls', wait_seconds=wait)
+                    raise
+                attempt += 1
+                self._count('retries', wait_seconds=wait)
+                time.sleep(self._backoff(attempt))
+                continue
+            self._histogram.observe(operation, time.perf_counter() - start_time)
+            self._bucket.recover()
+            self._count('calls', wait_seconds=wait)
+            return result
+
+    def get_histogram(self) -> LatencyHistogram:
+        """処理時間ヒストグラムの取得
+
+        Returns:
+            LatencyHistogram: 処理時間ヒストグラム
+        """
+        return self._histogram
+
+    def format_summary(self) -> str:
+        """転送制御の集計結果の文字列取得
+
+        Returns:
+            str: 呼び出し数・再試行数・流量半減数・流量制限の待機時間と処理時間ヒストグラムの文字列
+        """
+        with self._lock:
+            counters = dict(self._counters)
+        rate = self._bucket.get_rate()
+        lines = [f"ITS transport: {counters['calls']} calls, {counters['retries']} retries, {counters['throttled']} throttled, "
+                 f"rate limit wait={counters['wait_seconds']:.2f}s (rate={f'{rate:.1f} req/s' if rate > 0 else 'unlimited'})"]
+        histogram = self._histogram.format_histogram()
+        if histogram != '':
+            lines.append(histogram)
+        return '\n'.join(lines)
+
+    #
+    # protectedメソッド
+    #
+    def _status_code(self, error: Exception) -> Optional[int]:
+        """例外のHTTPステータスの取得
+
+        Args:
+            error (Exception): 発生した例外
+
+        Returns:
+            Optional[int]: HTTPステータス（取得できない場合はNone）
+        """
+        if isinstance(error, redmine_exceptions.ServerError):
+            return 500
+        status_code = getattr(error, 'status_code', None)
+        if status_code is None:
+            response = getattr(error, 'response', None)
+            status_code = getattr(response, 'status_code', None)
+        return int(status_code) if status_code is not None else None
+
+    def _is_retryable(self, error: Exception, status_code: Optional[int], idempotent: bool) -> bool:
+        """再試行可否の判定
+
+        Args:
+            error (Exception): 発生した例外
+            status_code (Optional[int]): HTTPステータス
+            idempotent (bool): 冪等な操作の場合True
+
+        Returns:
+            bool: 再試行する場合True
+        """
+        # サーバーが処理していないことが明らかなエラーは全ての操作で再試行
+        if status_code == 429 or isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not idempotent:
+            return False
+        return status_code in self.RETRY_STATUS or isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def _backoff(self, attempt: int) -> float:
+        """再試行の待機時間の取得
+
+        Args:
+            attempt (int): 再試行回数（1から）
+
+        Returns:
+            float: 待機時間（秒、指数的に増加する上限までの乱数）
+        """
+        return random.uniform(0, min(self._backoff_seconds * (2 ** (attempt - 1)), self._backoff_max_seconds))
+
+    def _count(self, key: str, wait_seconds: float = 0.0) -> None:
+        """集計値の加算
+
+        Args:
+            key (str): 集計キー
+            wait_seconds (float, optional): 流量制限の待機時間（秒）. デフォルトは0.
+        """
+        with self._lock:
+            self._counters[key] += 1
+            self._counters['wait_seconds'] += wait_seconds
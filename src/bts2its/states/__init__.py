@@ -0,0 +1,2 @@
+from .sync_state import SyncState
+from .its_snapshot import ItsSnapshot
\ No newline at end of file
@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+import json
+import os
+
+class ItsSnapshot:
+    """ITSチケットのスナップショット管理クラス
+
+    REST APIで取得したチケットデータと取得日時をプロジェクト毎のスナップショットファイルに保存する。
+    次回は前回取得日時以降に更新されたチケットのみ取得し、スナップショットにチケットID単位で反映する。
+    削除・移動されたチケットは差分取得では検出できないため、一定日数毎に全件を取得し直す。
+    """
+    #
+    # public定数
+    #
+    FORMAT_VERSION = 1                  # スナップショットファイルのフォーマットバージョン
+    #
+    # protected変数
+    #
+    _snapshot_path: Path = None         # スナップショットファイルパス
+    _snapshot: dict = None              # スナップショットデータ
+    #
+    # protected定数
+    #
+    _PULL_MARGIN = timedelta(minutes=5) # 差分取得の開始日時をさかのぼる時間（サーバーとの時刻のずれと取得中の更新を考慮）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, snapshot_path: Path) -> None:
+        """コンストラクタ
+
+        Args:
+            snapshot_path (Path): スナップショットファイルパス
+        """
+        self._snapshot_path = Path(snapshot_path)
+        self._snapshot = self._load()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def is_consistent(self, project_name: str, full_interval_days: int) -> bool:
+        """スナップショットの整合性判定
+
+        Args:
+            project_name (str): プロジェクト名
+            full_interval_days (int): 全件取得を行う間隔（日数）。マイナス値の場合は定期的な全件取得を行わない。
+
+        Returns:
+            bool: 差分取得に使用できる場合True
+        """
+        if self._snapshot.get('version') != self.FORMAT_VERSION or self._snapshot.get('project') != project_name:
+            return False
+        try:
+            last_full_pull = datetime.fromisoformat(self._snapshot.get('last_full_pull', ''))
+        except ValueError:
+            return False
+        if full_interval_days >= 0 and datetime.now(timezone.utc) - last_full_pull >= timedelta(days=full_interval_days):
+            print('ITS snapshot full pull interval elapsed. full pull is required.')
+            return False
+        return True
+
+    def get_updated_since(self) -> str:
+        """差分取得の更新日時の下限取得
+
+        Returns:
+            str: 前回取得日時からさかのぼった日時（UTC、ISO形式。未取得の場合は空文字）
+        """
+        try:
+            last_pull = datetime.fromisoformat(self._snapshot.get('last_pull', ''))
+        except ValueError:
+            return ''
+        return (last_pull - self._PULL_MARGIN).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def get_issues(self) -> List[Dict[str, Any]]:
+        """スナップショットのチケットデータ取得
+
+        Returns:
+            List[Dict[str, Any]]: チケットデータ（JSON）のリスト
+        """
+        return list(self._snapshot.get('issues', {}).values())
+
+    def save(self, project_name: str, issues: List[Dict[str, Any]], pulled_at: datetime, full_pull: bool) -> List[Dict[str, Any]]:
+        """取得したチケットの反映と保存
+
+        Args:
+            project_name (str): プロジェクト名
+            issues (List[Dict[str, Any]]): 取得したチケットデータ（JSON）のリスト
+            pulled_at (datetime): 取得開始日時（UTC）
+            full_pull (bool): 全件取得した場合True（スナップショットを置き換える）
+
+        Returns:
+            List[Dict[str, Any]]: 反映後の全チケットデータ（JSON）のリスト
+        """
+        merged = {} if full_pull else dict(self._snapshot.get('issues', {}))
+        for issue in issues:
+            merged[str(issue['id'])] = issue
+        pulled_at_str = pulled_at.isoformat(timespec='seconds')
+        self._snapshot = {
+            'version': self.FORMAT_VERSION,
+            'project': project_name,
+            'last_pull': pulled_at_str,
+            'last_full_pull': pulled_at_str if full_pull else self._snapshot.get('last_full_pull', pulled_at_str),
+            'issues': merged,
+        }
+        # 書き込み途中で中断してもスナップショットファイルが壊れないよう一時ファイルから置き換える
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._snapshot_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._snapshot, f, ensure_ascii=False)
+        os.replace(temp_path, self._snapshot_path)
+        return list(merged.values())
+
+    #
+    # protectedメソッド
+    #
+    def _load(self) -> dict:
+        """スナップショットファイルの読み込み
+
+        Returns:
+            dict: スナップショットデータ（ファイルが存在しない・読み込めない場合は空の辞書）
+        """
+        if not self._snapshot_path.is_file():
+            return {}
+        try:
+            with open(self._snapshot_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f'ITS snapshot load error. {e}')
+            return {}
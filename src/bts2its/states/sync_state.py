@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict
+import json
+import os
+
+class SyncState:
+    """差分同期の状態管理クラス
+
+    同期済みのBTS行のフィンガープリントと同期日時をプロジェクト毎の状態ファイルに保存する。
+    変換ルールの設定が変わった場合や、最後の全件同期から一定日数が経過した場合は状態を無効とする。
+    フィンガープリントはBTS行の内容のみから求めるため、ITS側のチケットの変更は全件同期まで検出されない。
+    """
+    #
+    # public定数
+    #
+    FORMAT_VERSION = 1                  # 状態ファイルのフォーマットバージョン
+    #
+    # protected変数
+    #
+    _state_path: Path = None            # 状態ファイルパス
+    _state: dict = None                 # 状態データ
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, state_path: Path) -> None:
+        """コンストラクタ
+
+        Args:
+            state_path (Path): 状態ファイルパス
+        """
+        self._state_path = Path(state_path)
+        self._state = self._load()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def is_consistent(self, signature: str, full_interval_days: int) -> bool:
+        """状態の整合性判定
+
+        Args:
+            signature (str): 変換ルールの設定を表す文字列
+            full_interval_days (int): 全件同期を行う間隔（日数）。マイナス値の場合は定期的な全件同期を行わない。
+
+        Returns:
+            bool: 差分同期に使用できる場合True
+        """
+        if self._state.get('version') != self.FORMAT_VERSION:
+            return False
+        if self._state.get('signature') != signature:
+            print('sync state signature mismatch. full sync is required.')
+            return False
+        try:
+            last_full_sync = datetime.fromisoformat(self._state.get('last_full_sync', ''))
+        except ValueError:
+            return False
+        if full_interval_days >= 0 and datetime.now() - last_full_sync >= timedelta(days=full_interval_days):
+            print('full sync interval elapsed. full sync is required.')
+            return False
+        return True
+
+    def get_fingerprints(self) -> Dict[str, int]:
+        """同期済みBTS行のフィンガープリント取得
+
+        Returns:
+            Dict[str, int]: BTS IDとフィンガープリントの辞書
+        """
+        return self._state.get('fingerprints', {})
+
+    def get_last_sync(self) -> str:
+        """最終同期日時の取得
+
+        Returns:
+            str: 最終同期日時（ISO形式、未同期の場合は空文字）
+        """
+        return self._state.get('last_sync', '')
+
+    def save(self, signature: str, fingerprints: Dict[str, int], full_sync: bool) -> None:
+        """状態の保存
+
+        Args:
+            signature (str): 変換ルールの設定を表す文字列
+            fingerprints (Dict[str, int]): 同期済みBTS行のBTS IDとフィンガープリントの辞書
+            full_sync (bool): 全件同期を行った場合True
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        self._state = {
+            'version': self.FORMAT_VERSION,
+            'signature': signature,
+            'last_sync': now,
+            'last_full_sync': now if full_sync else self._state.get('last_full_sync', now),
+            'fingerprints': fingerprints,
+        }
+        # 書き込み途中で中断しても状態ファイルが壊れないよう一時ファイルから置き換える
+        self._state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._state_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, ensure_ascii=False)
+        os.replace(temp_path, self._state_path)
+
+    #
+    # protectedメソッド
+    #
+    def _load(self) -> dict:
+        """状態ファイルの読み込み
+
+        Returns:
+            dict: 状態データ（ファイルが存在しない・読み込めない場合は空の辞書）
+        """
+        if not self._state_path.is_file():
+            return {}
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f'sync state load error. {e}')
+            return {}
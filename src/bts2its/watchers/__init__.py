@@ -0,0 +1 @@
+from .export_watcher import ExportWatcher
\ No newline at end of file
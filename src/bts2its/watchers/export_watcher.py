@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+import time
+
+class ExportWatcher:
+    """エクスポートファイルの変更監視クラス
+
+    ファイルの更新日時とサイズを一定間隔で確認し、変更を検出する。
+    エクスポートの書き込み途中で変換しないよう、変更後に一定時間変化がなくなるまで待機する。
+    Docker Desktopのボリュームマウント等ではファイルシステムの変更通知が届かないため、ポーリングで監視する。
+    """
+    #
+    # protected変数
+    #
+    _file_paths: Dict[str, Path] = None                         # 監視対象の種別とファイルパスの辞書
+    _signatures: Dict[str, Optional[Tuple[int, int]]] = None    # 種別毎の前回確認時の（更新日時, サイズ）
+    _poll_interval: float = 2.0                                 # 確認間隔（秒）
+    _debounce_seconds: float = 3.0                              # 変更後に変化がないことを確認する時間（秒）
+
+    #
+    # コンストラクタ/デストラクタ
+    #
+    def __init__(self, file_paths: Dict[str, Path], poll_interval: float = 2.0, debounce_seconds: float = 3.0) -> None:
+        """コンストラクタ
+
+        Args:
+            file_paths (Dict[str, Path]): 監視対象の種別（bts, its）とファイルパスの辞書
+            poll_interval (float, optional): 確認間隔（秒）. デフォルトは2.
+            debounce_seconds (float, optional): 変更後に変化がないことを確認する時間（秒）. デフォルトは3.
+        """
+        self._file_paths = {name: Path(file_path) for name, file_path in file_paths.items()}
+        self._poll_interval = max(float(poll_interval), 0.1)
+        self._debounce_seconds = max(float(debounce_seconds), 0.0)
+        self._signatures = {name: self._signature(file_path) for name, file_path in self._file_paths.items()}
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # publicメソッド
+    #
+    def wait_for_change(self, timeout: Optional[float] = None) -> Set[str]:
+        """ファイル変更の待機
+
+        いずれかのファイルが変更され、全ファイルが存在し一定時間変化がなくなるまで待機する。
+
+        Args:
+            timeout (Optional[float], optional): 最大待機時間（秒）. デフォルトはNone（変更まで待機）.
+
+        Returns:
+            Set[str]: 変更されたファイルの種別の集合（タイムアウトした場合は空の集合）
+        """
+        changed: Set[str] = set()
+        last_change = 0.0
+        start_time = time.monotonic()
+        while True:
+            time.sleep(self._poll_interval)
+            now = time.monotonic()
+            current = {name: self._signature(file_path) for name, file_path in self._file_paths.items()}
+            modified = {name for name, signature in current.items() if signature != self._signatures[name]}
+            self._signatures = current
+            if len(modified) > 0:
+                changed |= modified
+                last_change = now
+                continue
+            # 書き込み途中（ファイルの置き換え中を含む）でないことを確認
+            if len(changed) > 0 and now - last_change >= self._debounce_seconds and all(signature is not None for signature in current.values()):
+                return changed
+            if len(changed) == 0 and timeout is not None and now - start_time >= timeout:
+                return changed
+
+    #
+    # protectedメソッド
+    #
+    def _signature(self, file_path: Path) -> Optional[Tuple[int, int]]:
+        """ファイルの変更判定値の取得
+
+        Args:
+            file_path (Path): ファイルパス
+
+        Returns:
+            Optional[Tuple[int, int]]: （更新日時（ナノ秒）, サイズ）（ファイルが存在しない場合はNone）
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,164 @@
+from bts2its.config import Config
+from bts2its.interfaces import AbstractConverter
+from bts2its.mantis2redmine import BaseMantis2Redmine
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+import json
+import pandas as pd
+import pytest
+import threading
+
+KEYWORDS = BaseMantis2Redmine.FIXED_KEYWORDS
+
+# 登録2件・更新2件・操作なし1件の起票データ
+ENTRY_ROWS = [
+    {KEYWORDS['its_operation']: '登録', KEYWORDS['its_id']: '', KEYWORDS['its_title']: 'A', KEYWORDS['its_status']: '新規', KEYWORDS['its_description']: 'bts-1'},
+    {KEYWORDS['its_operation']: '登録', KEYWORDS['its_id']: '', KEYWORDS['its_title']: 'B', KEYWORDS['its_status']: '新規', KEYWORDS['its_description']: 'bts-2'},
+    {KEYWORDS['its_operation']: '更新', KEYWORDS['its_id']: '10', KEYWORDS['its_title']: 'C', KEYWORDS['its_status']: '終了', KEYWORDS['its_description']: 'bts-3'},
+    {KEYWORDS['its_operation']: '', KEYWORDS['its_id']: '11', KEYWORDS['its_title']: 'D', KEYWORDS['its_status']: '新規', KEYWORDS['its_description']: 'bts-4'},
+    {KEYWORDS['its_operation']: '更新', KEYWORDS['its_id']: '12', KEYWORDS['its_title']: 'E', KEYWORDS['its_status']: '新規', KEYWORDS['its_description']: 'bts-5'},
+]
+
+class FakeAccessor:
+    """起票・更新・取得の呼び出しを記録するITSアクセスオブジェクト"""
+    its_payload_template = {KEYWORDS['its_id']: '', KEYWORDS['its_title']: '', KEYWORDS['its_status']: ''}
+
+    def __init__(self, prefetch_error: bool = False, fail_titles=(), interrupt_titles=(), existing: dict = None) -> None:
+        self.calls = []
+        self.prefetch_error = prefetch_error
+        self.fail_titles = set(fail_titles)
+        self.interrupt_titles = set(interrupt_titles)
+        # 既存チケットの題名とIDの辞書を指定した場合のみ題名による検索に対応する
+        if existing is not None:
+            self.find_issue_ids = lambda title: [existing[title]] if title in existing else []
+
+    def load_project(self) -> bool:
+        return True
+
+    def load_issues(self, issue_ids, batch_size=100):
+        self.calls.append(('load_issues', list(issue_ids), batch_size))
+        if self.prefetch_error:
+            raise RuntimeError('prefetch failed')
+        return {str(issue_id): {'id': issue_id} for issue_id in issue_ids}
+
+    def load_issue(self, issue_id):
+        self.calls.append(('load_issue', issue_id))
+        return {'id': issue_id}
+
+    def create_issue(self, issue_data):
+        title = issue_data[KEYWORDS['its_title']]
+        if title in self.interrupt_titles:
+            # 起票要求の送信後に結果を受け取る前に中断した状態
+            raise KeyboardInterrupt()
+        if title in self.fail_titles:
+            raise RuntimeError(f'create failed: {title}')
+        self.calls.append(('create', title))
+        return SimpleNamespace(id=100 + len(self.calls))
+
+    def update_issue(self, issue, issue_data):
+        self.calls.append(('update', str(issue_data[KEYWORDS['its_id']])))
+        return True
+
+class FakeBts2Its:
+    """固定の起票データを返す変換オブジェクト"""
+    FIXED_KEYWORDS = KEYWORDS
+
+    def __init__(self, rows: list) -> None:
+        self._pd_its_entry = pd.DataFrame(rows)
+        self.saved_states = 0
+
+    def get_its_entry_data(self) -> pd.DataFrame:
+        return self._pd_its_entry
+
+    def save_sync_state(self) -> None:
+        self.saved_states += 1
+
+class OnePassConverter(AbstractConverter):
+    """必須のメソッドのみ実装し、呼び出しを記録する変換アダプター"""
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def convert(self, bts_data_path, its_data_path) -> None:
+        self.calls.append(('convert', bts_data_path, its_data_path))
+
+    def entry_its(self) -> None:
+        self.calls.append(('entry_its',))
+
+    def save_csv(self, file_path) -> None:
+        self.calls.append(('save_csv', file_path))
+
+@pytest.fixture
+def config_data(tmp_path, monkeypatch):
+    """テスト用の設定データ
+
+    出力フォルダを一時フォルダとし、設定ファイルの代わりに読み込まれる設定データ。
+    """
+    config_data = {
+        'path_settings': {'input_path': str(tmp_path / 'input'), 'output_path': str(tmp_path / 'output')},
+        'bts_settings': {'url': 'http://bts.example/view.php?id='},
+        'entry_settings': {'workers': 1, 'prefetch_batch_size': 0},
+    }
+    monkeypatch.setattr(Config, '_load_settings', lambda self: config_data)
+    return config_data
+
+@pytest.fixture
+def fake_accessor():
+    """呼び出しを記録するITSアクセスオブジェクトの生成関数"""
+    return FakeAccessor
+
+@pytest.fixture
+def one_pass_converter():
+    """デフォルト実装を使用する変換アダプター"""
+    return OnePassConverter()
+
+@pytest.fixture
+def entry_adaptor(config_data):
+    """固定の起票データを登録するアダプターの生成関数"""
+    from bts2its.adaptors import BaseConverterAdaptor
+
+    def make_adaptor(accessor, rows: list = ENTRY_ROWS):
+        adaptor = BaseConverterAdaptor('project')
+        adaptor._bts2its = FakeBts2Its(rows)
+        adaptor._its_accessor = accessor
+        return adaptor
+    return make_adaptor
+
+@pytest.fixture
+def redmine_server():
+    """チケット一覧のREST APIを返すRedmineのスタブサーバー
+
+    issue_id・updated_onのフィルタとoffset・limitによるページングに対応し、受け付けたクエリを記録する。
+    """
+    server = SimpleNamespace(issues=[], requests=[])
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+            server.requests.append(query)
+            issues = sorted(server.issues, key=lambda issue: issue['id'])
+            if 'issue_id' in query:
+                issue_ids = set(int(issue_id) for issue_id in query['issue_id'].split(','))
+                issues = [issue for issue in issues if issue['id'] in issue_ids]
+            if query.get('updated_on', '').startswith('>='):
+                issues = [issue for issue in issues if issue['updated_on'] >= query['updated_on'][2:]]
+            # Redmineと同様に1リクエストの取得件数は100件までとする
+            offset, limit = int(query.get('offset', 0)), min(int(query.get('limit', 25)), 100)
+            body = json.dumps({'issues': issues[offset:offset + limit], 'total_count': len(issues), 'offset': offset, 'limit': limit}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    server.url = f'http://127.0.0.1:{httpd.server_port}'
+    yield server
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,34 @@
+from bts2its import Config
+from bts2its.__main__ import run_batch
+import argparse
+import pytest
+
+@pytest.fixture
+def shared_config():
+    """テスト終了時に設定データの共有を解除する"""
+    yield
+    Config.share(None)
+
+def test_batch_projects_are_read_from_the_settings(config_data):
+    config_data['batch_settings'] = {'workers': 2, 'projects': [{'project': 'a', 'prefix': 'v1'}, {'project': 'b', 'prefix': None}, 'invalid']}
+    config = Config()
+    assert config.batch_workers() == 2
+    assert config.batch_projects() == [{'project': 'a', 'prefix': 'v1'}, {'project': 'b', 'prefix': ''}]
+
+def test_shared_settings_are_used_instead_of_the_settings_file(tmp_path, monkeypatch, shared_config):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'settings.yaml').write_text('bts_settings:\n  url: http://file.example/\n', encoding='utf-8')
+    assert Config().bts_url() == 'http://file.example/'
+    Config.share({'bts_settings': {'url': 'http://shared.example/'}})
+    assert Config().bts_url() == 'http://shared.example/'
+    assert Config().to_dict() == {'bts_settings': {'url': 'http://shared.example/'}}
+    Config.share(None)
+    assert Config().bts_url() == 'http://file.example/'
+
+def test_failed_projects_are_reported_without_stopping_the_batch(config_data, capsys, shared_config):
+    config_data['batch_settings'] = {'workers': 2, 'projects': [{'project': 'a'}, {'project': 'b'}]}
+    args = argparse.Namespace(input_path='', output_path='', skip_its_entry=True, full=False, plan=False)
+    run_batch(args=args, config=Config())
+    output = capsys.readouterr().out
+    assert 'Batch finished: 2 projects (0 succeeded, 2 failed)' in output
+    assert output.count('error: input check error') == 2
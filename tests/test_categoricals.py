@@ -0,0 +1,51 @@
+from bts2its.benchmarks.benchmark_runner import BenchmarkConverterAdaptor, BenchmarkMantis2Redmine
+from bts2its.benchmarks.export_generator import ExportGenerator
+from bts2its.common import ExportProfile, Mantis2RedmineParameters
+import pandas as pd
+import pytest
+
+BTS_BASE_URL = 'http://bts.example/view.php?id='
+
+@pytest.fixture(scope='module')
+def export_paths(tmp_path_factory):
+    profile = ExportProfile(bts_rows=500, parent_titles=['ENTRY'], bts_base_url=BTS_BASE_URL, seed=11)
+    return ExportGenerator(profile).generate(tmp_path_factory.mktemp('export'))
+
+def make_bts2its(engine: str, csv_engine: str = 'c', cache_path: str = '') -> BenchmarkMantis2Redmine:
+    parameters = Mantis2RedmineParameters(
+        project_name='project',
+        bts_prefix='',
+        bts_base_url=BTS_BASE_URL,
+        date_range=-1,
+        engine=engine,
+        csv_engine=csv_engine,
+        cache_path=cache_path,
+    )
+    return BenchmarkMantis2Redmine(parameters=parameters, parent_titles=['ENTRY'])
+
+def convert(export_paths, bts2its: BenchmarkMantis2Redmine) -> str:
+    adaptor = BenchmarkConverterAdaptor('project', bts2its, 'rss')
+    adaptor.convert(bts_data_path=export_paths['bts'], its_data_path=export_paths['its'])
+    return adaptor._bts2its.get_its_entry_data().to_csv(index=False)
+
+def test_low_cardinality_columns_are_loaded_as_categories(export_paths):
+    bts2its = make_bts2its('vectorized')
+    bts2its.load_bts(str(export_paths['bts']))
+    bts2its.load_its(str(export_paths['its']))
+    for pd_data, column in ((bts2its._pd_bts, 'ステータス'), (bts2its._pd_bts, '修正予定バージョン'), (bts2its._pd_its, 'ステータス'), (bts2its._pd_its, '対象バージョン')):
+        assert isinstance(pd_data[column].dtype, pd.CategoricalDtype)
+
+@pytest.mark.parametrize('csv_engine', ['c', 'pyarrow', 'cache'])
+def test_category_rules_match_the_row_engine(config_data, tmp_path, export_paths, csv_engine):
+    if csv_engine != 'c':
+        pytest.importorskip('pyarrow')
+    expected = convert(export_paths, make_bts2its('row'))
+    if csv_engine == 'cache':
+        # 1回目でキャッシュを作成し、2回目はキャッシュから読み込む
+        convert(export_paths, make_bts2its('vectorized', cache_path=str(tmp_path / 'cache')))
+        bts2its = make_bts2its('vectorized', cache_path=str(tmp_path / 'cache'))
+    else:
+        bts2its = make_bts2its('vectorized', csv_engine=csv_engine)
+    assert convert(export_paths, bts2its) == expected
+    if csv_engine == 'cache':
+        assert bts2its._csv_loader.get_last_stats()['engine'] == 'cache'
@@ -0,0 +1,65 @@
+from bts2its.entries import ChangePlan
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture
+def entry_data():
+    return pd.DataFrame({
+        '操作': ['登録', '更新', ''],
+        '#': ['', '12', '13'],
+        '題名': ['[1] "引用符", カンマ', '[2] 改行\nを含む', '[3] 変更なし'],
+        '予定工数': [1.5, np.nan, 0.0],
+        '進捗率': np.array([0, 50, 100], dtype=np.int64),
+    })
+
+@pytest.fixture
+def input_paths(tmp_path):
+    bts_path = tmp_path / 'bts.csv'
+    bts_path.write_text('Id\n1\n', encoding='utf-8')
+    return {'bts': bts_path}
+
+@pytest.mark.parametrize('file_name', ['plan.jsonl', 'plan.jsonl.gz'])
+def test_round_trip_keeps_rows_and_header(tmp_path, entry_data, input_paths, file_name):
+    ChangePlan(tmp_path / file_name).write(project_name='project', pd_its_entry=entry_data, input_paths=input_paths)
+
+    plan = ChangePlan(tmp_path / file_name)
+    rows = plan.read()
+    header = plan.get_header()
+    assert header['project'] == 'project'
+    assert header['rows'] == 3
+    assert header['columns'] == list(entry_data.columns)
+    assert header['inputs']['bts']['size'] == input_paths['bts'].stat().st_size
+    assert rows[0] == {'操作': '登録', '#': '', '題名': '[1] "引用符", カンマ', '予定工数': 1.5, '進捗率': 0}
+    assert rows[1]['題名'] == '[2] 改行\nを含む'
+    assert rows[1]['予定工数'] is None
+    assert [row['進捗率'] for row in rows] == [0, 50, 100]
+
+def test_modified_row_fails_checksum(tmp_path, entry_data, input_paths):
+    plan_path = tmp_path / 'plan.jsonl'
+    ChangePlan(plan_path).write(project_name='project', pd_its_entry=entry_data, input_paths=input_paths)
+    plan_path.write_text(plan_path.read_text(encoding='utf-8').replace('"12"', '"21"'), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='corrupted'):
+        ChangePlan(plan_path).read()
+
+def test_truncated_plan_fails_row_count(tmp_path, entry_data, input_paths):
+    plan_path = tmp_path / 'plan.jsonl'
+    ChangePlan(plan_path).write(project_name='project', pd_its_entry=entry_data, input_paths=input_paths)
+    lines = plan_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    plan_path.write_text(''.join(lines[:-1]), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='corrupted'):
+        ChangePlan(plan_path).read()
+
+def test_unsupported_version_is_rejected(tmp_path, entry_data, input_paths):
+    plan_path = tmp_path / 'plan.jsonl'
+    ChangePlan(plan_path).write(project_name='project', pd_its_entry=entry_data, input_paths=input_paths)
+    lines = plan_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    header = json.loads(lines[0])
+    header['version'] = ChangePlan.FORMAT_VERSION + 1
+    plan_path.write_text(json.dumps(header) + '\n' + ''.join(lines[1:]), encoding='utf-8')
+
+    with pytest.raises(ValueError, match='unsupported plan format'):
+        ChangePlan(plan_path).read()
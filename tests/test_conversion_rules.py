@@ -0,0 +1,62 @@
+from bts2its.benchmarks.benchmark_runner import BenchmarkConverterAdaptor, BenchmarkMantis2Redmine
+from bts2its.benchmarks.export_generator import ExportGenerator
+from bts2its.common import ExportProfile, Mantis2RedmineParameters
+import pytest
+
+CUSTOM_RULES = [
+    {'name': 'add', 'target': 'add',
+     'when': [{'field': 'bts_version', 'op': 'not_empty'}],
+     'set': {'its_operation': '$its_operation_add', 'its_tracker': 'バグ', 'its_assigned_to': '$bts_status'}},
+    {'name': 'reopen', 'target': 'update',
+     'when': [{'field': 'its_status', 'op': 'in', 'value': '$its_closed_status'}, {'field': 'bts_status', 'op': 'not_in', 'value': ['解決済', '完了']}],
+     'set': {'its_operation': '$its_operation_update', 'its_status': '$its_status_open', 'its_category': ['$its_category', '未分類']},
+     'stop': True},
+    {'name': 'version', 'target': 'update',
+     'when': [{'field': 'bts_version', 'op': 'ne', 'value': '$its_target_version'}],
+     'set': {'its_operation': '$its_operation_update', 'its_target_version': ['$bts_version', '$its_target_version'], 'its_description': '$bts_url'}},
+    {'name': 'priority', 'target': 'update',
+     'when': [{'field': 'its_priority', 'op': 'eq', 'value': '高'}],
+     'set': {'its_priority': '急いで'}},
+]
+
+@pytest.fixture(scope='module')
+def export_paths(tmp_path_factory):
+    profile = ExportProfile(bts_rows=600, parent_titles=['ENTRY'], bts_base_url='http://bts.example/view.php?id=', seed=3)
+    return ExportGenerator(profile).generate(tmp_path_factory.mktemp('export'))
+
+def convert(export_paths, engine: str, rules: list) -> str:
+    parameters = Mantis2RedmineParameters(
+        project_name='project',
+        bts_prefix='',
+        bts_base_url='http://bts.example/view.php?id=',
+        date_range=-1,
+        engine=engine,
+        conversion_rules=rules,
+    )
+    adaptor = BenchmarkConverterAdaptor('project', BenchmarkMantis2Redmine(parameters=parameters, parent_titles=['ENTRY']), 'rss')
+    adaptor.convert(bts_data_path=export_paths['bts'], its_data_path=export_paths['its'])
+    return adaptor._bts2its.get_its_entry_data().to_csv(index=False)
+
+@pytest.mark.parametrize('rules', [[], CUSTOM_RULES], ids=['default', 'custom'])
+def test_row_and_vectorized_engines_produce_identical_entries(config_data, export_paths, rules):
+    row_output = convert(export_paths, 'row', rules)
+    vectorized_output = convert(export_paths, 'vectorized', rules)
+    assert row_output == vectorized_output
+    # 登録・更新・変更なしが混在するデータで比較していることを確認
+    operations = {line.split(',')[0] for line in row_output.splitlines()[1:]}
+    assert {'登録', '更新', ''} <= operations
+
+def test_custom_rules_replace_the_default_rules(config_data, export_paths):
+    default_output = convert(export_paths, 'vectorized', [])
+    custom_output = convert(export_paths, 'vectorized', CUSTOM_RULES)
+    assert 'バグ' not in default_output
+    assert 'バグ' in custom_output
+
+@pytest.mark.parametrize('rules', [
+    [{'target': 'unknown'}],
+    [{'target': 'add', 'when': [{'field': 'no_such_field'}]}],
+    [{'target': 'add', 'when': [{'field': 'bts_status', 'op': 'in', 'value': 'not a list'}]}],
+])
+def test_invalid_rules_are_rejected(config_data, export_paths, rules):
+    with pytest.raises(ValueError):
+        convert(export_paths, 'vectorized', rules)
@@ -0,0 +1,120 @@
+from bts2its.loaders import CsvLoader
+import pandas as pd
+import pytest
+
+@pytest.fixture
+def export_path(tmp_path):
+    file_path = tmp_path / 'export.csv'
+    pd.DataFrame({
+        'Id': ['0001', '0002', '0003', '0004'],
+        '要約': ['"引用符", カンマ', '改行\nを含む', '', '通常'],
+        'ステータス': ['新規', '完了', '新規', '新規'],
+        '進捗率': [0, 50, 100, 20],
+        '更新日': ['2024-01-01 10:00', '2024/01/02', '', '2024-01-03'],
+    }).to_csv(file_path, index=False, encoding='utf-8-sig')
+    return file_path
+
+DTYPES = {'Id': 'str', '要約': 'str', 'ステータス': 'category', '進捗率': 'int64', '更新日': 'str', '存在しないカラム': 'str'}
+
+@pytest.mark.parametrize('engine', [CsvLoader.ENGINE_C, CsvLoader.ENGINE_PYTHON, CsvLoader.ENGINE_PYARROW])
+def test_engines_load_the_same_data_with_explicit_dtypes(export_path, engine):
+    if engine == CsvLoader.ENGINE_PYARROW:
+        pytest.importorskip('pyarrow')
+    loader = CsvLoader(engine)
+    pd_data = loader.load(export_path, columns=['Id', '要約', 'ステータス', '進捗率', '更新日'], dtypes=DTYPES)
+    expected = CsvLoader(CsvLoader.ENGINE_C).load(export_path, columns=['Id', '要約', 'ステータス', '進捗率', '更新日'], dtypes=DTYPES)
+    pd.testing.assert_frame_equal(pd_data, expected)
+    # 先頭の0が残り、型推定されないこと
+    assert pd_data['Id'].tolist() == ['0001', '0002', '0003', '0004']
+    assert isinstance(pd_data['ステータス'].dtype, pd.CategoricalDtype)
+    assert pd_data['進捗率'].dtype == 'int64'
+    assert loader.get_last_stats()['engine'] == engine
+    assert loader.get_last_stats()['rows'] == 4
+
+def test_columns_limit_the_loaded_columns(export_path):
+    pd_data = CsvLoader().load(export_path, columns=['Id', 'ステータス'], dtypes=DTYPES)
+    assert list(pd_data.columns) == ['Id', 'ステータス']
+
+def test_unknown_engine_falls_back_to_c():
+    assert CsvLoader('unknown')._engine == CsvLoader.ENGINE_C
+
+@pytest.fixture
+def versions_path(tmp_path):
+    file_path = tmp_path / 'versions.csv'
+    versions = ['PJ1_1.0', 'PJ2_1.0', '', 'PJ1_2.0', 'pj1_3.0', 'PJ1', 'XPJ1_1.0'] * 3
+    pd.DataFrame({
+        'Id': [f'{index:04d}' for index in range(len(versions))],
+        '修正予定バージョン': versions,
+    }).to_csv(file_path, index=False, encoding='utf-8-sig')
+    return file_path
+
+VERSION_DTYPES = {'Id': 'str', '修正予定バージョン': 'category'}
+
+def expected_prefix_rows(file_path, prefix: str) -> list:
+    pd_data = pd.read_csv(file_path, dtype=str, encoding='utf-8-sig')
+    return pd_data.loc[pd_data['修正予定バージョン'].fillna('').str.startswith(prefix), 'Id'].tolist()
+
+@pytest.mark.parametrize('engine', [CsvLoader.ENGINE_C, CsvLoader.ENGINE_PYTHON, CsvLoader.ENGINE_PYARROW])
+def test_prefix_filter_is_applied_while_loading(monkeypatch, versions_path, engine):
+    if engine == CsvLoader.ENGINE_PYARROW:
+        pytest.importorskip('pyarrow')
+    # 分割読み込みの境界をまたぐよう少ない行数で読み込む
+    monkeypatch.setattr(CsvLoader, '_FILTER_CHUNK_ROWS', 4)
+    pd_data = CsvLoader(engine).load(versions_path, dtypes=VERSION_DTYPES, prefix_filters={'修正予定バージョン': 'PJ1'})
+    assert pd_data['Id'].tolist() == expected_prefix_rows(versions_path, 'PJ1')
+    assert set(pd_data['修正予定バージョン']) == {'PJ1_1.0', 'PJ1_2.0', 'PJ1'}
+    assert isinstance(pd_data['修正予定バージョン'].dtype, pd.CategoricalDtype)
+
+def test_prefix_filter_without_matches_returns_the_columns(versions_path):
+    pd_data = CsvLoader().load(versions_path, dtypes=VERSION_DTYPES, prefix_filters={'修正予定バージョン': 'NONE'})
+    assert pd_data.empty
+    assert list(pd_data.columns) == ['Id', '修正予定バージョン']
+
+def test_empty_prefix_loads_every_row(versions_path):
+    pd_data = CsvLoader().load(versions_path, dtypes=VERSION_DTYPES, prefix_filters={'修正予定バージョン': ''})
+    assert len(pd_data) == 21
+
+def test_chunked_reads_apply_the_prefix_filter(versions_path):
+    chunks = list(CsvLoader().iter_chunks(versions_path, chunk_rows=5, dtypes=VERSION_DTYPES, prefix_filters={'修正予定バージョン': 'PJ1'}))
+    assert len(chunks) == 5
+    assert pd.concat(chunks)['Id'].tolist() == expected_prefix_rows(versions_path, 'PJ1')
+
+@pytest.fixture
+def large_export(tmp_path):
+    """引用符内の改行・カンマを含む複数範囲に分割されるエクスポートデータ"""
+    def write(encoding: str):
+        rows = 3000
+        file_path = tmp_path / f'large_{encoding}.csv'
+        pd.DataFrame({
+            'Id': [f'{index:05d}' for index in range(rows)],
+            '要約': [f'題名{index}\n"引用符", カンマ' if index % 7 == 0 else f'題名{index}' for index in range(rows)],
+            '修正予定バージョン': [['PJ1_1.0', 'PJ2_1.0', ''][index % 3] for index in range(rows)],
+            '進捗率': [index % 101 for index in range(rows)],
+            '予定工数': [index * 0.5 if index % 5 else None for index in range(rows)],
+        }).to_csv(file_path, index=False, encoding=encoding)
+        return file_path
+    return write
+
+LARGE_DTYPES = {'Id': 'str', '要約': 'str', '修正予定バージョン': 'category'}
+
+@pytest.mark.parametrize('encoding', ['utf-8-sig', 'cp932'])
+@pytest.mark.parametrize('prefix_filters', [None, {'修正予定バージョン': 'PJ1'}])
+def test_parallel_parse_matches_the_serial_parse(monkeypatch, capsys, large_export, encoding, prefix_filters):
+    monkeypatch.setattr(CsvLoader, '_PARALLEL_MIN_BYTES', 1)
+    file_path = large_export(encoding)
+    serial = CsvLoader(parse_workers=1).load(file_path, dtypes=LARGE_DTYPES, prefix_filters=prefix_filters)
+    capsys.readouterr()
+    parallel = CsvLoader(parse_workers=4).load(file_path, dtypes=LARGE_DTYPES, prefix_filters=prefix_filters)
+    assert 'workers=4' in capsys.readouterr().out
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert len(serial) == (1000 if prefix_filters else 3000)
+
+def test_parallel_parse_falls_back_when_inferred_types_differ(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(CsvLoader, '_PARALLEL_MIN_BYTES', 1)
+    # 後半のみ数値以外の値を含むカラムは範囲毎に推定型が異なる
+    values = [str(index) for index in range(2000)] + ['text'] * 10
+    pd.DataFrame({'Id': range(len(values)), '値': values}).to_csv(tmp_path / 'mixed.csv', index=False)
+    serial = CsvLoader(parse_workers=1).load(tmp_path / 'mixed.csv')
+    parallel = CsvLoader(parse_workers=4).load(tmp_path / 'mixed.csv')
+    assert 'CSV parallel parse skipped' in capsys.readouterr().out
+    pd.testing.assert_frame_equal(parallel, serial)
@@ -0,0 +1,67 @@
+from bts2its.common import Mantis2RedmineParameters
+from bts2its.mantis2redmine import DefaultMantis2Redmine
+from datetime import datetime, timedelta, timezone
+import bts2its.mantis2redmine.base_mantis2redmine as base_mantis2redmine
+import pandas as pd
+
+def write_bts(file_path, dates: list) -> None:
+    """指定した更新日のBTSデータを作成"""
+    pd.DataFrame({
+        'Id': [str(index + 1) for index in range(len(dates))],
+        '要約': [f'bug {index + 1}' for index in range(len(dates))],
+        'ステータス': '新規',
+        '修正予定バージョン': '',
+        '更新日': dates,
+    }).to_csv(file_path, index=False, encoding='utf-8-sig')
+
+def load_ids(file_path, date_range: int) -> list:
+    parameters = Mantis2RedmineParameters(project_name='project', bts_prefix='', bts_base_url='', date_range=date_range, engine='row')
+    bts2its = DefaultMantis2Redmine(parameters=parameters)
+    bts2its.load_bts(file_path)
+    return bts2its._pd_bts['Id'].astype(str).tolist()
+
+def days_ago(days: int, fmt: str = '%Y-%m-%d %H:%M') -> str:
+    return (datetime.now() - timedelta(days=days)).strftime(fmt)
+
+def test_rows_outside_the_date_range_are_dropped_at_load(tmp_path):
+    write_bts(tmp_path / 'bts.csv', [days_ago(1), days_ago(10), days_ago(3), days_ago(30)])
+    assert load_ids(tmp_path / 'bts.csv', 5) == ['1', '3']
+
+def test_negative_date_range_keeps_every_row(tmp_path):
+    write_bts(tmp_path / 'bts.csv', [days_ago(1), days_ago(1000), 'not a date'])
+    assert load_ids(tmp_path / 'bts.csv', -1) == ['1', '2', '3']
+
+def test_mixed_formats_are_parsed_and_invalid_dates_dropped(tmp_path):
+    write_bts(tmp_path / 'bts.csv', [days_ago(1), days_ago(2, '%Y/%m/%d'), 'not a date', '', days_ago(20, '%Y/%m/%d')])
+    assert load_ids(tmp_path / 'bts.csv', 5) == ['1', '2']
+
+def test_timezone_aware_dates_are_compared_in_local_time(tmp_path):
+    now = datetime.now(timezone.utc)
+    # 時差を除いただけでは期間外となる日時と、期間内となる日時
+    inside = (now - timedelta(days=4, hours=20)).astimezone(timezone(timedelta(hours=-10))).isoformat()
+    outside = (now - timedelta(days=5, hours=4)).astimezone(timezone(timedelta(hours=14))).isoformat()
+    # タイムゾーンの異なる日時とタイムゾーンなしの日時が混在する
+    write_bts(tmp_path / 'bts.csv', [inside, outside, days_ago(1), days_ago(6)])
+    assert load_ids(tmp_path / 'bts.csv', 5) == ['1', '3']
+
+def test_target_start_date_follows_the_current_time_on_each_load(tmp_path, monkeypatch):
+    start = datetime(2024, 3, 10, 12, 0)
+    write_bts(tmp_path / 'bts.csv', ['2024-03-09 00:00', '2024-03-06 00:00', '2024-03-14 00:00'])
+    parameters = Mantis2RedmineParameters(project_name='project', bts_prefix='', bts_base_url='', date_range=5, engine='row')
+    bts2its = DefaultMantis2Redmine(parameters=parameters)
+
+    class FixedDatetime(datetime):
+        """現在日時を固定したdatetime"""
+        current = start
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.current
+
+    monkeypatch.setattr(base_mantis2redmine, 'datetime', FixedDatetime)
+    bts2its.load_bts(tmp_path / 'bts.csv')
+    assert bts2its._pd_bts['Id'].astype(str).tolist() == ['1', '2', '3']
+    # 監視モードのように同じ変換オブジェクトで再読み込みすると、その時点の対象期間で抽出する
+    FixedDatetime.current = start + timedelta(days=4)
+    bts2its.load_bts(tmp_path / 'bts.csv')
+    assert bts2its._pd_bts['Id'].astype(str).tolist() == ['3']
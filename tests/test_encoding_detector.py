@@ -0,0 +1,36 @@
+from bts2its.loaders import CsvLoader, EncodingDetector
+import codecs
+import pytest
+
+CSV_TEXT = 'Id,要約\n1,"日本語の題名, カンマ付き"\n2,～①髙\n'
+
+@pytest.mark.parametrize('encoding, expected', [
+    ('utf-8-sig', EncodingDetector.ENCODING_UTF8),
+    ('utf-8', EncodingDetector.ENCODING_UTF8),
+    ('cp932', EncodingDetector.ENCODING_CP932),
+])
+def test_encoding_is_detected_from_the_content(tmp_path, encoding, expected):
+    (tmp_path / 'export.csv').write_bytes(CSV_TEXT.encode(encoding))
+    assert EncodingDetector().detect(tmp_path / 'export.csv') == expected
+
+def test_cp932_text_after_the_first_sample_is_detected(tmp_path):
+    # 先頭の標本はASCII文字のみで、中間以降に日本語を含む
+    text = 'Id,要約\n'.encode('cp932') + ''.join(f'{index},ascii title\n' for index in range(20000)).encode('ascii') + '20000,日本語の題名\n'.encode('cp932') * 5000
+    (tmp_path / 'export.csv').write_bytes(text)
+    assert EncodingDetector().detect(tmp_path / 'export.csv') == EncodingDetector.ENCODING_CP932
+
+def test_cp932_export_loads_without_decode_errors(tmp_path):
+    (tmp_path / 'export.csv').write_bytes(CSV_TEXT.encode('cp932'))
+    loader = CsvLoader()
+    pd_data = loader.load(tmp_path / 'export.csv', dtypes={'Id': 'str', '要約': 'str'})
+    assert pd_data['要約'].tolist() == ['日本語の題名, カンマ付き', '～①髙']
+    assert loader.get_last_stats()['encoding'] == EncodingDetector.ENCODING_CP932
+    assert loader.get_last_stats()['decode_errors'] == 0
+
+def test_invalid_bytes_are_replaced_and_counted(tmp_path, capsys):
+    (tmp_path / 'export.csv').write_bytes(codecs.BOM_UTF8 + 'Id,要約\n1,正常\n2,'.encode('utf-8') + b'\xff\xfe' + '破損\n'.encode('utf-8'))
+    loader = CsvLoader()
+    pd_data = loader.load(tmp_path / 'export.csv', dtypes={'Id': 'str', '要約': 'str'})
+    assert pd_data['要約'].tolist() == ['正常', '��破損']
+    assert loader.get_last_stats()['decode_errors'] == 2
+    assert 'CSV decode error' in capsys.readouterr().out
@@ -0,0 +1,85 @@
+from bts2its.entries import EntryJournal
+from pathlib import Path
+import pytest
+
+@pytest.fixture
+def journal_config(config_data):
+    config_data['entry_settings']['journal'] = True
+    return config_data
+
+def journal_statuses(config_data) -> dict:
+    journal = EntryJournal(Path(config_data['path_settings']['output_path']) / 'project' / 'entry_journal.sqlite3')
+    try:
+        rows = journal._connection.execute('SELECT title, status FROM operations').fetchall()
+    finally:
+        journal.close()
+    return dict(rows)
+
+def writes(accessor) -> list:
+    """ITSに送信した起票・更新の呼び出し"""
+    return [call for call in accessor.calls if call[0] in ('create', 'update')]
+
+def test_journal_records_survive_reopen(tmp_path):
+    journal = EntryJournal(tmp_path / 'journal.sqlite3')
+    key = journal.operation_key({'題名': 'A'})
+    journal.plan(key, '登録', '', 'A')
+    journal.commit()
+    journal.mark_started(key)
+    journal.close()
+
+    journal = EntryJournal(tmp_path / 'journal.sqlite3')
+    assert journal.get_status([key]) == {key: EntryJournal.STATUS_STARTED}
+    assert journal.get_in_doubt_creates([key]) == {key: 'A'}
+    journal.mark_done(key, 101)
+    assert journal.get_status([key]) == {key: EntryJournal.STATUS_DONE}
+    assert journal.get_in_doubt_creates([key]) == {}
+    assert journal.clear_done() == 1
+    assert journal.get_status([key]) == {}
+    journal.close()
+
+def test_failed_run_resumes_without_repeating_completed_operations(journal_config, fake_accessor, entry_adaptor):
+    first = entry_adaptor(fake_accessor(fail_titles={'B'}))
+    with pytest.raises(RuntimeError):
+        first.entry_its()
+    assert writes(first._its_accessor) == [('create', 'A')]
+    assert first._bts2its.saved_states == 0
+    assert journal_statuses(journal_config) == {'A': 'done', 'B': 'failed', 'C': 'planned', 'E': 'planned'}
+
+    second = entry_adaptor(fake_accessor())
+    second.entry_its()
+    assert writes(second._its_accessor) == [('create', 'B'), ('update', '10'), ('update', '12')]
+    assert second._bts2its.saved_states == 1
+    # 全件の登録が完了した時点で完了済みの記録は削除される
+    assert journal_statuses(journal_config) == {}
+
+def test_identical_operations_run_again_after_a_completed_run(journal_config, fake_accessor, entry_adaptor):
+    entry_adaptor(fake_accessor()).entry_its()
+    again = entry_adaptor(fake_accessor())
+    again.entry_its()
+    assert writes(again._its_accessor) == [('create', 'A'), ('create', 'B'), ('update', '10'), ('update', '12')]
+
+def test_unconfirmed_create_found_by_title_is_not_repeated(journal_config, fake_accessor, entry_adaptor):
+    with pytest.raises(KeyboardInterrupt):
+        entry_adaptor(fake_accessor(interrupt_titles={'A'})).entry_its()
+    assert journal_statuses(journal_config)['A'] == 'started'
+
+    resumed = entry_adaptor(fake_accessor(existing={'A': '55'}))
+    resumed.entry_its()
+    assert writes(resumed._its_accessor) == [('create', 'B'), ('update', '10'), ('update', '12')]
+
+def test_unconfirmed_create_not_found_by_title_is_repeated(journal_config, fake_accessor, entry_adaptor):
+    with pytest.raises(KeyboardInterrupt):
+        entry_adaptor(fake_accessor(interrupt_titles={'A'})).entry_its()
+
+    resumed = entry_adaptor(fake_accessor(existing={}))
+    resumed.entry_its()
+    assert writes(resumed._its_accessor) == [('create', 'A'), ('create', 'B'), ('update', '10'), ('update', '12')]
+
+def test_unconfirmed_create_is_kept_when_the_accessor_cannot_search(journal_config, fake_accessor, entry_adaptor):
+    with pytest.raises(KeyboardInterrupt):
+        entry_adaptor(fake_accessor(interrupt_titles={'A'})).entry_its()
+
+    resumed = entry_adaptor(fake_accessor())
+    resumed.entry_its()
+    assert writes(resumed._its_accessor) == [('create', 'B'), ('update', '10'), ('update', '12')]
+    assert journal_statuses(journal_config) == {'A': 'started'}
@@ -0,0 +1,69 @@
+from bts2its.redmine_accessor import DefaultRedmineAccessor
+import pytest
+
+def test_update_targets_are_prefetched_once(config_data, fake_accessor, entry_adaptor):
+    config_data['entry_settings']['prefetch_batch_size'] = 50
+    adaptor = entry_adaptor(fake_accessor())
+    adaptor.entry_its()
+    calls = adaptor._its_accessor.calls
+    # 操作のない行は取得せず、更新は一括取得したチケットを使用する
+    assert calls[0] == ('load_issues', ['10', '12'], 50)
+    assert not any(call[0] == 'load_issue' for call in calls)
+    assert ('update', '10') in calls and ('update', '12') in calls
+
+def test_prefetch_error_falls_back_to_single_loads(config_data, fake_accessor, entry_adaptor):
+    config_data['entry_settings']['prefetch_batch_size'] = 50
+    adaptor = entry_adaptor(fake_accessor(prefetch_error=True))
+    adaptor.entry_its()
+    calls = adaptor._its_accessor.calls
+    assert ('load_issue', '10') in calls and ('load_issue', '12') in calls
+    assert ('create', 'B') in calls
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_prefetch_is_disabled_by_batch_size(config_data, fake_accessor, entry_adaptor, batch_size):
+    config_data['entry_settings']['prefetch_batch_size'] = batch_size
+    adaptor = entry_adaptor(fake_accessor())
+    adaptor.entry_its()
+    assert not any(call[0] == 'load_issues' for call in adaptor._its_accessor.calls)
+
+def test_redmine_issues_are_loaded_in_batches(redmine_server):
+    redmine_server.issues = [{'id': issue_id, 'subject': f'issue {issue_id}', 'updated_on': '2024-01-01T00:00:00Z'} for issue_id in range(1, 301)]
+    accessor = DefaultRedmineAccessor('project', redmine_server.url, 'key')
+    # 重複・存在しないIDを含む
+    issue_ids = [str(issue_id) for issue_id in range(1, 251)] + ['1', '999']
+    issues = accessor.load_issues(issue_ids, batch_size=120)
+
+    assert sorted(issues, key=int) == [str(issue_id) for issue_id in range(1, 251)]
+    assert issues['42'].subject == 'issue 42'
+    # 120件ずつのissue_idフィルタで取得し、1リクエストで返されない101件目以降はoffsetを指定して取得する
+    batches = [(len(request['issue_id'].split(',')), int(request['offset']), int(request['limit'])) for request in redmine_server.requests]
+    assert batches == [(120, 0, 120), (120, 100, 20), (120, 0, 120), (120, 100, 20), (11, 0, 11)]
+    assert all(request['status_id'] == '*' for request in redmine_server.requests)
+
+class RecordingRedmineAccessor(DefaultRedmineAccessor):
+    """一括取得のみRedmineに問い合わせ、起票・更新を記録するITSアクセスオブジェクト"""
+    def __init__(self, url: str) -> None:
+        super().__init__('project', url, 'key')
+        self.updated = []
+
+    def load_project(self) -> bool:
+        return True
+
+    def load_issue(self, issue_id):
+        raise AssertionError(f'issue {issue_id} was not prefetched')
+
+    def create_issue(self, issue_data):
+        return None
+
+    def update_issue(self, issue, issue_data):
+        self.updated.append((issue.id, issue.subject))
+        return True
+
+def test_prefetched_redmine_issues_are_used_for_updates(config_data, entry_adaptor, redmine_server):
+    config_data['entry_settings']['prefetch_batch_size'] = 1
+    redmine_server.issues = [{'id': issue_id, 'subject': f'issue {issue_id}', 'updated_on': '2024-01-01T00:00:00Z'} for issue_id in range(1, 21)]
+    adaptor = entry_adaptor(RecordingRedmineAccessor(redmine_server.url))
+    adaptor.entry_its()
+    assert [request['issue_id'] for request in redmine_server.requests] == ['10', '12']
+    assert set(adaptor._prefetched_issues) == {'10', '12'}
+    assert adaptor._its_accessor.updated == [(10, 'issue 10'), (12, 'issue 12')]
@@ -0,0 +1,43 @@
+from bts2its.entries import EntryWriter
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture
+def entry_data():
+    rows = 25
+    return pd.DataFrame({
+        '操作': np.where(np.arange(rows) % 3 == 0, '登録', ''),
+        '#': [str(100 + index) if index % 3 else '' for index in range(rows)],
+        '題名': [f'[{index}] "引用符", カンマ\n改行' for index in range(rows)],
+        '予定工数': [np.nan if index % 4 == 0 else index * 0.5 for index in range(rows)],
+        '進捗率': np.arange(rows, dtype=np.int64) * 4,
+    })
+
+def to_csv_bytes(pd_its_entry: pd.DataFrame, file_path) -> bytes:
+    pd_its_entry.to_csv(file_path, index=False, encoding='utf-8-sig')
+    return file_path.read_bytes()
+
+@pytest.mark.parametrize('buffer_rows', [1, 7, 25, 1000])
+def test_chunked_writes_match_to_csv(tmp_path, entry_data, buffer_rows):
+    with EntryWriter(tmp_path / 'output.csv', buffer_rows=buffer_rows) as writer:
+        for start in range(0, len(entry_data), 6):
+            writer.write(entry_data.iloc[start:start + 6])
+    assert writer.get_rows() == len(entry_data)
+    assert (tmp_path / 'output.csv').read_bytes() == to_csv_bytes(entry_data, tmp_path / 'expected.csv')
+
+def test_empty_entry_data_writes_header_only(tmp_path, entry_data):
+    empty = entry_data.iloc[0:0]
+    with EntryWriter(tmp_path / 'output.csv') as writer:
+        writer.write(empty)
+    assert (tmp_path / 'output.csv').read_bytes() == to_csv_bytes(empty, tmp_path / 'expected.csv')
+
+def test_arrow_formats_contain_the_same_rows(tmp_path, entry_data):
+    pytest.importorskip('pyarrow')
+    with EntryWriter(tmp_path / 'output.csv', formats=['parquet', 'arrow'], buffer_rows=10) as writer:
+        writer.write(entry_data)
+    expected = pd.read_csv(tmp_path / 'output.csv', dtype=str, keep_default_na=False)
+    for file_path in writer.get_file_paths()[1:]:
+        pd_output = pd.read_parquet(file_path) if file_path.suffix == '.parquet' else pd.read_feather(file_path)
+        assert list(pd_output.columns) == list(entry_data.columns)
+        assert pd_output.fillna('').astype(str).values.tolist() == expected.values.tolist()
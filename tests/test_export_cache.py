@@ -0,0 +1,73 @@
+from bts2its.loaders import CsvLoader, ExportCache
+import os
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+DTYPES = {'Id': 'str', 'ステータス': 'category'}
+
+def write_export(file_path, status: str = '新規') -> None:
+    pd.DataFrame({'Id': ['0001', '0002'], 'ステータス': [status, '完了']}).to_csv(file_path, index=False, encoding='utf-8-sig')
+
+def touch(file_path) -> None:
+    """内容を変えずに更新日時を進める"""
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+@pytest.fixture
+def loader(tmp_path):
+    return CsvLoader(cache=ExportCache(tmp_path / 'cache'))
+
+def load_engine(loader: CsvLoader, file_path, columns=None) -> str:
+    pd_data = loader.load(file_path, columns=columns, dtypes=DTYPES)
+    assert pd_data['Id'].tolist() == ['0001', '0002']
+    return loader.get_last_stats()['engine']
+
+def test_unchanged_export_is_read_from_the_cache(tmp_path, loader):
+    write_export(tmp_path / 'export.csv')
+    assert load_engine(loader, tmp_path / 'export.csv') == CsvLoader.ENGINE_C
+    assert load_engine(loader, tmp_path / 'export.csv') == CsvLoader.ENGINE_CACHE
+    # キャッシュから読み込んだ場合も型指定が保持される
+    pd_data = loader.load(tmp_path / 'export.csv', dtypes=DTYPES)
+    assert isinstance(pd_data['ステータス'].dtype, pd.CategoricalDtype)
+
+def test_touched_export_with_the_same_content_stays_cached(tmp_path, loader):
+    write_export(tmp_path / 'export.csv')
+    load_engine(loader, tmp_path / 'export.csv')
+    touch(tmp_path / 'export.csv')
+    assert load_engine(loader, tmp_path / 'export.csv') == CsvLoader.ENGINE_CACHE
+
+def test_changed_content_invalidates_the_cache(tmp_path, loader):
+    write_export(tmp_path / 'export.csv')
+    load_engine(loader, tmp_path / 'export.csv')
+    # サイズが同じで内容が異なる場合
+    write_export(tmp_path / 'export.csv', status='対応')
+    touch(tmp_path / 'export.csv')
+    assert load_engine(loader, tmp_path / 'export.csv') == CsvLoader.ENGINE_C
+    assert loader.load(tmp_path / 'export.csv', dtypes=DTYPES)['ステータス'].tolist() == ['対応', '完了']
+    # サイズが異なる場合
+    write_export(tmp_path / 'export.csv', status='対応中')
+    assert load_engine(loader, tmp_path / 'export.csv') == CsvLoader.ENGINE_C
+
+def test_different_columns_use_a_separate_cache_entry(tmp_path, loader):
+    write_export(tmp_path / 'export.csv')
+    load_engine(loader, tmp_path / 'export.csv')
+    assert load_engine(loader, tmp_path / 'export.csv', columns=['Id']) == CsvLoader.ENGINE_C
+    assert load_engine(loader, tmp_path / 'export.csv', columns=['Id']) == CsvLoader.ENGINE_CACHE
+
+def test_entries_over_the_size_limit_are_evicted(tmp_path):
+    cache = ExportCache(tmp_path / 'cache', max_mb=0)
+    write_export(tmp_path / 'export.csv')
+    cache.save(tmp_path / 'export.csv', 'signature', pd.DataFrame({'Id': ['0001']}))
+    assert list((tmp_path / 'cache').glob('*.arrow')) == []
+    assert cache.load(tmp_path / 'export.csv', 'signature') is None
+
+def test_prefix_filters_use_a_separate_cache_entry(tmp_path, loader):
+    write_export(tmp_path / 'export.csv')
+    assert len(loader.load(tmp_path / 'export.csv', dtypes=DTYPES)) == 2
+    pd_data = loader.load(tmp_path / 'export.csv', dtypes=DTYPES, prefix_filters={'ステータス': '完'})
+    assert loader.get_last_stats()['engine'] == CsvLoader.ENGINE_C
+    assert pd_data['Id'].tolist() == ['0002']
+    loader.load(tmp_path / 'export.csv', dtypes=DTYPES, prefix_filters={'ステータス': '完'})
+    assert loader.get_last_stats()['engine'] == CsvLoader.ENGINE_CACHE
@@ -0,0 +1,65 @@
+from bts2its.watchers import ExportWatcher
+from pathlib import Path
+import threading
+import time
+import pytest
+
+@pytest.fixture
+def export_paths(tmp_path):
+    file_paths = {'bts': tmp_path / 'bts.csv', 'its': tmp_path / 'its.csv'}
+    for file_path in file_paths.values():
+        file_path.write_text('Id\n', encoding='utf-8')
+    return file_paths
+
+def write_later(actions: list) -> threading.Thread:
+    """指定秒数後にファイル操作を順に実行するスレッド"""
+    def run():
+        for delay, action in actions:
+            time.sleep(delay)
+            action()
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+def append(file_path):
+    """ファイルに1行追記する操作"""
+    def run():
+        with open(file_path, 'a', encoding='utf-8') as f:
+            f.write('1\n')
+    return run
+
+def test_no_change_times_out_with_an_empty_set(export_paths):
+    watcher = ExportWatcher(export_paths, poll_interval=0.1, debounce_seconds=0.2)
+    assert watcher.wait_for_change(timeout=0.3) == set()
+
+def test_change_is_reported_after_the_debounce_time(export_paths):
+    watcher = ExportWatcher(export_paths, poll_interval=0.1, debounce_seconds=0.3)
+    write_later([(0.05, append(export_paths['its']))])
+    start_time = time.monotonic()
+    assert watcher.wait_for_change(timeout=5) == {'its'}
+    assert time.monotonic() - start_time >= 0.3
+
+def test_continuous_writes_are_debounced_until_they_stop(export_paths):
+    watcher = ExportWatcher(export_paths, poll_interval=0.1, debounce_seconds=0.3)
+    # 0.8秒間書き込みを続け、途中でITS側も更新する
+    actions = [(0.1, append(export_paths['bts'])) for _ in range(8)]
+    actions.insert(4, (0.0, append(export_paths['its'])))
+    start_time = time.monotonic()
+    thread = write_later(actions)
+    assert watcher.wait_for_change(timeout=5) == {'bts', 'its'}
+    assert time.monotonic() - start_time >= 0.8 + 0.3
+    thread.join()
+
+def test_missing_file_is_waited_for_while_being_replaced(export_paths):
+    watcher = ExportWatcher(export_paths, poll_interval=0.1, debounce_seconds=0.2)
+    # 削除から再作成までの間は変換しない
+    thread = write_later([(0.05, export_paths['bts'].unlink), (0.6, lambda: export_paths['bts'].write_text('Id\n1\n', encoding='utf-8'))])
+    start_time = time.monotonic()
+    assert watcher.wait_for_change(timeout=5) == {'bts'}
+    assert time.monotonic() - start_time >= 0.65
+    assert export_paths['bts'].is_file()
+    thread.join()
+
+def test_default_changed_conversion_reloads_every_input(one_pass_converter):
+    one_pass_converter.convert_changed(Path('bts.csv'), Path('its.csv'), changed_inputs={'bts'})
+    assert one_pass_converter.calls == [('convert', Path('bts.csv'), Path('its.csv'))]
@@ -0,0 +1,144 @@
+from bts2its.adaptors import BaseConverterAdaptor
+from bts2its.benchmarks.benchmark_runner import BenchmarkMantis2Redmine
+from bts2its.benchmarks.export_generator import ExportGenerator
+from bts2its.common import ExportProfile, Mantis2RedmineParameters
+from bts2its.interfaces import AbstractBts2Its
+from bts2its.redmine_accessor import DefaultRedmineAccessor
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import pandas as pd
+import pytest
+
+def make_issues(issue_ids, updated_on: str = '2024-01-01T00:00:00Z') -> list:
+    return [{'id': issue_id, 'subject': f'issue {issue_id}', 'updated_on': updated_on} for issue_id in issue_ids]
+
+def test_project_issues_are_paged_by_total_count(redmine_server):
+    redmine_server.issues = make_issues(range(1, 51))
+    issues = DefaultRedmineAccessor('project', redmine_server.url, 'key').load_project_issues(page_size=7, workers=3)
+
+    assert [issue['id'] for issue in issues] == list(range(1, 51))
+    # 先頭ページで総件数を取得し、残りのページを1回ずつ取得する
+    assert redmine_server.requests[0]['offset'] == '0'
+    assert sorted(int(request['offset']) for request in redmine_server.requests) == list(range(0, 50, 7))
+    assert all(request['limit'] == '7' and request['status_id'] == '*' and request['project_id'] == 'project' for request in redmine_server.requests)
+
+def test_updated_since_is_sent_as_an_updated_on_filter(redmine_server):
+    redmine_server.issues = make_issues(range(1, 6)) + make_issues(range(6, 9), updated_on='2024-02-01T00:00:00Z')
+    issues = DefaultRedmineAccessor('project', redmine_server.url, 'key').load_project_issues(updated_since='2024-01-15T00:00:00Z')
+    assert [issue['id'] for issue in issues] == [6, 7, 8]
+    assert [request['updated_on'] for request in redmine_server.requests] == ['>=2024-01-15T00:00:00Z']
+
+def test_incremental_pull_is_merged_into_the_snapshot(config_data, redmine_server):
+    config_data['its_settings'] = {'source': 'rest', 'snapshot': True, 'page_size': 4, 'fetch_workers': 2}
+    config_data['sync_settings'] = {'full_interval_days': 7}
+    adaptor = BaseConverterAdaptor('project')
+    adaptor._its_accessor = DefaultRedmineAccessor('project', redmine_server.url, 'key')
+    snapshot_path = Path(config_data['path_settings']['output_path']) / 'project' / 'its_snapshot.json'
+
+    # 初回は全件取得
+    redmine_server.issues = make_issues(range(1, 11))
+    assert len(adaptor._pull_its_issues(full_pull=False)) == 10
+    assert all('updated_on' not in request for request in redmine_server.requests)
+    last_pull = datetime.fromisoformat(json.loads(snapshot_path.read_text(encoding='utf-8'))['last_pull'])
+
+    # 2回目は前回取得日時から取得マージン分さかのぼって更新されたチケットのみ取得する
+    updated_on = (last_pull + timedelta(minutes=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    redmine_server.issues = make_issues([2] + list(range(4, 11))) + [{'id': 3, 'subject': 'updated', 'updated_on': updated_on}, {'id': 11, 'subject': 'new', 'updated_on': updated_on}]
+    redmine_server.requests.clear()
+    issues = {issue['id']: issue['subject'] for issue in adaptor._pull_its_issues(full_pull=False)}
+    assert [request['updated_on'] for request in redmine_server.requests] == ['>=' + (last_pull - timedelta(minutes=5)).strftime('%Y-%m-%dT%H:%M:%SZ')]
+    # 差分取得では削除されたチケット1は検出できず、スナップショットに残る
+    assert sorted(issues) == list(range(1, 12))
+    assert issues[3] == 'updated' and issues[11] == 'new'
+
+    # 全件取得ではスナップショットを置き換える
+    redmine_server.requests.clear()
+    issues = adaptor._pull_its_issues(full_pull=True)
+    assert all('updated_on' not in request for request in redmine_server.requests)
+    assert sorted(issue['id'] for issue in issues) == list(range(2, 12))
+
+class CsvOnlyBts2Its(AbstractBts2Its):
+    """ITSデータをCSVファイルからのみ読み込む変換オブジェクト"""
+    def load_bts(self, file_path: Path) -> None:
+        pass
+
+    def load_its(self, file_path: Path) -> None:
+        pass
+
+    def bts_to_its(self) -> None:
+        pass
+
+    def get_its_entry_data(self) -> pd.DataFrame:
+        return pd.DataFrame()
+
+class RestBts2Its(CsvOnlyBts2Its):
+    """REST APIの取得結果を読み込める変換オブジェクト"""
+    def load_its_issues(self, issues) -> None:
+        pass
+
+class Accessor:
+    """プロジェクトのチケット一括取得に対応しないITSアクセスオブジェクト"""
+    its_payload_template = {}
+
+class RestAccessor(Accessor):
+    """プロジェクトのチケット一括取得に対応したITSアクセスオブジェクト"""
+    def load_project_issues(self, updated_since='', page_size=100, workers=4):
+        return []
+
+@pytest.mark.parametrize('bts2its, accessor, expected', [
+    (RestBts2Its(), RestAccessor(), True),
+    (CsvOnlyBts2Its(), RestAccessor(), False),
+    (RestBts2Its(), Accessor(), False),
+])
+def test_rest_source_requires_accessor_and_converter_support(config_data, bts2its, accessor, expected):
+    adaptor = BaseConverterAdaptor('project')
+    adaptor._bts2its = bts2its
+    adaptor._its_accessor = accessor
+    assert adaptor.supports_its_source('rest') is expected
+    assert adaptor.supports_its_source('csv') is True
+
+def to_issue(row: pd.Series) -> dict:
+    """Redmineエクスポートの行データからREST APIのチケットデータを作成"""
+    def named(value: str):
+        return {'id': 1, 'name': value} if value != '' else None
+    def number(value: str, cast=float):
+        return cast(value) if value != '' else None
+    issue = {
+        'id': int(row['#']),
+        'tracker': named(row['トラッカー']),
+        'status': named(row['ステータス']),
+        'priority': named(row['優先度']),
+        'author': named(row['作成者']),
+        'subject': row['題名'],
+        'description': row['説明'],
+        'done_ratio': number(row['進捗率'], int),
+        'estimated_hours': number(row['予定工数']),
+        'spent_hours': number(row['作業工数']),
+        'start_date': row['開始日'] or None,
+        'due_date': row['期日'] or None,
+        'closed_on': row['終了日'] or None,
+    }
+    if row['親チケット'] != '':
+        issue['parent'] = {'id': int(row['親チケット'])}
+    if row['担当者'] != '':
+        issue['assigned_to'] = named(row['担当者'])
+    if row['対象バージョン'] != '':
+        issue['fixed_version'] = named(row['対象バージョン'])
+    return issue
+
+@pytest.mark.parametrize('engine', ['row', 'vectorized'])
+def test_rest_issues_convert_like_the_csv_export(config_data, tmp_path, engine):
+    profile = ExportProfile(bts_rows=400, parent_titles=['ENTRY'], bts_base_url='http://bts.example/view.php?id=', seed=5)
+    paths = ExportGenerator(profile).generate(tmp_path / 'export')
+    issues = [to_issue(row) for _, row in pd.read_csv(paths['its'], dtype=str, keep_default_na=False).iterrows()]
+    parameters = Mantis2RedmineParameters(project_name='project', bts_prefix='', bts_base_url='http://bts.example/view.php?id=', date_range=-1, engine=engine)
+
+    outputs = []
+    for load in (lambda bts2its: bts2its.load_its(str(paths['its'])), lambda bts2its: bts2its.load_its_issues(issues)):
+        bts2its = BenchmarkMantis2Redmine(parameters=parameters, parent_titles=['ENTRY'])
+        load(bts2its)
+        bts2its.load_bts(str(paths['bts']))
+        bts2its.bts_to_its()
+        outputs.append(bts2its.get_its_entry_data().to_csv(index=False))
+    assert outputs[0] == outputs[1]
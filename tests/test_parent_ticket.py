@@ -0,0 +1,31 @@
+from bts2its.benchmarks.benchmark_runner import BenchmarkMantis2Redmine
+from bts2its.common import Mantis2RedmineParameters
+import pandas as pd
+import pytest
+
+def load_parent(tmp_path, parent_titles: list, titles: list):
+    """指定した題名のITSデータを読み込み、親チケットを取得"""
+    pd.DataFrame({
+        '#': list(range(1, len(titles) + 1)),
+        'ステータス': '新規',
+        '題名': titles,
+    }).to_csv(tmp_path / 'its.csv', index=False, encoding='utf-8-sig')
+    parameters = Mantis2RedmineParameters(project_name='project', bts_prefix='', bts_base_url='', date_range=-1, engine='vectorized')
+    bts2its = BenchmarkMantis2Redmine(parameters=parameters, parent_titles=parent_titles)
+    bts2its.load_its(str(tmp_path / 'its.csv'))
+    return bts2its._get_its_parent_ticket()
+
+def test_first_existing_parent_title_in_order_is_used(tmp_path):
+    parent = load_parent(tmp_path, ['NONE', 'ENTRY', 'OTHER'], ['OTHER', 'child', 'ENTRY', 'ENTRY'])
+    # 指定順で最初に存在する題名を使用し、同じ題名のチケットは先頭のIDを使用する
+    assert parent['title'] == 'ENTRY'
+    assert parent['id'] == 3
+    assert parent['title_format'].format('12', 'bug') == 'ENTRY[12:bug]'
+
+def test_braces_in_the_parent_title_are_kept(tmp_path):
+    parent = load_parent(tmp_path, ['{ENTRY}'], ['{ENTRY}'])
+    assert parent['title_format'].format('12', '{bug}') == '{ENTRY}[12:{bug}]'
+
+@pytest.mark.parametrize('parent_titles', [[], ['NONE']])
+def test_missing_parent_ticket_returns_none(tmp_path, parent_titles):
+    assert load_parent(tmp_path, parent_titles, ['ENTRY']) is None
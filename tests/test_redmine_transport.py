@@ -0,0 +1,60 @@
+from bts2its.redmine_accessor import RedmineTransport
+import pytest
+import requests
+
+class HttpError(Exception):
+    """HTTPステータス付きの例外"""
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+
+def failing(errors: list, result: str = 'ok'):
+    """指定した例外を順に送出した後に結果を返す呼び出し対象"""
+    calls = []
+    def func():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    return func, calls
+
+def make_transport(max_retries: int = 3) -> RedmineTransport:
+    return RedmineTransport(object(), max_retries=max_retries, backoff_seconds=0)
+
+@pytest.mark.parametrize('error', [HttpError(500), HttpError(503), requests.exceptions.ConnectionError(), requests.exceptions.ReadTimeout()])
+def test_idempotent_call_retries_transient_errors(error):
+    func, calls = failing([error, error])
+    assert make_transport().call('load', func) == 'ok'
+    assert len(calls) == 3
+
+@pytest.mark.parametrize('error', [HttpError(500), HttpError(503), requests.exceptions.ConnectionError(), requests.exceptions.ReadTimeout()])
+def test_non_idempotent_call_is_not_retried_when_the_server_may_have_processed_it(error):
+    func, calls = failing([error])
+    with pytest.raises(type(error)):
+        make_transport().call('create', func, idempotent=False)
+    assert len(calls) == 1
+
+@pytest.mark.parametrize('error', [HttpError(429), requests.exceptions.ConnectTimeout()])
+def test_non_idempotent_call_is_retried_when_the_request_was_rejected(error):
+    func, calls = failing([error])
+    assert make_transport().call('create', func, idempotent=False) == 'ok'
+    assert len(calls) == 2
+
+def test_client_errors_are_not_retried():
+    func, calls = failing([HttpError(404)])
+    with pytest.raises(HttpError):
+        make_transport().call('load', func)
+    assert len(calls) == 1
+
+def test_retries_stop_at_max_retries():
+    func, calls = failing([HttpError(502)] * 5)
+    with pytest.raises(HttpError):
+        make_transport(max_retries=2).call('load', func)
+    assert len(calls) == 3
+
+def test_summary_counts_calls_and_retries():
+    transport = make_transport()
+    func, _ = failing([HttpError(503)])
+    transport.call('load', func)
+    summary = transport.format_summary()
+    assert '1 calls, 1 retries, 1 throttled' in summary
@@ -0,0 +1,21 @@
+from bts2its.__main__ import save_metrics
+from bts2its.adaptors import BaseConverterAdaptor
+from bts2its.config import Config
+import json
+
+def test_metrics_are_saved_as_json_and_prometheus(config_data, tmp_path):
+    config_data['metrics_settings'] = {'enabled': True, 'prometheus_textfile_path': str(tmp_path / 'prom')}
+    adaptor = BaseConverterAdaptor('project')
+    with adaptor._stage_recorder.measure('load_bts') as stage:
+        stage['rows'] = 3
+    save_metrics(converter=adaptor, project='project', output_path=tmp_path, config=Config())
+
+    metrics = json.loads((tmp_path / 'project' / Config().metrics_output_file()).read_text(encoding='utf-8'))
+    assert 'load_bts' in json.dumps(metrics)
+    assert (tmp_path / 'prom' / 'bts2its_project.prom').is_file()
+
+def test_adaptor_without_stage_metrics_does_not_fail_the_run(config_data, tmp_path, one_pass_converter, capsys):
+    config_data['metrics_settings'] = {'enabled': True}
+    save_metrics(converter=one_pass_converter, project='project', output_path=tmp_path, config=Config())
+    assert 'OnePassConverter does not support stage metrics.' in capsys.readouterr().out
+    assert not (tmp_path / 'project').exists()
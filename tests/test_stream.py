@@ -0,0 +1,58 @@
+from bts2its.benchmarks.benchmark_runner import BenchmarkConverterAdaptor, BenchmarkMantis2Redmine
+from bts2its.benchmarks.export_generator import ExportGenerator
+from bts2its.common import ExportProfile, Mantis2RedmineParameters
+from bts2its.states import SyncState
+from pathlib import Path
+import pytest
+
+BTS_BASE_URL = 'http://bts.example/view.php?id='
+
+@pytest.fixture(scope='module')
+def export_paths(tmp_path_factory):
+    profile = ExportProfile(bts_rows=500, parent_titles=['ENTRY'], bts_base_url=BTS_BASE_URL, seed=7)
+    return ExportGenerator(profile).generate(tmp_path_factory.mktemp('export'))
+
+def convert(export_paths, output_path: Path, engine: str, chunk_rows: int, sync_state_path: str = '') -> str:
+    """分割行数を指定して変換し、起票データのCSVファイルの内容を返す（0の場合は分割しない）"""
+    parameters = Mantis2RedmineParameters(
+        project_name='project',
+        bts_prefix='',
+        bts_base_url=BTS_BASE_URL,
+        date_range=-1,
+        engine=engine,
+        chunk_rows=chunk_rows,
+        sync_state_path=sync_state_path,
+        full_sync_interval_days=-1,
+    )
+    adaptor = BenchmarkConverterAdaptor('project', BenchmarkMantis2Redmine(parameters=parameters, parent_titles=['ENTRY']), 'rss')
+    if chunk_rows > 0:
+        adaptor.convert_stream(bts_data_path=export_paths['bts'], its_data_path=export_paths['its'], output_file_path=output_path, entry=False)
+    else:
+        adaptor.convert(bts_data_path=export_paths['bts'], its_data_path=export_paths['its'])
+        adaptor.save_csv(file_path=output_path)
+    adaptor._bts2its.save_sync_state()
+    return output_path.read_text(encoding='utf-8-sig')
+
+@pytest.mark.parametrize('engine', ['row', 'vectorized'])
+@pytest.mark.parametrize('chunk_rows', [7, 64, 10000])
+def test_chunked_conversion_matches_the_whole_file_conversion(config_data, tmp_path, export_paths, engine, chunk_rows):
+    expected = convert(export_paths, tmp_path / 'whole.csv', engine, 0)
+    assert convert(export_paths, tmp_path / 'chunked.csv', engine, chunk_rows) == expected
+    assert len(expected.splitlines()) > 1
+
+def test_chunked_conversion_saves_the_same_sync_state(config_data, tmp_path, export_paths):
+    convert(export_paths, tmp_path / 'whole.csv', 'vectorized', 0, str(tmp_path / 'whole.json'))
+    convert(export_paths, tmp_path / 'chunked.csv', 'vectorized', 64, str(tmp_path / 'chunked.json'))
+    fingerprints = SyncState(tmp_path / 'whole.json').get_fingerprints()
+    assert len(fingerprints) > 0
+    assert SyncState(tmp_path / 'chunked.json').get_fingerprints() == fingerprints
+
+    # 2回目は差分同期となり、分割の有無によらず同じ起票データとなる
+    whole = convert(export_paths, tmp_path / 'whole.csv', 'vectorized', 0, str(tmp_path / 'whole.json'))
+    assert convert(export_paths, tmp_path / 'chunked.csv', 'vectorized', 64, str(tmp_path / 'chunked.json')) == whole
+
+@pytest.mark.parametrize('entry', [True, False])
+def test_default_stream_conversion_runs_in_one_pass(one_pass_converter, entry):
+    one_pass_converter.convert_stream(Path('bts.csv'), None, Path('output.csv'), entry=entry)
+    expected = [('convert', Path('bts.csv'), None), ('save_csv', Path('output.csv'))]
+    assert one_pass_converter.calls == expected + ([('entry_its',)] if entry else [])
@@ -0,0 +1,136 @@
+from bts2its.adaptors import BaseConverterAdaptor
+from bts2its.common import Mantis2RedmineParameters
+from bts2its.mantis2redmine import DefaultMantis2Redmine
+from bts2its.states import SyncState
+from datetime import datetime, timedelta
+import json
+import pandas as pd
+import pytest
+
+BTS_BASE_URL = 'http://bts.example/view.php?id='
+
+def test_saved_state_is_consistent_only_with_the_same_signature(tmp_path):
+    SyncState(tmp_path / 'sync_state.json').save(signature='rules', fingerprints={'1': 10}, full_sync=True)
+    state = SyncState(tmp_path / 'sync_state.json')
+    assert state.is_consistent('rules', 7) is True
+    assert state.is_consistent('other rules', 7) is False
+    assert state.get_fingerprints() == {'1': 10}
+
+def test_full_sync_interval_invalidates_the_state(tmp_path):
+    state_path = tmp_path / 'sync_state.json'
+    SyncState(state_path).save(signature='rules', fingerprints={}, full_sync=True)
+    state = json.loads(state_path.read_text(encoding='utf-8'))
+    state['last_full_sync'] = (datetime.now() - timedelta(days=8)).isoformat(timespec='seconds')
+    state_path.write_text(json.dumps(state), encoding='utf-8')
+    assert SyncState(state_path).is_consistent('rules', 7) is False
+    assert SyncState(state_path).is_consistent('rules', 30) is True
+    # マイナス値の場合は定期的な全件同期を行わない
+    assert SyncState(state_path).is_consistent('rules', -1) is True
+
+def test_incremental_save_keeps_the_last_full_sync(tmp_path):
+    state_path = tmp_path / 'sync_state.json'
+    SyncState(state_path).save(signature='rules', fingerprints={}, full_sync=True)
+    last_full_sync = json.loads(state_path.read_text(encoding='utf-8'))['last_full_sync']
+    SyncState(state_path).save(signature='rules', fingerprints={}, full_sync=False)
+    assert json.loads(state_path.read_text(encoding='utf-8'))['last_full_sync'] == last_full_sync
+
+@pytest.mark.parametrize('content', ['', '{broken', json.dumps({'version': SyncState.FORMAT_VERSION + 1, 'signature': 'rules'})])
+def test_unreadable_or_unknown_state_requires_a_full_sync(tmp_path, content):
+    (tmp_path / 'sync_state.json').write_text(content, encoding='utf-8')
+    state = SyncState(tmp_path / 'sync_state.json')
+    assert state.is_consistent('rules', -1) is False
+
+def write_bts(file_path, titles: list) -> None:
+    pd.DataFrame({
+        'Id': [str(index + 1) for index in range(len(titles))],
+        '要約': titles,
+        'ステータス': '新規',
+        '修正予定バージョン': '1.0',
+        '更新日': '2024-01-01',
+    }).to_csv(file_path, index=False, encoding='utf-8-sig')
+
+def make_bts2its(tmp_path, full_sync: bool = False) -> DefaultMantis2Redmine:
+    parameters = Mantis2RedmineParameters(
+        project_name='project',
+        bts_prefix='',
+        bts_base_url=BTS_BASE_URL,
+        date_range=-1,
+        engine='row',
+        sync_state_path=str(tmp_path / 'sync_state.json'),
+        full_sync_interval_days=-1,
+    )
+    bts2its = DefaultMantis2Redmine(parameters=parameters)
+    bts2its.set_full_sync(full_sync)
+    return bts2its
+
+def sync(bts2its: DefaultMantis2Redmine, file_path, entry_ids: list) -> list:
+    """BTSデータを読み込み、指定したBTS IDに起票データがあるものとして状態を保存"""
+    bts2its.load_bts(file_path)
+    bts2its._pd_its_entry = pd.DataFrame({
+        '操作': ['更新'] * len(entry_ids),
+        '説明': [f'{BTS_BASE_URL}{bts_id}' for bts_id in entry_ids],
+    })
+    bts2its.save_sync_state()
+    return bts2its._pd_bts['Id'].astype(str).tolist()
+
+def test_only_changed_or_pending_rows_are_converted_again(tmp_path):
+    write_bts(tmp_path / 'bts.csv', ['A', 'B', 'C'])
+    # 初回は全件を変換し、起票データが作成されたBTS ID 2は次回も変換対象とする
+    assert sync(make_bts2its(tmp_path), tmp_path / 'bts.csv', ['2']) == ['1', '2', '3']
+    assert set(SyncState(tmp_path / 'sync_state.json').get_fingerprints()) == {'1', '3'}
+
+    # 変更のない行は除外され、前回のフィンガープリントは引き継がれる
+    assert sync(make_bts2its(tmp_path), tmp_path / 'bts.csv', []) == ['2']
+    assert set(SyncState(tmp_path / 'sync_state.json').get_fingerprints()) == {'1', '2', '3'}
+
+    write_bts(tmp_path / 'bts.csv', ['A', 'B', 'C changed'])
+    assert sync(make_bts2its(tmp_path), tmp_path / 'bts.csv', []) == ['3']
+    assert set(SyncState(tmp_path / 'sync_state.json').get_fingerprints()) == {'1', '2', '3'}
+
+def test_full_sync_flag_converts_every_row(tmp_path):
+    write_bts(tmp_path / 'bts.csv', ['A', 'B', 'C'])
+    sync(make_bts2its(tmp_path), tmp_path / 'bts.csv', [])
+    assert sync(make_bts2its(tmp_path), tmp_path / 'bts.csv', []) == []
+    assert sync(make_bts2its(tmp_path, full_sync=True), tmp_path / 'bts.csv', []) == ['1', '2', '3']
+
+def test_state_is_saved_only_after_every_entry_is_registered(config_data, fake_accessor, entry_adaptor):
+    failed = entry_adaptor(fake_accessor(fail_titles={'B'}))
+    with pytest.raises(RuntimeError):
+        failed.entry_its()
+    assert failed._bts2its.saved_states == 0
+
+    completed = entry_adaptor(fake_accessor())
+    completed.entry_its()
+    assert completed._bts2its.saved_states == 1
+
+class FullSyncRecordingBts2Its(DefaultMantis2Redmine):
+    """全件同期フラグの設定を記録し、読み込み・変換を行わない変換オブジェクト"""
+    def __init__(self) -> None:
+        super().__init__(parameters=Mantis2RedmineParameters(project_name='project', bts_prefix='', bts_base_url=BTS_BASE_URL, date_range=-1))
+        self.full_syncs = []
+
+    def set_full_sync(self, full_sync: bool) -> None:
+        self.full_syncs.append(full_sync)
+
+    def load_bts(self, file_path) -> None:
+        pass
+
+    def load_its(self, file_path) -> None:
+        pass
+
+@pytest.mark.parametrize('full_sync', [True, False])
+def test_full_sync_is_set_before_the_baseline_convert(config_data, tmp_path, full_sync):
+    (tmp_path / 'bts.csv').write_text('Id\n', encoding='utf-8')
+    (tmp_path / 'its.csv').write_text('#\n', encoding='utf-8')
+    adaptor = BaseConverterAdaptor('project')
+    adaptor._bts2its = FullSyncRecordingBts2Its()
+    adaptor.set_full_sync(full_sync)
+    adaptor.convert(tmp_path / 'bts.csv', tmp_path / 'its.csv')
+    adaptor.convert(tmp_path / 'bts.csv', tmp_path / 'its.csv')
+    assert adaptor._bts2its.full_syncs == [full_sync, full_sync]
+
+def test_adaptor_without_incremental_sync_ignores_full_sync(one_pass_converter, capsys):
+    one_pass_converter.set_full_sync(False)
+    assert capsys.readouterr().out == ''
+    one_pass_converter.set_full_sync(True)
+    assert 'OnePassConverter does not support incremental sync' in capsys.readouterr().out
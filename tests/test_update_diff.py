@@ -0,0 +1,74 @@
+from bts2its.redmine_accessor import DefaultRedmineAccessor
+import pytest
+
+CURRENT = {
+    'id': 10,
+    'subject': 'C',
+    'status': {'id': 1, 'name': '終了'},
+    'description': 'bts-3',
+    'estimated_hours': 2.0,
+    'done_ratio': 0,
+    'start_date': '2024-01-05',
+}
+
+@pytest.fixture
+def accessor():
+    return DefaultRedmineAccessor('project', 'http://redmine.example', 'key')
+
+def test_unchanged_payload_returns_none(accessor):
+    issue_data = {'#': '10', 'ステータス': '終了', '題名': 'C', '予定工数': '2', '進捗率': '0', '開始日': '2024/01/05', '期日': ''}
+    assert accessor.diff_issue_data(CURRENT, issue_data) is None
+
+def test_only_changed_fields_are_returned(accessor):
+    issue_data = {'#': '10', 'ステータス': '新規', '題名': 'C', '説明': 'bts-3 updated', '予定工数': '2.0'}
+    assert accessor.diff_issue_data(CURRENT, issue_data) == {'ステータス': '新規', '説明': 'bts-3 updated', '#': '10'}
+
+@pytest.mark.parametrize('key, value', [
+    # 未設定と0は異なる値として扱う
+    ('作業時間', '0'),
+    # 空の値でも現在値がある場合は変更として扱う
+    ('説明', ''),
+    # 前後の空白の違いは表記の違いとしない
+    ('題名', 'C '),
+    ('開始日', '2024-01-06'),
+])
+def test_non_equivalent_values_are_changes(accessor, key, value):
+    assert accessor.diff_issue_data(CURRENT, {'#': '10', key: value}) == {key: value, '#': '10'}
+
+class DiffRecordingAccessor(DefaultRedmineAccessor):
+    """チケットの現在値を返し、更新のペイロードを記録するITSアクセスオブジェクト"""
+    def __init__(self) -> None:
+        super().__init__('project', 'http://redmine.example', 'key')
+        self.updated = []
+
+    def load_project(self) -> bool:
+        return True
+
+    def load_issue(self, issue_id):
+        issues = {
+            '10': {'id': 10, 'subject': 'C', 'status': {'name': '新規'}, 'description': 'bts-3'},
+            '12': {'id': 12, 'subject': 'E', 'status': {'name': '新規'}, 'description': 'bts-5'},
+        }
+        return issues[str(issue_id)]
+
+    def create_issue(self, issue_data):
+        return None
+
+    def update_issue(self, issue, issue_data):
+        self.updated.append(dict(issue_data))
+        return True
+
+def test_entry_sends_only_changed_fields(config_data, entry_adaptor, capsys):
+    adaptor = entry_adaptor(DiffRecordingAccessor())
+    adaptor.entry_its()
+    # #10はステータスのみ変更、#12は変更なしのため更新しない
+    assert adaptor._its_accessor.updated == [{'ステータス': '終了', '#': '10'}]
+    # ペイロードテンプレートの15項目（IDを除く）のうち、#10は14項目、#12は15項目を省略
+    assert 'ITS update diff: 1/2 updates skipped as unchanged, 29 unchanged fields omitted (1 writes saved)' in capsys.readouterr().out
+
+def test_skip_unchanged_can_be_disabled(config_data, entry_adaptor):
+    config_data['entry_settings']['skip_unchanged'] = False
+    adaptor = entry_adaptor(DiffRecordingAccessor())
+    adaptor.entry_its()
+    assert [issue_data['#'] for issue_data in adaptor._its_accessor.updated] == ['10', '12']
+    assert adaptor._its_accessor.updated[0]['題名'] == 'C'